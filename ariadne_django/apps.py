@@ -1,7 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.utils.module_loading import import_string
 
 
 class AriadneDjangoConfig(AppConfig):
     name = "ariadne_django"
     label = "ariadne_django"
     verbose_name = "ariadne_django"
+
+    def ready(self):
+        # Lazy schemas listed in settings are built on startup, instead of on the first request.
+        for schema_path in getattr(settings, "ARIADNE_DJANGO_SCHEMAS", ()):
+            import_string(schema_path).get()
@@ -1,2 +1,3 @@
 from .login_is_required import login_required
+from .object_permission_is_required import object_permission_required
 from .permission_is_required import permission_required
@@ -1,8 +1,27 @@
+from functools import wraps
+
 from django.core.exceptions import PermissionDenied
 
+from ariadne_django.compat import iscoroutinefunction
+
+from ..permissions import get_permission_cache
+
 
 def login_required():
     def wrapped_decorator(func):
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapped(cls, info, *args, **kwargs):
+                # User is loaded without blocking the event loop, once per request.
+                user = await get_permission_cache(info).aget_user()
+                if not user.is_authenticated:
+                    raise PermissionDenied()
+                return await func(cls, info, *args, **kwargs)
+
+            return async_wrapped
+
+        @wraps(func)
         def wrapped(cls, info, *args, **kwargs):
             user = info.context["request"].user
             if not user.is_authenticated:
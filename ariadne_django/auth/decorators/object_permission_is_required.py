@@ -0,0 +1,80 @@
+from functools import wraps
+
+from django.core.exceptions import PermissionDenied
+from django.db.models import Model, QuerySet
+
+from ariadne_django.compat import iscoroutinefunction
+from ariadne_django.resolvers import aevaluate
+
+from ..permissions import get_permission_cache, normalize_permissions
+
+
+def is_object_list(result) -> bool:
+    return isinstance(result, (list, tuple, QuerySet))
+
+
+def filter_allowed_objects(result, objects, allowed):
+    # Objects the user has no permissions for are omitted from lists.
+    allowed_objects = [obj for obj, is_allowed in zip(objects, allowed) if is_allowed]
+    if not isinstance(result, QuerySet):
+        return allowed_objects
+    if len(allowed_objects) == len(objects):
+        queryset = result.all()
+    elif result.query.can_filter() and all(isinstance(obj, Model) for obj in allowed_objects):
+        queryset = result.filter(pk__in=[obj.pk for obj in allowed_objects])
+    else:
+        # Sliced QuerySets and QuerySets of values can't be filtered by primary keys.
+        return allowed_objects
+    # QuerySet is kept for decorators and middleware wrapping the resolver, with its results already loaded.
+    queryset._result_cache = allowed_objects  # pylint: disable=protected-access
+    queryset._prefetch_done = True  # pylint: disable=protected-access
+    return queryset
+
+
+def check_object_permissions(info, perms, result, accept_global_perms):
+    if result is None:
+        return None
+    cache = get_permission_cache(info)
+    if is_object_list(result):
+        objects = list(result)
+        allowed = cache.has_object_perms(perms, objects, accept_global_perms)
+        return filter_allowed_objects(result, objects, allowed)
+    if not cache.has_object_perms(perms, [result], accept_global_perms)[0]:
+        raise PermissionDenied()
+    return result
+
+
+async def acheck_object_permissions(info, perms, result, accept_global_perms):
+    if result is None:
+        return None
+    cache = get_permission_cache(info)
+    if is_object_list(result):
+        objects = await aevaluate(result) if isinstance(result, QuerySet) else list(result)
+        allowed = await cache.ahas_object_perms(perms, objects, accept_global_perms)
+        return filter_allowed_objects(result, objects, allowed)
+    if not (await cache.ahas_object_perms(perms, [result], accept_global_perms))[0]:
+        raise PermissionDenied()
+    return result
+
+
+def object_permission_required(required_permission, accept_global_perms=True):
+    perms = normalize_permissions(required_permission)
+
+    def wrapped_decorator(func):
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapped(cls, info, *args, **kwargs):
+                result = await func(cls, info, *args, **kwargs)
+                return await acheck_object_permissions(info, perms, result, accept_global_perms)
+
+            return async_wrapped
+
+        @wraps(func)
+        def wrapped(cls, info, *args, **kwargs):
+            result = func(cls, info, *args, **kwargs)
+            return check_object_permissions(info, perms, result, accept_global_perms)
+
+        return wrapped
+
+    return wrapped_decorator
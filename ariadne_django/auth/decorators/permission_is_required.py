@@ -1,12 +1,30 @@
+from functools import wraps
+
 from django.core.exceptions import PermissionDenied
 
+from ariadne_django.compat import iscoroutinefunction
+
+from ..permissions import get_permission_cache, normalize_permissions
+
 
 def permission_required(required_permission):
+    # Permissions are normalized once, and checked once per request.
+    perms = normalize_permissions(required_permission)
+
     def wrapped_decorator(func):
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapped(cls, info, *args, **kwargs):
+                if not await get_permission_cache(info).ahas_perms(perms):
+                    raise PermissionDenied()
+                return await func(cls, info, *args, **kwargs)
+
+            return async_wrapped
+
+        @wraps(func)
         def wrapped(cls, info, *args, **kwargs):
-            perms = (required_permission,) if isinstance(required_permission, str) else required_permission
-            user = info.context["request"].user
-            if not user.has_perms(perms):
+            if not get_permission_cache(info).has_perms(perms):
                 raise PermissionDenied()
             return func(cls, info, *args, **kwargs)
 
@@ -0,0 +1,149 @@
+import asyncio
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from django.db.models import Model
+from django.http import HttpRequest
+
+from asgiref.sync import sync_to_async
+from graphql import GraphQLResolveInfo
+
+
+PERMISSION_CACHE_KEY = "permission_cache"
+
+Permissions = Tuple[str, ...]
+
+
+def normalize_permissions(required_permission: Union[str, Iterable[str]]) -> Permissions:
+    if isinstance(required_permission, str):
+        return (required_permission,)
+    return tuple(required_permission)
+
+
+def get_object_key(obj: Any) -> Optional[Hashable]:
+    # Only saved model instances are cached, as other objects may be unhashable or mutable.
+    if isinstance(obj, Model) and obj.pk is not None:
+        return (type(obj), obj.pk)
+    return None
+
+
+def get_request_user(request: HttpRequest) -> Any:
+    user = request.user
+    # User set by AuthenticationMiddleware is lazy, and loaded from the session on first attribute access.
+    user.is_authenticated  # pylint: disable=pointless-statement
+    return user
+
+
+async def aget_request_user(request: HttpRequest) -> Any:
+    """
+    Returns the request's user, loaded with ``request.auser()`` (Django 5.0+) or in a thread.
+    """
+    if hasattr(request, "auser"):
+        return await request.auser()
+    return await sync_to_async(get_request_user)(request)
+
+
+def check_object_perms(user: Any, perms: Permissions, objects: Sequence[Any]) -> List[bool]:
+    return [user.has_perms(perms, obj) for obj in objects]
+
+
+class PermissionCache:
+    """
+    Request-scoped cache of the user and results of their permission checks, stored in the context
+    by permission decorators, so every permission is checked once per request.
+
+    Asynchronous methods share pending checks, so concurrently resolved fields wait for the same check.
+    """
+
+    def __init__(self, request: HttpRequest):
+        self.request = request
+        self.user = request.user
+        self._perms: Dict[Permissions, bool] = {}
+        self._object_perms: Dict[Tuple[Permissions, Hashable], bool] = {}
+        self._user_task: Optional[asyncio.Future] = None
+        self._perms_tasks: Dict[Permissions, asyncio.Future] = {}
+
+    def has_perms(self, perms: Permissions) -> bool:
+        if perms not in self._perms:
+            self._perms[perms] = self.user.has_perms(perms)
+        return self._perms[perms]
+
+    def has_object_perms(
+        self, perms: Permissions, objects: Sequence[Any], accept_global_perms: bool = True
+    ) -> List[bool]:
+        """
+        Checks object-level permissions for every object, skipping the checks if the user has these permissions
+        globally (and ``accept_global_perms`` is True). Results for model instances are cached by their
+        primary key, so every distinct object is checked once per request.
+        """
+        if accept_global_perms and self.has_perms(perms):
+            return [True] * len(objects)
+        return [self.has_object_perm(perms, obj) for obj in objects]
+
+    def has_object_perm(self, perms: Permissions, obj: Any) -> bool:
+        key = get_object_key(obj)
+        if key is None:
+            return self.user.has_perms(perms, obj)
+        if (perms, key) not in self._object_perms:
+            self._object_perms[(perms, key)] = self.user.has_perms(perms, obj)
+        return self._object_perms[(perms, key)]
+
+    async def aget_user(self) -> Any:
+        if self._user_task is None:
+            self._user_task = asyncio.ensure_future(aget_request_user(self.request))
+        return await self._user_task
+
+    async def ahas_perms(self, perms: Permissions) -> bool:
+        if perms in self._perms:
+            return self._perms[perms]
+        if perms not in self._perms_tasks:
+            self._perms_tasks[perms] = asyncio.ensure_future(self._acheck_perms(perms))
+        return await self._perms_tasks[perms]
+
+    async def _acheck_perms(self, perms: Permissions) -> bool:
+        user = await self.aget_user()
+        self._perms[perms] = await sync_to_async(user.has_perms)(perms)
+        return self._perms[perms]
+
+    async def ahas_object_perms(
+        self, perms: Permissions, objects: Sequence[Any], accept_global_perms: bool = True
+    ) -> List[bool]:
+        """
+        Asynchronous counterpart of ``has_object_perms``, checking permissions for all objects without
+        cached results in a single call in a thread.
+        """
+        if accept_global_perms and await self.ahas_perms(perms):
+            return [True] * len(objects)
+
+        keys = [get_object_key(obj) for obj in objects]
+        # Objects without a key are never cached, and are identified by their id in this call.
+        unchecked: Dict[Hashable, Any] = {}
+        for key, obj in zip(keys, objects):
+            if key is None:
+                unchecked[id(obj)] = obj
+            elif (perms, key) not in self._object_perms:
+                unchecked.setdefault(key, obj)
+        results: Dict[Hashable, bool] = {}
+        if unchecked:
+            user = await self.aget_user()
+            results = dict(
+                zip(unchecked, await sync_to_async(check_object_perms)(user, perms, list(unchecked.values())))
+            )
+        for key, result in results.items():
+            if not isinstance(key, int):
+                self._object_perms[(perms, key)] = result
+        return [
+            results[id(obj)] if key is None else self._object_perms[(perms, key)] for key, obj in zip(keys, objects)
+        ]
+
+
+def get_permission_cache(info: GraphQLResolveInfo) -> PermissionCache:
+    """
+    Returns permission cache of the request's user, creating it on first use.
+    """
+    context = info.context
+    request = context["request"]
+    cache = context.get(PERMISSION_CACHE_KEY)
+    # User may change during the request, eg. when logged in by a mutation.
+    if cache is None or cache.user is not request.user:
+        cache = context[PERMISSION_CACHE_KEY] = PermissionCache(request)
+    return cache
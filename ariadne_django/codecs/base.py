@@ -0,0 +1,40 @@
+import json
+from typing import Any, Iterator, Union
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class JSONCodec:
+    """
+    Parses request bodies and serializes GraphQL results to response bytes.
+
+    Default implementation uses the standard library json module and DjangoJSONEncoder,
+    producing the same output as JsonResponse. Subclasses can plug in faster libraries.
+    """
+
+    content_type = "application/json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, cls=DjangoJSONEncoder).encode("utf-8")
+
+    def iterencode(self, value: Any, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Serializes value incrementally, yielding chunks of roughly chunk_size bytes,
+        so serialized result is never held in memory as a whole.
+        """
+        buffer = bytearray()
+        for part in self._iterencode(value):
+            buffer += part
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def _iterencode(self, value: Any) -> Iterator[bytes]:
+        # Produces the same output as dumps. Codecs of faster libraries can override it.
+        for chunk in DjangoJSONEncoder().iterencode(value):
+            yield chunk.encode("utf-8")
@@ -0,0 +1,54 @@
+from typing import Any, Iterator, Union
+
+import django.core.exceptions
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .base import JSONCodec
+
+
+try:
+    import orjson
+except ImportError as error:
+    raise django.core.exceptions.ImproperlyConfigured("Cannot use this codec without orjson.") from error
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec using orjson, which writes bytes directly.
+
+    Datetime, date and time values are passed through to DjangoJSONEncoder (as are Decimal and other types
+    orjson doesn't support natively), so they are serialized exactly as by the default codec.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def __init__(self):
+        self.encoder = DjangoJSONEncoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=self.encoder.default, option=self.options)
+
+    def _iterencode(self, value: Any) -> Iterator[bytes]:
+        # orjson can't serialize incrementally, so objects are serialized field by field, and lists item by item,
+        # each item at once.
+        if isinstance(value, dict) and value:
+            separator = b"{"
+            for key, item in value.items():
+                yield separator
+                yield self.dumps(key if isinstance(key, str) else str(key))
+                yield b":"
+                yield from self._iterencode(item)
+                separator = b","
+            yield b"}"
+        elif isinstance(value, (list, tuple)) and value:
+            separator = b"["
+            for item in value:
+                yield separator
+                yield self.dumps(item)
+                separator = b","
+            yield b"]"
+        else:
+            yield self.dumps(value)
@@ -0,0 +1,25 @@
+"""
+Counterparts of asyncio and asgiref functions missing on Python 3.6 and older asgiref versions.
+"""
+import asyncio
+import sys
+
+
+try:
+    from asgiref.sync import iscoroutinefunction  # pylint: disable=unused-import
+except ImportError:  # asgiref < 3.6, the last versions supporting Python 3.6
+    from asyncio import iscoroutinefunction  # type: ignore # noqa: F401 # pylint: disable=unused-import
+
+
+if sys.version_info >= (3, 7):
+    get_running_loop = asyncio.get_running_loop
+    current_task = asyncio.current_task
+else:
+
+    def get_running_loop() -> asyncio.AbstractEventLoop:
+        loop = asyncio._get_running_loop()  # pylint: disable=no-member,protected-access
+        if loop is None:
+            raise RuntimeError("no running event loop")
+        return loop
+
+    current_task = asyncio.Task.current_task  # pylint: disable=no-member
@@ -0,0 +1,4 @@
+# flake8: noqa: E501
+from .loader import AsyncDataLoader, DataLoader
+from .orm import aload_by_field, aload_related, load_by_field, load_related
+from .registry import LoaderRegistry
@@ -0,0 +1,174 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from ariadne_django.compat import get_running_loop
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFn = Callable[[List[K]], Sequence[Any]]
+AsyncBatchLoadFn = Callable[[List[K]], Awaitable[Sequence[Any]]]
+
+
+def get_batches(keys: List[Any], max_batch_size: Optional[int]) -> Iterable[List[Any]]:
+    if not keys:
+        return
+    if not max_batch_size:
+        yield keys
+        return
+    for i in range(0, len(keys), max_batch_size):
+        yield keys[i : i + max_batch_size]
+
+
+def check_batch_result(keys: List[Any], values: Sequence[Any]):
+    if len(values) != len(keys):
+        raise ValueError(
+            "Batch load function must return a sequence of the same length as keys ({} != {})".format(
+                len(values), len(keys)
+            )
+        )
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Loads values by keys with a batch load function, caching loaded values for the lifetime of the loader.
+
+    Synchronous executor resolves fields one by one, so values requested with ``load`` are loaded right away,
+    and keys are not batched. Use ``load_many`` (or ``prime`` from a parent resolver) to load values for many
+    keys in one batch.
+    Exceptions returned by the batch load function in place of values are raised for their keys.
+    """
+
+    def __init__(self, batch_load_fn: BatchLoadFn, *, cache: bool = True, max_batch_size: Optional[int] = None):
+        self.batch_load_fn = batch_load_fn
+        self.cache = cache
+        self.max_batch_size = max_batch_size
+        self._values: Dict[K, Any] = {}
+
+    def load(self, key: K) -> V:
+        return self.load_many([key])[0]
+
+    def load_many(self, keys: Iterable[K]) -> List[V]:
+        keys = list(keys)
+        values = self._values if self.cache else {}
+        missing_keys = list(dict.fromkeys(key for key in keys if key not in values))
+        for batch in get_batches(missing_keys, self.max_batch_size):
+            batch_values = self.batch_load_fn(batch)
+            check_batch_result(batch, batch_values)
+            values.update(zip(batch, batch_values))
+
+        result = [values[key] for key in keys]
+        for value in result:
+            if isinstance(value, Exception):
+                raise value
+        return result
+
+    def prime(self, key: K, value: V):
+        self._values.setdefault(key, value)
+
+    def clear(self, key: K):
+        self._values.pop(key, None)
+
+    def clear_all(self):
+        self._values.clear()
+
+
+class AsyncDataLoader(Generic[K, V]):
+    """
+    Asynchronous counterpart of DataLoader.
+
+    Keys requested with ``load`` during the same event loop iteration (eg. by resolvers of fields
+    of all items of a list) are collected and loaded with a single call to the batch load function.
+    """
+
+    def __init__(self, batch_load_fn: AsyncBatchLoadFn, *, cache: bool = True, max_batch_size: Optional[int] = None):
+        self.batch_load_fn = batch_load_fn
+        self.cache = cache
+        self.max_batch_size = max_batch_size
+        self._futures: Dict[K, "asyncio.Future[V]"] = {}
+        self._queue: List[Tuple[K, "asyncio.Future[V]"]] = []
+        self._dispatch_tasks: Set["asyncio.Task[None]"] = set()
+
+    def load(self, key: K) -> Awaitable[V]:
+        try:
+            loop = get_running_loop()
+        except RuntimeError:
+            # Called by a synchronous resolver run in a thread (eg. by GraphQLAsyncView with
+            # ``run_sync_resolvers_in_threads``), so the key is queued when the result is awaited in the event loop.
+            return self._load_in_event_loop(key)
+
+        if self.cache and key in self._futures:
+            return self._futures[key]
+
+        future = loop.create_future()
+        if self.cache:
+            self._futures[key] = future
+        self._queue.append((key, future))
+        if len(self._queue) == 1:
+            loop.call_soon(self._schedule_dispatch)
+        return future
+
+    async def _load_in_event_loop(self, key: K) -> V:
+        return await self.load(key)
+
+    async def load_many(self, keys: Iterable[K]) -> List[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _schedule_dispatch(self):
+        # Event loop only keeps weak references to tasks, so they are kept until done.
+        task = asyncio.ensure_future(self._dispatch())
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self):
+        queue, self._queue = self._queue, []
+        for batch in get_batches(queue, self.max_batch_size):
+            await self._dispatch_batch(batch)
+
+    async def _dispatch_batch(self, batch: List[Tuple[K, "asyncio.Future[V]"]]):
+        keys = [key for key, _ in batch]
+        try:
+            values = await self.batch_load_fn(keys)
+            check_batch_result(keys, values)
+        except Exception as error:  # pylint: disable=broad-except
+            for key, future in batch:
+                self._futures.pop(key, None)
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), value in zip(batch, values):
+            # Futures are cancelled together with resolvers awaiting them, eg. when another field failed.
+            if future.done():
+                continue
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+    def prime(self, key: K, value: V):
+        if key not in self._futures:
+            future = get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: K):
+        self._futures.pop(key, None)
+
+    def clear_all(self):
+        self._futures.clear()
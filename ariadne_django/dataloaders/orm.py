@@ -0,0 +1,69 @@
+from collections import defaultdict
+from typing import Any, List, Optional, Sequence, Type
+
+from django.db.models import Model
+
+from asgiref.sync import sync_to_async
+
+from ariadne_django.resolvers.querysets import HAS_ASYNC_QUERYSETS
+
+
+def get_python_keys(model: Type[Model], field_name: str, keys: List[Any]) -> List[Any]:
+    opts = model._meta  # pylint: disable=protected-access
+    field = opts.pk if field_name == "pk" else opts.get_field(field_name)
+    return [field.to_python(key) for key in keys]
+
+
+def get_related_python_keys(model: Type[Model], field_name: str, keys: List[Any]) -> List[Any]:
+    target_field = model._meta.get_field(field_name).target_field  # type: ignore  # pylint: disable=protected-access
+    return [target_field.to_python(key) for key in keys]
+
+
+def load_by_field(model: Type[Model], field_name: str, keys: List[Any]) -> Sequence[Optional[Model]]:
+    """
+    Loads model instances by values of the unique field with a single ``in_bulk`` query.
+    Keys without an instance are loaded as None.
+    """
+    python_keys = get_python_keys(model, field_name, keys)
+    instances = model._default_manager.in_bulk(python_keys, field_name=field_name)  # pylint: disable=protected-access
+    return [instances.get(key) for key in python_keys]
+
+
+def load_related(model: Type[Model], field_name: str, keys: List[Any]) -> Sequence[List[Model]]:
+    """
+    Loads lists of model instances by values of their foreign key field with a single query.
+    """
+    python_keys = get_related_python_keys(model, field_name, keys)
+    attname = model._meta.get_field(field_name).attname  # type: ignore  # pylint: disable=protected-access
+    instances = defaultdict(list)
+    manager = model._default_manager  # pylint: disable=protected-access
+    for instance in manager.filter(**{"{}__in".format(field_name): python_keys}):
+        instances[getattr(instance, attname)].append(instance)
+    return [instances.get(key, []) for key in python_keys]
+
+
+async def aload_by_field(model: Type[Model], field_name: str, keys: List[Any]) -> Sequence[Optional[Model]]:
+    """
+    Asynchronous counterpart of ``load_by_field``, using the asynchronous QuerySet API where available.
+    """
+    if not HAS_ASYNC_QUERYSETS:
+        return await sync_to_async(load_by_field)(model, field_name, keys)
+    python_keys = get_python_keys(model, field_name, keys)
+    manager = model._default_manager  # pylint: disable=protected-access
+    instances = await manager.ain_bulk(python_keys, field_name=field_name)
+    return [instances.get(key) for key in python_keys]
+
+
+async def aload_related(model: Type[Model], field_name: str, keys: List[Any]) -> Sequence[List[Model]]:
+    """
+    Asynchronous counterpart of ``load_related``, using the asynchronous QuerySet API where available.
+    """
+    if not HAS_ASYNC_QUERYSETS:
+        return await sync_to_async(load_related)(model, field_name, keys)
+    python_keys = get_related_python_keys(model, field_name, keys)
+    attname = model._meta.get_field(field_name).attname  # type: ignore  # pylint: disable=protected-access
+    instances = defaultdict(list)
+    manager = model._default_manager  # pylint: disable=protected-access
+    async for instance in manager.filter(**{"{}__in".format(field_name): python_keys}):
+        instances[getattr(instance, attname)].append(instance)
+    return [instances.get(key, []) for key in python_keys]
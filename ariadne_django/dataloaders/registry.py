@@ -0,0 +1,52 @@
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Type, Union
+
+from django.db.models import Model
+
+from asgiref.sync import sync_to_async
+
+from ariadne_django.compat import iscoroutinefunction
+
+from .loader import AsyncDataLoader, DataLoader
+from .orm import aload_by_field, aload_related, load_by_field, load_related
+
+
+Loader = Union[DataLoader, AsyncDataLoader]
+
+
+class LoaderRegistry:
+    """
+    Request-scoped registry of data loaders, available in the default context value under the ``loaders`` key.
+
+    Loaders are created on first use and live until the end of the request. Registry created for
+    GraphQLAsyncView returns asynchronous loaders, running synchronous batch load functions in a thread,
+    and loading model instances with the asynchronous QuerySet API.
+    """
+
+    def __init__(self, is_async: bool = False):
+        self.is_async = is_async
+        self._loaders: Dict[Hashable, Loader] = {}
+
+    def get(self, key: Hashable, batch_load_fn: Callable, **options: Any) -> Loader:
+        if key not in self._loaders:
+            if self.is_async:
+                if not iscoroutinefunction(batch_load_fn):
+                    batch_load_fn = sync_to_async(batch_load_fn)
+                self._loaders[key] = AsyncDataLoader(batch_load_fn, **options)
+            else:
+                self._loaders[key] = DataLoader(batch_load_fn, **options)
+        return self._loaders[key]
+
+    def model(self, model: Type[Model], field_name: str = "pk") -> Loader:
+        """
+        Returns loader of model instances by primary key, or other unique field.
+        """
+        load_fn = aload_by_field if self.is_async else load_by_field
+        return self.get(("model", model, field_name), partial(load_fn, model, field_name))
+
+    def related(self, model: Type[Model], field_name: str) -> Loader:
+        """
+        Returns loader of lists of model instances by value of their foreign key.
+        """
+        load_fn = aload_related if self.is_async else load_related
+        return self.get(("related", model, field_name), partial(load_fn, model, field_name))
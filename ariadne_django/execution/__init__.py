@@ -0,0 +1,30 @@
+# flake8: noqa: E501
+from .document_cache import CachedDocument, DocumentCache, DocumentCacheInfo, get_query_hash
+from .graphql import (
+    extension_phase,
+    graphql,
+    graphql_sync,
+    parse_and_validate_query,
+    subscribe,
+    validate_operation_type,
+)
+from .introspection import (
+    IntrospectionCache,
+    get_introspection_cache_key,
+    is_introspection_operation,
+)
+from .incremental import IncrementalDeliveryPlan, defer_directives, graphql_incremental
+from .persisted_queries import (
+    InvalidPersistedQuery,
+    PersistedQueryNotFound,
+    PersistedQueryNotSupported,
+    PersistedQueryStore,
+    resolve_persisted_query,
+)
+from .response_cache import CachedResponse, CachedResult, ResponseCache, get_user_scope
+from .threads import (
+    call_in_thread_pool,
+    get_resolver_thread_pool,
+    run_in_thread_pool,
+    thread_pool_middleware,
+)
@@ -0,0 +1,97 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, List, NamedTuple, Optional
+
+from graphql import DocumentNode, GraphQLError
+
+
+DocumentCacheInfo = NamedTuple(
+    "DocumentCacheInfo",
+    [("hits", int), ("misses", int), ("evictions", int), ("maxsize", int), ("currsize", int)],
+)
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class CachedDocument:
+    """
+    Parsed query document together with results of its validation.
+
+    Validation results are stored per validation key, as same document may be validated
+    against different schemas, validation rules or with introspection enabled or disabled.
+    Only the most recently used validation results are kept, as callable ``validation_rules`` may
+    return different rules for every request.
+    """
+
+    __slots__ = ("document", "validation_errors", "_lock")
+
+    max_validation_results = 32
+
+    def __init__(self, document: DocumentNode):
+        self.document = document
+        self.validation_errors: "OrderedDict[Hashable, List[GraphQLError]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get_validation_errors(self, key: Hashable) -> Optional[List[GraphQLError]]:
+        with self._lock:
+            validation_errors = self.validation_errors.get(key)
+            if validation_errors is not None:
+                self.validation_errors.move_to_end(key)
+            return validation_errors
+
+    def set_validation_errors(self, key: Hashable, validation_errors: List[GraphQLError]):
+        with self._lock:
+            self.validation_errors[key] = validation_errors
+            while len(self.validation_errors) > self.max_validation_results:
+                self.validation_errors.popitem(last=False)
+
+
+class DocumentCache:
+    """
+    Bounded LRU cache of parsed and validated GraphQL documents, keyed by sha256 hash of the query text.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._documents: "OrderedDict[str, CachedDocument]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, query: str) -> Optional[CachedDocument]:
+        key = get_query_hash(query)
+        with self._lock:
+            cached_document = self._documents.get(key)
+            if cached_document is None:
+                self.misses += 1
+                return None
+            self._documents.move_to_end(key)
+            self.hits += 1
+            return cached_document
+
+    def set(self, query: str, document: DocumentNode) -> CachedDocument:
+        key = get_query_hash(query)
+        cached_document = CachedDocument(document)
+        with self._lock:
+            self._documents[key] = cached_document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+                self.evictions += 1
+        return cached_document
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> DocumentCacheInfo:
+        with self._lock:
+            return DocumentCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._documents))
+
+    def __len__(self):
+        return len(self._documents)
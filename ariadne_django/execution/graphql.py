@@ -0,0 +1,428 @@
+from asyncio import ensure_future
+from contextlib import contextmanager
+from inspect import isawaitable
+from typing import Any, AsyncGenerator, Awaitable, Collection, Iterator, List, Optional, Tuple, Type, cast
+
+from ariadne.extensions import ExtensionManager
+from ariadne.format_error import format_error
+from ariadne.graphql import (
+    add_extensions_to_response,
+    handle_graphql_errors,
+    handle_query_result,
+    parse_query,
+    validate_data,
+    validate_query,
+)
+from ariadne.logger import log_error
+from ariadne.types import ErrorFormatter, ExtensionList, GraphQLResult, RootValue, SubscriptionResult, ValidationRules
+
+from graphql import (
+    DocumentNode,
+    ExecutionContext,
+    ExecutionResult,
+    GraphQLError,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    OperationType,
+    create_source_event_stream,
+    execute,
+    execute_sync,
+    get_operation_ast,
+)
+from graphql.execution import MapAsyncIterator, MiddlewareManager
+from graphql.validation.rules import ASTValidationRule
+
+from .document_cache import DocumentCache
+from .persisted_queries import PersistedQueryStore, resolve_persisted_query
+from .response_cache import CachedResponse, CachedResult, ResponseCache
+
+
+@contextmanager
+def extension_phase(extension_manager: Optional[ExtensionManager], phase: str) -> Iterator[None]:
+    """
+    Notifies extensions implementing optional ``phase_started`` and ``phase_finished`` methods
+    about the ``parsing``, ``validation`` and ``execution`` phases of the request.
+    """
+    extensions = (
+        [ext for ext in extension_manager.extensions if hasattr(ext, "phase_started")] if extension_manager else []
+    )
+    for ext in extensions:
+        ext.phase_started(phase, extension_manager.context)  # type: ignore
+    try:
+        yield
+    finally:
+        for ext in reversed(extensions):
+            ext.phase_finished(phase, extension_manager.context)  # type: ignore
+
+
+def parse_and_validate_query(
+    schema: GraphQLSchema,
+    data: dict,
+    *,
+    context_value: Optional[Any] = None,
+    validation_rules: Optional[ValidationRules] = None,
+    introspection: bool = True,
+    document_cache: Optional[DocumentCache] = None,
+    extension_manager: Optional[ExtensionManager] = None,
+) -> Tuple[DocumentNode, List[GraphQLError]]:
+    query = data["query"]
+
+    with extension_phase(extension_manager, "parsing"):
+        cached_document = document_cache.get(query) if document_cache is not None else None
+        if cached_document is not None:
+            document = cached_document.document
+        else:
+            document = parse_query(query)
+            if document_cache is not None:
+                cached_document = document_cache.set(query, document)
+
+    if callable(validation_rules):
+        validation_rules = cast(
+            Optional[Collection[Type[ASTValidationRule]]],
+            validation_rules(context_value, document, data),
+        )
+
+    with extension_phase(extension_manager, "validation"):
+        validation_errors = None
+        if cached_document is not None:
+            validation_key = (id(schema), tuple(validation_rules or ()), introspection)
+            validation_errors = cached_document.get_validation_errors(validation_key)
+        if validation_errors is None:
+            validation_errors = validate_query(schema, document, validation_rules, enable_introspection=introspection)
+            if cached_document is not None:
+                cached_document.set_validation_errors(validation_key, validation_errors)
+        if not validation_errors:
+            validation_errors = validate_variables(schema, document, validation_rules, data)
+        return document, validation_errors
+
+
+def validate_variables(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    validation_rules: Optional[Collection[Type[ASTValidationRule]]],
+    data: dict,
+) -> List[GraphQLError]:
+    """
+    Runs the ``validate_variables`` class method of validation rules depending on values of variables
+    (eg. ``CostValidator``), in a separate pass after the document is validated, so results of validation
+    of the document are cached regardless of variables.
+    """
+    errors: List[GraphQLError] = []
+    for rule in validation_rules or ():
+        validate = getattr(rule, "validate_variables", None)
+        if validate is not None:
+            errors.extend(validate(schema, document, data.get("variables"), data.get("operationName")))
+    return errors
+
+
+def validate_operation_type(
+    operation: Optional[OperationDefinitionNode],
+    allowed_operation_types: Optional[Collection[OperationType]],
+):
+    if allowed_operation_types is None:
+        return
+    if operation is not None and operation.operation not in allowed_operation_types:
+        raise GraphQLError(
+            "{} operations are not allowed for this request.".format(operation.operation.value.capitalize())
+        )
+
+
+def handle_cached_result(
+    response_cache: ResponseCache, cached_response: CachedResponse, *, extension_manager: ExtensionManager
+) -> GraphQLResult:
+    response: dict = {}
+    add_extensions_to_response(extension_manager, response)
+    extensions = response.setdefault("extensions", {})
+    extensions["responseCache"] = {"hit": True}
+    return True, cast(dict, CachedResult(cached_response, extensions, response_cache.json_codec))
+
+
+def cache_query_result(
+    response_cache: ResponseCache, cache_key: str, operation: Optional[OperationDefinitionNode], response: dict
+) -> dict:
+    extensions = response.setdefault("extensions", {})
+    extensions["responseCache"] = {"hit": False}
+    if "errors" in response:
+        return response
+    # Only complete results are cached, without extensions specific to the request. Result is returned
+    # with its serialized data, which is then sent by views.
+    cached_response = response_cache.set(
+        cache_key, {"data": response["data"]}, cast(OperationDefinitionNode, operation)
+    )
+    return cast(dict, CachedResult(cached_response, extensions, response_cache.json_codec))
+
+
+async def graphql(
+    schema: GraphQLSchema,
+    data: Any,
+    *,
+    context_value: Optional[Any] = None,
+    root_value: Optional[RootValue] = None,
+    debug: bool = False,
+    introspection: bool = True,
+    logger: Optional[str] = None,
+    validation_rules: Optional[ValidationRules] = None,
+    error_formatter: ErrorFormatter = format_error,
+    middleware: Optional[MiddlewareManager] = None,
+    extensions: Optional[ExtensionList] = None,
+    document_cache: Optional[DocumentCache] = None,
+    persisted_queries: Optional[PersistedQueryStore] = None,
+    allowed_operation_types: Optional[Collection[OperationType]] = None,
+    response_cache: Optional[ResponseCache] = None,
+    response_cache_scope: str = "public",
+    **kwargs,
+) -> GraphQLResult:
+    """
+    Counterpart of ``ariadne.graphql`` that reuses parsed and validated documents from the document cache,
+    resolves Automatic Persisted Queries and serves results from the response cache.
+    """
+    extension_manager = ExtensionManager(extensions, context_value)
+
+    with extension_manager.request():
+        try:
+            data = resolve_persisted_query(data, persisted_queries)
+            validate_data(data)
+            document, validation_errors = parse_and_validate_query(
+                schema,
+                data,
+                context_value=context_value,
+                validation_rules=validation_rules,
+                introspection=introspection,
+                document_cache=document_cache,
+                extension_manager=extension_manager,
+            )
+            if validation_errors:
+                return handle_graphql_errors(
+                    validation_errors,
+                    logger=logger,
+                    error_formatter=error_formatter,
+                    debug=debug,
+                    extension_manager=extension_manager,
+                )
+            operation = get_operation_ast(document, data.get("operationName"))
+            validate_operation_type(operation, allowed_operation_types)
+
+            cache_key = None
+            if response_cache is not None:
+                cache_key = response_cache.get_cache_key(operation, data, response_cache_scope)
+                cached_response = response_cache.get(cache_key) if cache_key is not None else None
+                if cached_response is not None:
+                    return handle_cached_result(response_cache, cached_response, extension_manager=extension_manager)
+
+            if callable(root_value):
+                root_value = root_value(context_value, document)
+                if isawaitable(root_value):
+                    root_value = await root_value
+
+            with extension_phase(extension_manager, "execution"):
+                result = execute(
+                    schema,
+                    document,
+                    root_value=root_value,
+                    context_value=context_value,
+                    variable_values=data.get("variables"),
+                    operation_name=data.get("operationName"),
+                    execution_context_class=ExecutionContext,
+                    middleware=extension_manager.as_middleware_manager(middleware),
+                    **kwargs,
+                )
+
+                if isawaitable(result):
+                    result = await cast(Awaitable[ExecutionResult], result)
+        except GraphQLError as error:
+            return handle_graphql_errors(
+                [error],
+                logger=logger,
+                error_formatter=error_formatter,
+                debug=debug,
+                extension_manager=extension_manager,
+            )
+        success, response = handle_query_result(
+            result,
+            logger=logger,
+            error_formatter=error_formatter,
+            debug=debug,
+            extension_manager=extension_manager,
+        )
+        if cache_key is not None:
+            response = cache_query_result(cast(ResponseCache, response_cache), cache_key, operation, response)
+        return success, response
+
+
+def graphql_sync(
+    schema: GraphQLSchema,
+    data: Any,
+    *,
+    context_value: Optional[Any] = None,
+    root_value: Optional[RootValue] = None,
+    debug: bool = False,
+    introspection: bool = True,
+    logger: Optional[str] = None,
+    validation_rules: Optional[ValidationRules] = None,
+    error_formatter: ErrorFormatter = format_error,
+    middleware: Optional[MiddlewareManager] = None,
+    extensions: Optional[ExtensionList] = None,
+    document_cache: Optional[DocumentCache] = None,
+    persisted_queries: Optional[PersistedQueryStore] = None,
+    allowed_operation_types: Optional[Collection[OperationType]] = None,
+    response_cache: Optional[ResponseCache] = None,
+    response_cache_scope: str = "public",
+    **kwargs,
+) -> GraphQLResult:
+    """
+    Counterpart of ``ariadne.graphql_sync`` that reuses parsed and validated documents from the document cache,
+    resolves Automatic Persisted Queries and serves results from the response cache.
+    """
+    extension_manager = ExtensionManager(extensions, context_value)
+
+    with extension_manager.request():
+        try:
+            data = resolve_persisted_query(data, persisted_queries)
+            validate_data(data)
+            document, validation_errors = parse_and_validate_query(
+                schema,
+                data,
+                context_value=context_value,
+                validation_rules=validation_rules,
+                introspection=introspection,
+                document_cache=document_cache,
+                extension_manager=extension_manager,
+            )
+            if validation_errors:
+                return handle_graphql_errors(
+                    validation_errors,
+                    logger=logger,
+                    error_formatter=error_formatter,
+                    debug=debug,
+                    extension_manager=extension_manager,
+                )
+            operation = get_operation_ast(document, data.get("operationName"))
+            validate_operation_type(operation, allowed_operation_types)
+
+            cache_key = None
+            if response_cache is not None:
+                cache_key = response_cache.get_cache_key(operation, data, response_cache_scope)
+                cached_response = response_cache.get(cache_key) if cache_key is not None else None
+                if cached_response is not None:
+                    return handle_cached_result(response_cache, cached_response, extension_manager=extension_manager)
+
+            if callable(root_value):
+                root_value = root_value(context_value, document)
+                if isawaitable(root_value):
+                    ensure_future(root_value).cancel()
+                    raise RuntimeError("Root value resolver can't be asynchronous in synchronous query executor.")
+
+            with extension_phase(extension_manager, "execution"):
+                result = execute_sync(
+                    schema,
+                    document,
+                    root_value=root_value,
+                    context_value=context_value,
+                    variable_values=data.get("variables"),
+                    operation_name=data.get("operationName"),
+                    execution_context_class=ExecutionContext,
+                    middleware=extension_manager.as_middleware_manager(middleware),
+                    **kwargs,
+                )
+        except GraphQLError as error:
+            return handle_graphql_errors(
+                [error],
+                logger=logger,
+                error_formatter=error_formatter,
+                debug=debug,
+                extension_manager=extension_manager,
+            )
+        success, response = handle_query_result(
+            result,
+            logger=logger,
+            error_formatter=error_formatter,
+            debug=debug,
+            extension_manager=extension_manager,
+        )
+        if cache_key is not None:
+            response = cache_query_result(cast(ResponseCache, response_cache), cache_key, operation, response)
+        return success, response
+
+
+async def subscribe(
+    schema: GraphQLSchema,
+    data: Any,
+    *,
+    context_value: Optional[Any] = None,
+    root_value: Optional[RootValue] = None,
+    debug: bool = False,
+    introspection: bool = True,
+    logger: Optional[str] = None,
+    validation_rules: Optional[ValidationRules] = None,
+    error_formatter: ErrorFormatter = format_error,
+    middleware: Optional[MiddlewareManager] = None,
+    extensions: Optional[ExtensionList] = None,
+    document_cache: Optional[DocumentCache] = None,
+    **kwargs,
+) -> SubscriptionResult:
+    """
+    Counterpart of ``ariadne.subscribe`` that reuses parsed and validated documents from the document cache.
+
+    Every event of the subscription is executed with middleware and extensions, which are created
+    for every event, like they are for every query.
+    """
+    try:
+        validate_data(data)
+        document, validation_errors = parse_and_validate_query(
+            schema,
+            data,
+            context_value=context_value,
+            validation_rules=validation_rules,
+            introspection=introspection,
+            document_cache=document_cache,
+        )
+        if validation_errors:
+            for error in validation_errors:
+                log_error(error, logger)
+            return False, [error_formatter(error, debug) for error in validation_errors]
+
+        if callable(root_value):
+            root_value = root_value(context_value, document)
+            if isawaitable(root_value):
+                root_value = await root_value
+
+        result = await create_source_event_stream(
+            schema,
+            document,
+            root_value=root_value,
+            context_value=context_value,
+            variable_values=data.get("variables"),
+            operation_name=data.get("operationName"),
+            subscribe_field_resolver=kwargs.pop("subscribe_field_resolver", None),
+        )
+    except GraphQLError as error:
+        log_error(error, logger)
+        return False, [error_formatter(error, debug)]
+    if isinstance(result, ExecutionResult):
+        errors = cast(List[GraphQLError], result.errors)
+        for error in errors:
+            log_error(error, logger)
+        return False, [error_formatter(error, debug) for error in errors]
+
+    async def execute_event(event: Any) -> ExecutionResult:
+        extension_manager = ExtensionManager(extensions, context_value)
+        with extension_manager.request():
+            event_result = execute(
+                schema,
+                document,
+                root_value=event,
+                context_value=context_value,
+                variable_values=data.get("variables"),
+                operation_name=data.get("operationName"),
+                middleware=extension_manager.as_middleware_manager(middleware),
+                **kwargs,
+            )
+            if isawaitable(event_result):
+                event_result = await event_result
+            event_result = cast(ExecutionResult, event_result)
+            if event_result.errors:
+                extension_manager.has_errors(event_result.errors)
+            event_result.extensions = extension_manager.format() or None
+        return event_result
+
+    return True, cast(AsyncGenerator, MapAsyncIterator(result, execute_event))
@@ -0,0 +1,548 @@
+import asyncio
+from contextlib import ExitStack
+from contextvars import ContextVar
+from copy import copy
+from inspect import isawaitable
+from typing import Any, AsyncIterator, Callable, Collection, Dict, List, Optional, Tuple, Type, Union, cast
+
+from ariadne.extensions import ExtensionManager
+from ariadne.format_error import format_error
+from ariadne.graphql import handle_query_result, validate_data
+from ariadne.logger import log_error
+from ariadne.types import ErrorFormatter, ExtensionList, RootValue, ValidationRules
+
+from graphql import (
+    DirectiveNode,
+    DocumentNode,
+    ExecutionContext,
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    execute,
+    get_operation_ast,
+)
+from graphql.execution import MiddlewareManager
+from graphql.execution.collect_fields import collect_fields
+from graphql.execution.values import get_directive_values
+from graphql.pyutils import AwaitableOrValue
+from graphql.pyutils import Path as FieldPath
+
+from .document_cache import DocumentCache
+from .graphql import graphql, parse_and_validate_query, validate_operation_type
+from .persisted_queries import PersistedQueryStore, resolve_persisted_query
+from .response_cache import ResponseCache
+
+
+defer_directives = """
+directive @defer(if: Boolean! = true, label: String) on FRAGMENT_SPREAD | INLINE_FRAGMENT
+directive @stream(if: Boolean! = true, label: String, initialCount: Int! = 0) on FIELD
+"""
+
+INCREMENTAL_DIRECTIVES = ("defer", "stream")
+
+Ancestor = Union[FieldNode, InlineFragmentNode]
+Path = List[Union[str, int]]
+IncrementalResult = Tuple[bool, dict, Optional[AsyncIterator[dict]]]
+
+# Deferred parts of the operation executed in the current context, and parent object of the deferred part.
+current_delivery: "ContextVar[Optional[IncrementalDelivery]]" = ContextVar(
+    "ariadne_django_incremental_delivery", default=None
+)
+deferred_parent: "ContextVar[Optional[Tuple[GraphQLObjectType, Any, Optional[FieldPath]]]]" = ContextVar(
+    "ariadne_django_deferred_parent", default=None
+)
+
+
+class DeferredPart:
+    """
+    Fragment marked with ``@defer`` or list field marked with ``@stream``, executed separately with the object
+    containing it, resolved for the initial payload, as the parent value.
+
+    Items of lists streamed with positive ``initialCount`` are resolved for the initial payload, and items
+    past ``initialCount`` are sent in the first subsequent payload.
+    """
+
+    def __init__(
+        self,
+        operation: OperationDefinitionNode,
+        ancestors: List[Ancestor],
+        selection: Union[FieldNode, InlineFragmentNode],
+        label: Optional[str],
+        initial_count: Optional[int] = None,
+    ):
+        self.label = label
+        self.initial_count = initial_count
+        self.path = [get_response_key(node) for node in ancestors if isinstance(node, FieldNode)]
+        self.parent_path = tuple(self.path)
+        if self.is_stream:
+            self.path.append(get_response_key(cast(FieldNode, selection)))
+
+        # Inline fragments between the parent field and the part keep their type conditions.
+        selection_set = SelectionSetNode(selections=(selection,))
+        for ancestor in reversed(ancestors):
+            if isinstance(ancestor, FieldNode):
+                break
+            ancestor = copy(ancestor)
+            ancestor.selection_set = selection_set
+            selection_set = SelectionSetNode(selections=(ancestor,))
+        operation = copy(operation)
+        operation.selection_set = selection_set
+        self.document = DocumentNode(definitions=(operation,))
+
+    @property
+    def is_stream(self) -> bool:
+        return self.initial_count is not None
+
+    @property
+    def is_executed_separately(self) -> bool:
+        return not self.is_stream or not self.initial_count
+
+    def prepare_initial_data(self, data: Optional[dict]) -> List[dict]:
+        """
+        Leaves only first ``initialCount`` items of streamed lists in the initial payload, and returns
+        the remaining items.
+        """
+        incremental: List[dict] = []
+        if not self.is_stream:
+            return incremental
+        key = self.path[-1]
+        for parent, path in find_values(data, self.path[:-1]):
+            if not isinstance(parent, dict):
+                continue
+            items = parent.get(key)
+            if not self.initial_count:
+                parent[key] = []
+            elif isinstance(items, list) and len(items) > cast(int, self.initial_count):
+                parent[key] = items[: self.initial_count]
+                item_path = path + [key, cast(int, self.initial_count)]
+                incremental.append(self.add_label({"items": items[self.initial_count :], "path": item_path}))
+        return incremental
+
+    def get_incremental(self, result: ExecutionResult, path: Path) -> List[dict]:
+        incremental: List[dict] = []
+        if self.is_stream:
+            items = result.data.get(self.path[-1]) if result.data else None
+            if isinstance(items, list) and items:
+                incremental.append({"items": items, "path": path + [self.path[-1], 0]})
+        elif result.data:
+            # Fragments with type condition not matching the object resolve to empty objects.
+            incremental.append({"data": result.data, "path": path})
+        return [self.add_label(item) for item in incremental]
+
+    def add_label(self, item: dict) -> dict:
+        if self.label is not None:
+            item["label"] = self.label
+        return item
+
+
+def get_response_key(node: FieldNode) -> str:
+    return node.alias.value if node.alias else node.name.value
+
+
+def find_values(data: Any, keys: List[Union[str, int]]) -> List[Tuple[Any, Path]]:
+    values: List[Tuple[Any, Path]] = [(data, [])]
+    for key in keys:
+        next_values: List[Tuple[Any, Path]] = []
+        for value, path in values:
+            if not isinstance(value, dict) or value.get(key) is None:
+                continue
+            child = value[key]
+            if isinstance(child, list):
+                next_values.extend((item, path + [key, i]) for i, item in enumerate(child))
+            else:
+                next_values.append((child, path + [key]))
+        values = next_values
+    return values
+
+
+def has_path(data: Any, path: Path) -> bool:
+    value = data
+    for key in path:
+        if isinstance(key, int):
+            if not isinstance(value, list) or key >= len(value):
+                return False
+        elif not isinstance(value, dict):
+            return False
+        value = value[key] if isinstance(key, int) else value.get(key)
+    return value is not None
+
+
+class IncrementalDeliveryPlan:
+    """
+    Splits query operation into the document of the initial payload, without deferred fragments
+    and streamed fields, and deferred parts executed separately.
+
+    Deferred fragments nested in other deferred fragments are delivered together with their parent.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        operation: OperationDefinitionNode,
+        variables: Optional[Dict[str, Any]],
+    ):
+        self.schema = schema
+        self.variables = variables or {}
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        self.deferred: List[DeferredPart] = []
+        self.operation = operation
+
+        initial_operation = copy(operation)
+        initial_operation.selection_set = self.split_selection_set(operation.selection_set, [])
+        self.initial_document = DocumentNode(definitions=(initial_operation,))
+
+    def split_selection_set(self, selection_set: SelectionSetNode, ancestors: List[Ancestor]) -> SelectionSetNode:
+        selections = []
+        for selection in selection_set.selections:
+            if isinstance(selection, FragmentSpreadNode):
+                selection = self.inline_fragment_spread(selection)
+
+            if isinstance(selection, InlineFragmentNode):
+                defer = self.get_directive_values("defer", selection)
+                if defer is not None:
+                    fragment = copy(selection)
+                    fragment.directives = self.strip_incremental_directives(fragment.directives)
+                    fragment.selection_set = self.strip_selection_set(fragment.selection_set)
+                    self.deferred.append(DeferredPart(self.operation, ancestors, fragment, defer.get("label")))
+                    continue
+                fragment = copy(selection)
+                fragment.selection_set = self.split_selection_set(selection.selection_set, ancestors + [selection])
+                selections.append(fragment)
+            elif isinstance(selection, FieldNode):
+                stream = self.get_directive_values("stream", selection)
+                field = copy(selection)
+                if stream is not None:
+                    field.directives = self.strip_incremental_directives(field.directives)
+                    if field.selection_set:
+                        field.selection_set = self.strip_selection_set(field.selection_set)
+                    initial_count = max(stream.get("initialCount", 0), 0)
+                    self.deferred.append(
+                        DeferredPart(self.operation, ancestors, field, stream.get("label"), initial_count)
+                    )
+                    if not initial_count:
+                        continue
+                elif field.selection_set:
+                    field.selection_set = self.split_selection_set(field.selection_set, ancestors + [selection])
+                selections.append(field)
+        return SelectionSetNode(selections=tuple(selections))
+
+    def strip_selection_set(self, selection_set: SelectionSetNode) -> SelectionSetNode:
+        selections = []
+        for selection in selection_set.selections:
+            if isinstance(selection, FragmentSpreadNode):
+                selection = self.inline_fragment_spread(selection)
+            selection = copy(selection)
+            selection.directives = self.strip_incremental_directives(selection.directives)
+            if getattr(selection, "selection_set", None):
+                selection.selection_set = self.strip_selection_set(selection.selection_set)
+            selections.append(selection)
+        return SelectionSetNode(selections=tuple(selections))
+
+    def inline_fragment_spread(self, spread: FragmentSpreadNode) -> InlineFragmentNode:
+        fragment = self.fragments[spread.name.value]
+        return InlineFragmentNode(
+            type_condition=fragment.type_condition,
+            directives=spread.directives,
+            selection_set=fragment.selection_set,
+        )
+
+    def get_directive_values(self, name: str, node: Union[FieldNode, InlineFragmentNode]) -> Optional[dict]:
+        directive = self.schema.get_directive(name)
+        if directive is None:
+            return None
+        values = get_directive_values(directive, node, self.variables)
+        if values is None or not values.get("if", True):
+            return None
+        return values
+
+    @staticmethod
+    def strip_incremental_directives(directives: Optional[Tuple[DirectiveNode, ...]]) -> Tuple[DirectiveNode, ...]:
+        return tuple(directive for directive in directives or () if directive.name.value not in INCREMENTAL_DIRECTIVES)
+
+
+def has_incremental_directives(document: DocumentNode) -> bool:
+    stack: List[Any] = list(document.definitions)
+    while stack:
+        node = stack.pop()
+        for directive in getattr(node, "directives", None) or ():
+            if directive.name.value in INCREMENTAL_DIRECTIVES:
+                return True
+        selection_set = getattr(node, "selection_set", None)
+        if selection_set is not None:
+            stack.extend(selection_set.selections)
+    return False
+
+
+class IncrementalDelivery:
+    """
+    Deferred parts of the operation being executed, started when objects containing them are resolved.
+    """
+
+    def __init__(self, parts: List[DeferredPart], execute_document: Callable[..., AwaitableOrValue[ExecutionResult]]):
+        self.parts: Dict[Tuple[str, ...], List[DeferredPart]] = {}
+        for part in parts:
+            if part.is_executed_separately:
+                self.parts.setdefault(part.parent_path, []).append(part)
+        self.execute_document = execute_document
+        self.tasks: Dict["asyncio.Future[ExecutionResult]", Tuple[DeferredPart, Path]] = {}
+
+    def start(self, parent_type: GraphQLObjectType, parent: Any, path: Optional[FieldPath]):
+        keys = path.as_list() if path else []
+        for part in self.parts.get(tuple(key for key in keys if isinstance(key, str)), ()):
+            task = asyncio.ensure_future(self.execute_part(part, parent_type, parent, path))
+            self.tasks[task] = (part, keys)
+
+    async def execute_part(
+        self, part: DeferredPart, parent_type: GraphQLObjectType, parent: Any, path: Optional[FieldPath]
+    ) -> ExecutionResult:
+        # Tasks run in copies of the context, so parent is only set for execution of this part.
+        deferred_parent.set((parent_type, parent, path))
+        result = self.execute_document(part.document, DeferredExecutionContext)
+        if isawaitable(result):
+            result = await result
+        return cast(ExecutionResult, result)
+
+    def cancel(self):
+        for task in self.tasks:
+            task.cancel()
+
+
+class InitialExecutionContext(ExecutionContext):
+    """
+    Execution context of the initial payload, starting deferred parts when objects containing them are resolved.
+    """
+
+    def execute_operation(self, operation: OperationDefinitionNode, root_value: Any) -> Any:
+        delivery = current_delivery.get()
+        if delivery is not None and self.schema.query_type is not None:
+            delivery.start(self.schema.query_type, root_value, None)
+        return super().execute_operation(operation, root_value)
+
+    def complete_object_value(
+        self,
+        return_type: GraphQLObjectType,
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: FieldPath,
+        result: Any,
+    ) -> AwaitableOrValue[Dict[str, Any]]:
+        completed = super().complete_object_value(return_type, field_nodes, info, path, result)
+        delivery = current_delivery.get()
+        if delivery is not None:
+            delivery.start(return_type, result, path)
+        return completed
+
+
+class DeferredExecutionContext(ExecutionContext):
+    """
+    Execution context of deferred parts, resolving their selections with the parent object
+    instead of the root value.
+    """
+
+    def execute_operation(self, operation: OperationDefinitionNode, root_value: Any) -> Any:
+        parent_type, parent, path = cast(Tuple[GraphQLObjectType, Any, Optional[FieldPath]], deferred_parent.get())
+        fields = collect_fields(self.schema, self.fragments, self.variable_values, parent_type, operation.selection_set)
+        return self.execute_fields(parent_type, parent, path, fields)
+
+
+async def graphql_incremental(
+    schema: GraphQLSchema,
+    data: Any,
+    *,
+    context_value: Optional[Any] = None,
+    root_value: Optional[RootValue] = None,
+    debug: bool = False,
+    introspection: bool = True,
+    logger: Optional[str] = None,
+    validation_rules: Optional[ValidationRules] = None,
+    error_formatter: ErrorFormatter = format_error,
+    middleware: Optional[MiddlewareManager] = None,
+    extensions: Optional[ExtensionList] = None,
+    document_cache: Optional[DocumentCache] = None,
+    persisted_queries: Optional[PersistedQueryStore] = None,
+    allowed_operation_types: Optional[Collection[OperationType]] = None,
+    response_cache: Optional[ResponseCache] = None,
+    response_cache_scope: str = "public",
+    **kwargs,
+) -> IncrementalResult:
+    """
+    Executes query with ``@defer`` and ``@stream`` directives, returning the initial payload and asynchronous
+    iterator of subsequent payloads, or None if the operation is executed with ``graphql`` in one payload.
+
+    Deferred parts start as soon as the objects containing them are resolved for the initial payload, and
+    are resolved with these objects as parent values, sharing the context value (and so data loaders)
+    of the initial payload. Subsequent payloads are produced in order in which deferred parts complete.
+    Request context of extensions lasts until the last payload is produced, and their results are sent
+    in the initial payload.
+    """
+    graphql_kwargs = {
+        "context_value": context_value,
+        "root_value": root_value,
+        "debug": debug,
+        "introspection": introspection,
+        "logger": logger,
+        "validation_rules": validation_rules,
+        "error_formatter": error_formatter,
+        "middleware": middleware,
+        "extensions": extensions,
+        "document_cache": document_cache,
+        "persisted_queries": persisted_queries,
+        "allowed_operation_types": allowed_operation_types,
+        "response_cache": response_cache,
+        "response_cache_scope": response_cache_scope,
+        **kwargs,
+    }
+
+    plan = None
+    try:
+        resolved_data = resolve_persisted_query(data, persisted_queries)
+        validate_data(resolved_data)
+        document, validation_errors = parse_and_validate_query(
+            schema,
+            resolved_data,
+            context_value=context_value,
+            validation_rules=validation_rules,
+            introspection=introspection,
+            document_cache=document_cache,
+        )
+        operation = get_operation_ast(document, resolved_data.get("operationName"))
+        if not validation_errors and operation is not None and has_incremental_directives(document):
+            validate_operation_type(operation, allowed_operation_types)
+            # Deferring mutation fields would execute them more than once.
+            if operation.operation == OperationType.QUERY:
+                plan = IncrementalDeliveryPlan(schema, document, operation, resolved_data.get("variables"))
+    except GraphQLError:
+        pass
+    if plan is None or not plan.deferred:
+        # Errors are reported and operations without deferred parts are executed in the usual way.
+        success, response = await graphql(schema, data, **graphql_kwargs)
+        return success, response, None
+
+    extension_manager = ExtensionManager(extensions, context_value)
+    middleware_manager = extension_manager.as_middleware_manager(middleware)
+    if callable(root_value):
+        root_value = root_value(context_value, document)
+        if isawaitable(root_value):
+            root_value = await root_value
+
+    def execute_document(
+        deferred_document: DocumentNode, execution_context_class: Type[ExecutionContext]
+    ) -> AwaitableOrValue[ExecutionResult]:
+        return execute(
+            schema,
+            deferred_document,
+            root_value=root_value,
+            context_value=context_value,
+            variable_values=resolved_data.get("variables"),
+            operation_name=resolved_data.get("operationName"),
+            execution_context_class=execution_context_class,
+            middleware=middleware_manager,
+            **kwargs,
+        )
+
+    delivery = IncrementalDelivery(plan.deferred, execute_document)
+    request_context = ExitStack()
+    request_context.enter_context(extension_manager.request())
+    token = current_delivery.set(delivery)
+    try:
+        result = execute_document(plan.initial_document, InitialExecutionContext)
+        if isawaitable(result):
+            result = await result
+        success, response = handle_query_result(
+            cast(ExecutionResult, result),
+            logger=logger,
+            error_formatter=error_formatter,
+            debug=debug,
+            extension_manager=extension_manager,
+        )
+    except BaseException:
+        delivery.cancel()
+        request_context.close()
+        raise
+    finally:
+        current_delivery.reset(token)
+
+    if response.get("data") is None:
+        delivery.cancel()
+        request_context.close()
+        return success, response, None
+
+    ready = [item for part in plan.deferred for item in part.prepare_initial_data(response["data"])]
+    if not ready and not delivery.tasks:
+        request_context.close()
+        return success, response, None
+
+    response["hasNext"] = True
+    subsequent = get_subsequent_payloads(
+        delivery,
+        ready,
+        response["data"],
+        extension_manager,
+        request_context,
+        logger=logger,
+        error_formatter=error_formatter,
+        debug=debug,
+    )
+    return success, response, subsequent
+
+
+async def get_subsequent_payloads(
+    delivery: "IncrementalDelivery",
+    ready: List[dict],
+    initial_data: dict,
+    extension_manager: ExtensionManager,
+    request_context: ExitStack,
+    *,
+    logger: Optional[str],
+    error_formatter: ErrorFormatter,
+    debug: bool,
+) -> AsyncIterator[dict]:
+    pending = dict(delivery.tasks)
+    try:
+        if ready:
+            # Remaining items of lists streamed with initialCount were resolved for the initial payload.
+            yield {"hasNext": bool(pending), "incremental": ready}
+        while pending:
+            done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+            incremental = []
+            # Parts completed together are sent in order in which they were started.
+            for task in [task for task in pending if task in done]:
+                part, path = pending.pop(task)
+                if not has_path(initial_data, path):
+                    # Parent object was nulled in the initial payload by error of its sibling field.
+                    continue
+                result = task.result()
+                items = part.get_incremental(result, path)
+                if result.errors:
+                    extension_manager.has_errors(result.errors)
+                    for error in result.errors:
+                        log_error(error, logger)
+                    errors = [error_formatter(error, debug) for error in result.errors]
+                    if items:
+                        items[0]["errors"] = errors
+                    else:
+                        item_path = path + [part.path[-1]] if part.is_stream else path
+                        items.append(part.add_label({"data": None, "path": item_path, "errors": errors}))
+                incremental.extend(items)
+            payload: Dict[str, Any] = {"hasNext": bool(pending)}
+            if incremental:
+                payload["incremental"] = incremental
+            yield payload
+    finally:
+        for task in pending:
+            task.cancel()
+        request_context.close()
@@ -0,0 +1,120 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, NamedTuple, Optional, Set
+from weakref import WeakKeyDictionary
+
+from django.utils.cache import quote_etag
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationType,
+    SelectionSetNode,
+    get_operation_ast,
+    parse,
+)
+
+
+INTROSPECTION_FIELDS = {"__schema", "__type", "__typename"}
+
+
+class CachedIntrospectionResult(NamedTuple):
+    content: bytes
+    etag: str
+
+
+def get_introspection_cache_key(data: Any) -> Optional[str]:
+    """
+    Returns cache key of the operation, if it may be an introspection operation
+    (its query mentions introspection fields and it has no variables), or None otherwise.
+    """
+    if not isinstance(data, dict) or data.get("variables"):
+        return None
+    query = data.get("query")
+    if not isinstance(query, str) or ("__schema" not in query and "__type" not in query):
+        return None
+    operation_name = data.get("operationName") or ""
+    return hashlib.sha256("{}\0{}".format(operation_name, query).encode("utf-8")).hexdigest()
+
+
+def is_introspection_operation(document: DocumentNode, operation_name: Optional[str] = None) -> bool:
+    """
+    Checks if the operation is a query without variables, selecting only introspection fields,
+    so its result only depends on the schema.
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation != OperationType.QUERY or operation.variable_definitions:
+        return False
+    fragments = {
+        definition.name.value: definition.selection_set
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    return selects_only_introspection_fields(operation.selection_set, fragments, set())
+
+
+def selects_only_introspection_fields(selection_set: SelectionSetNode, fragments: dict, visited: Set[str]) -> bool:
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if selection.name.value not in INTROSPECTION_FIELDS:
+                return False
+        elif isinstance(selection, InlineFragmentNode):
+            if not selects_only_introspection_fields(selection.selection_set, fragments, visited):
+                return False
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name in visited:
+                continue
+            visited.add(name)
+            if name not in fragments or not selects_only_introspection_fields(fragments[name], fragments, visited):
+                return False
+    return True
+
+
+class IntrospectionCache:
+    """
+    Serialized results of introspection operations, computed once for every schema. Views keep
+    their own cache, as results also depend on their validation rules.
+
+    Only results of operations selecting nothing but introspection fields are stored, as they don't depend
+    on the request. Schemas are weakly referenced, and up to ``maxsize`` distinct operations (sent by
+    different tools) are kept for every schema.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._results: "WeakKeyDictionary[GraphQLSchema, OrderedDict[str, CachedIntrospectionResult]]" = (
+            WeakKeyDictionary()
+        )
+        self._lock = Lock()
+
+    def get(self, schema: GraphQLSchema, key: str) -> Optional[CachedIntrospectionResult]:
+        with self._lock:
+            results = self._results.get(schema)
+            return results.get(key) if results is not None else None
+
+    def set(self, schema: GraphQLSchema, key: str, data: dict, content: bytes) -> bool:
+        try:
+            document = parse(data["query"])
+        except GraphQLError:
+            return False
+        if not is_introspection_operation(document, data.get("operationName")):
+            return False
+
+        result = CachedIntrospectionResult(content, quote_etag(hashlib.sha256(content).hexdigest()))
+        with self._lock:
+            results = self._results.setdefault(schema, OrderedDict())
+            results[key] = result
+            while len(results) > self.maxsize:
+                results.popitem(last=False)
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
@@ -0,0 +1,81 @@
+from typing import Any, Optional
+
+from django.core.cache import caches
+
+from graphql import GraphQLError
+
+from .document_cache import get_query_hash
+
+
+PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported", extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"})
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound", extensions={"code": "PERSISTED_QUERY_NOT_FOUND"})
+
+
+class InvalidPersistedQuery(GraphQLError):
+    def __init__(self, message: str):
+        super().__init__(message, extensions={"code": "INVALID_PERSISTED_QUERY"})
+
+
+class PersistedQueryStore:
+    """
+    Stores query texts of Automatic Persisted Queries in the Django cache, keyed by their sha256 hash.
+    """
+
+    def __init__(self, cache_alias: str = "default", timeout: Optional[int] = None, key_prefix: str = "apq"):
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+
+    def get_cache_key(self, query_hash: str) -> str:
+        return "{}:{}".format(self.key_prefix, query_hash)
+
+    def get(self, query_hash: str) -> Optional[str]:
+        return caches[self.cache_alias].get(self.get_cache_key(query_hash))
+
+    def set(self, query_hash: str, query: str):
+        caches[self.cache_alias].set(self.get_cache_key(query_hash), query, self.timeout)
+
+
+def resolve_persisted_query(data: Any, store: Optional[PersistedQueryStore]) -> Any:
+    """
+    Implements the Automatic Persisted Queries protocol: operation data carrying only the
+    ``extensions.persistedQuery.sha256Hash`` gets its query text filled in from the store,
+    and operation data carrying both the hash and the query text gets the query persisted.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("extensions"), dict):
+        return data
+
+    persisted_query = data["extensions"].get("persistedQuery")
+    if persisted_query is None:
+        return data
+    if store is None:
+        if data.get("query"):
+            return data
+        raise PersistedQueryNotSupported()
+
+    if not isinstance(persisted_query, dict) or persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise InvalidPersistedQuery("Unsupported persisted query version")
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        raise InvalidPersistedQuery("Persisted query hash must be a string")
+
+    query = data.get("query")
+    if query:
+        if not isinstance(query, str) or get_query_hash(query) != query_hash:
+            raise InvalidPersistedQuery("Provided sha does not match query")
+        store.set(query_hash, query)
+        return data
+
+    query = store.get(query_hash)
+    if query is None:
+        raise PersistedQueryNotFound()
+    return {**data, "query": query}
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import uuid
+from collections.abc import Mapping
+from typing import Any, Callable, Collection, Dict, Iterator, List, NamedTuple, Optional, Type
+
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpRequest
+from django.utils.cache import quote_etag
+
+from graphql import OperationDefinitionNode, OperationType
+
+from ariadne_django.codecs import JSONCodec
+
+from .document_cache import get_query_hash
+
+
+def get_operation_name(operation: OperationDefinitionNode) -> Optional[str]:
+    return operation.name.value if operation.name else None
+
+
+def get_user_scope(request: HttpRequest) -> str:
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return "user:{}".format(user.pk)
+    return "public"
+
+
+class CachedResponse(NamedTuple):
+    content: bytes
+    etag: str
+
+
+class CachedResult(Mapping):
+    """
+    Result of an operation stored in the response cache, together with extensions of the request.
+
+    Views send the serialized content of the cached result with the extensions appended, instead of serializing
+    the result again. Its data is only decoded when the result is accessed as a mapping.
+    """
+
+    def __init__(self, cached_response: CachedResponse, extensions: dict, json_codec: JSONCodec):
+        self.cached_response = cached_response
+        self.extensions = extensions
+        self.json_codec = json_codec
+        self._response: Optional[dict] = None
+
+    @property
+    def response(self) -> dict:
+        if self._response is None:
+            self._response = self.json_codec.loads(self.cached_response.content)
+            if self.extensions:
+                self._response["extensions"] = self.extensions
+        return self._response
+
+    def __getitem__(self, key: str) -> Any:
+        return self.response[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.response)
+
+    def __len__(self) -> int:
+        return len(self.response)
+
+    @property
+    def etag(self) -> str:
+        return self.cached_response.etag
+
+    def get_content(self, json_codec: JSONCodec) -> bytes:
+        content = self.cached_response.content
+        if not self.extensions:
+            return content
+        # Cached content is a serialized object with the data, extended here without decoding it.
+        return content[:-1] + b', "extensions": ' + json_codec.dumps(self.extensions) + b"}"
+
+
+class ResponseCache:
+    """
+    Caches results of query operations in the Django cache.
+
+    Results are keyed by the query, its variables, operation name and scope returned by the scope
+    function for the request (current user by default). Operations can be given their own timeouts
+    and tags, and all results tagged with a tag are invalidated at once with ``invalidate``.
+
+    Results are stored serialized with ``json_codec``, so they are not serialized again when served.
+    """
+
+    def __init__(
+        self,
+        cache_alias: str = "default",
+        timeout: int = 60,
+        *,
+        operation_timeouts: Optional[Dict[str, int]] = None,
+        operation_tags: Optional[Dict[str, Collection[str]]] = None,
+        scope: Callable[[HttpRequest], str] = get_user_scope,
+        key_prefix: str = "graphql",
+        json_codec: Optional[JSONCodec] = None,
+    ):
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.operation_timeouts = operation_timeouts or {}
+        self.operation_tags = operation_tags or {}
+        self.scope = scope
+        self.key_prefix = key_prefix
+        self.json_codec = json_codec or JSONCodec()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_timeout(self, operation_name: Optional[str]) -> int:
+        if operation_name is None:
+            return self.timeout
+        return self.operation_timeouts.get(operation_name, self.timeout)
+
+    def get_tags(self, operation_name: Optional[str]) -> Collection[str]:
+        if operation_name is None:
+            return ()
+        return self.operation_tags.get(operation_name, ())
+
+    def get_tag_cache_key(self, tag: str) -> str:
+        return "{}:tag:{}".format(self.key_prefix, tag)
+
+    def get_tag_versions(self, tags: Collection[str]) -> List[str]:
+        tag_keys = [self.get_tag_cache_key(tag) for tag in sorted(tags)]
+        versions = self.cache.get_many(tag_keys)
+        for tag_key in tag_keys:
+            if tag_key not in versions:
+                # Tag versions which were never set (or were evicted) get a fresh version,
+                # so results cached with the previous version are never served again.
+                self.cache.add(tag_key, uuid.uuid4().hex, None)
+                versions[tag_key] = self.cache.get(tag_key)
+        return [versions[tag_key] for tag_key in tag_keys]
+
+    def get_cache_key(self, operation: Optional[OperationDefinitionNode], data: dict, scope: str) -> Optional[str]:
+        if operation is None or operation.operation != OperationType.QUERY:
+            return None
+        operation_name = get_operation_name(operation)
+        if not self.get_timeout(operation_name):
+            return None
+
+        try:
+            key_data = json.dumps(
+                [
+                    get_query_hash(data["query"]),
+                    operation_name,
+                    data.get("variables"),
+                    scope,
+                    self.get_tag_versions(self.get_tags(operation_name)),
+                ],
+                cls=DjangoJSONEncoder,
+                sort_keys=True,
+            )
+        except TypeError:
+            # Variables which can't be serialized (eg. uploaded files) are never cached.
+            return None
+        key_hash = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+        return "{}:{}:{}".format(self.key_prefix, operation_name or "", key_hash)
+
+    def get(self, cache_key: str) -> Optional[CachedResponse]:
+        return self.cache.get(cache_key)
+
+    def set(self, cache_key: str, result: dict, operation: OperationDefinitionNode) -> CachedResponse:
+        content = self.json_codec.dumps(result)
+        # ETag is weak, as responses with the cached result differ in extensions of the request.
+        cached_response = CachedResponse(content, "W/{}".format(quote_etag(hashlib.sha256(content).hexdigest())))
+        self.cache.set(cache_key, cached_response, self.get_timeout(get_operation_name(operation)))
+        return cached_response
+
+    def invalidate(self, *tags: str):
+        self.cache.set_many({self.get_tag_cache_key(tag): uuid.uuid4().hex for tag in tags}, None)
+
+    def invalidate_on_change(self, model: Type[Model], *tags: str):
+        """
+        Invalidates tags whenever instance of the model is saved or deleted.
+        """
+
+        def invalidate_tags(**kwargs: Any):  # pylint: disable=unused-argument
+            self.invalidate(*tags)
+
+        label = model._meta.label  # pylint: disable=protected-access
+        dispatch_uid = "ariadne_django.response_cache:{}:{}:{}".format(id(self), label, ",".join(tags))
+        post_save.connect(invalidate_tags, sender=model, weak=False, dispatch_uid=dispatch_uid)
+        post_delete.connect(invalidate_tags, sender=model, weak=False, dispatch_uid=dispatch_uid)
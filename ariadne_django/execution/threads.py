@@ -0,0 +1,129 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from inspect import isawaitable
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections
+from django.db.models import QuerySet
+
+from ariadne.resolvers import is_default_resolver
+from ariadne.types import Resolver
+
+from graphql import GraphQLResolveInfo
+
+from ariadne_django.compat import get_running_loop, iscoroutinefunction
+from ariadne_django.tracing.queries import current_collector
+
+
+THREAD_POOL_RESOLVER_ATTR = "_ariadne_django_thread_pool_resolver"
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def get_resolver_thread_pool() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool running synchronous resolvers of asynchronous views, with up to
+    ``ARIADNE_DJANGO_RESOLVER_THREADS`` workers (default size of ``ThreadPoolExecutor`` if not set).
+    """
+    global _executor  # pylint: disable=global-statement
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "ARIADNE_DJANGO_RESOLVER_THREADS", None),
+                    thread_name_prefix="ariadne_django_resolver",
+                )
+    return _executor
+
+
+def reset_resolver_thread_pool(*, setting: str, **kwargs):  # pylint: disable=unused-argument
+    global _executor  # pylint: disable=global-statement
+    if setting != "ARIADNE_DJANGO_RESOLVER_THREADS":
+        return
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+setting_changed.connect(reset_resolver_thread_pool, dispatch_uid="ariadne_django.execution.reset_resolver_thread_pool")
+
+
+def is_event_loop_running() -> bool:
+    try:
+        get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def run_with_connections(func: Callable, *args, **kwargs) -> Any:
+    # Worker threads have their own database connections, which are closed when unusable or older than
+    # CONN_MAX_AGE, like connections of threads handling requests.
+    close_old_connections()
+    collector = current_collector.get()
+    if collector is not None:
+        # Queries of the operation executed with QueryCountingExtension are counted in worker threads too.
+        collector.install_execute_wrapper()
+    try:
+        result = func(*args, **kwargs)
+        if isinstance(result, QuerySet):
+            # Lazy QuerySets can't be evaluated later in the event loop.
+            len(result)
+        return result
+    finally:
+        close_old_connections()
+
+
+async def call_in_thread_pool(func: Callable, *args, **kwargs) -> Any:
+    """
+    Calls the synchronous function in the resolver thread pool and returns its result.
+    """
+    # Context variables are copied to the thread, like by ``sync_to_async``.
+    context = contextvars.copy_context()
+    result = await get_running_loop().run_in_executor(
+        get_resolver_thread_pool(), partial(context.run, run_with_connections, func, *args, **kwargs)
+    )
+    if isawaitable(result):
+        # Eg. returned by AsyncDataLoader.load or asynchronous middleware, which are awaited in the event loop.
+        return await result
+    return result
+
+
+def run_in_thread_pool(resolver: Resolver) -> Resolver:
+    """
+    Decorator of synchronous resolvers blocking on I/O (eg. using the ORM), which runs them in the resolver
+    thread pool when called from the event loop, and calls them directly otherwise.
+    """
+
+    @wraps(resolver)
+    def wrapper(*args, **kwargs):
+        if not is_event_loop_running():
+            return resolver(*args, **kwargs)
+        return call_in_thread_pool(resolver, *args, **kwargs)
+
+    setattr(wrapper, THREAD_POOL_RESOLVER_ATTR, True)
+    return wrapper
+
+
+def is_thread_pool_resolver(resolver: Optional[Resolver]) -> bool:
+    return getattr(resolver, THREAD_POOL_RESOLVER_ATTR, False)
+
+
+def thread_pool_middleware(next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs) -> Any:
+    """
+    Middleware running custom synchronous resolvers in the resolver thread pool, so sibling fields
+    are resolved concurrently and the event loop is not blocked.
+
+    Lazy QuerySets returned by these resolvers are evaluated in the thread, as they can't be evaluated
+    in the event loop, and awaitables they return (eg. from ``AsyncDataLoader.load``) are awaited in the event loop.
+    """
+    resolver = info.parent_type.fields[info.field_name].resolve
+    if is_default_resolver(resolver) or is_thread_pool_resolver(resolver) or iscoroutinefunction(resolver):
+        return next_(obj, info, **kwargs)
+    return call_in_thread_pool(next_, obj, info, **kwargs)
@@ -0,0 +1,40 @@
+import os
+from urllib.request import urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ariadne_django.views.playground import PLAYGROUND_ASSETS, PLAYGROUND_STATIC_PATH, PLAYGROUND_VERSION
+
+
+PLAYGROUND_DOWNLOAD_URL = "https://cdn.jsdelivr.net/npm/graphql-playground-react@{}/build/".format(PLAYGROUND_VERSION)
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "static")
+
+
+class Command(BaseCommand):
+    help = (
+        "Downloads GraphQL Playground assets to static files, to serve them "
+        "from views with playground_static option instead of the CDN."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=DEFAULT_OUTPUT,
+            help="Static files directory the assets are saved in (ariadne_django/static by default).",
+        )
+
+    def handle(self, *args, **options):
+        directory = os.path.join(options["output"], *PLAYGROUND_STATIC_PATH.split("/"))
+        for path in PLAYGROUND_ASSETS.values():
+            url = PLAYGROUND_DOWNLOAD_URL + path
+            destination = os.path.join(directory, *path.split("/"))
+            try:
+                with urlopen(url) as response:  # nosec: url is a constant
+                    content = response.read()
+            except OSError as error:
+                raise CommandError("Failed to download {}: {}".format(url, error)) from error
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            with open(destination, "wb") as f:
+                f.write(content)
+            self.stdout.write("Saved {}".format(destination))
@@ -0,0 +1,2 @@
+# flake8: noqa: E501
+from .queryset import QuerySetOptimizer, get_model_field
@@ -0,0 +1,200 @@
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Type, Union
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Field, ForeignObjectRel, Model, Prefetch, QuerySet
+
+from ariadne import convert_camel_case_to_snake
+
+from graphql import FieldNode, GraphQLObjectType, GraphQLResolveInfo, get_named_type
+from graphql.execution.collect_fields import collect_sub_fields
+
+
+FieldMap = Dict[str, Dict[str, Union[None, str, Sequence[str]]]]
+
+ModelField = Union[Field, ForeignObjectRel]
+
+
+def get_model_field(model: Type[Model], name: str) -> Optional[ModelField]:
+    """
+    Returns model field by its name, or reverse relation by its accessor name.
+    """
+    try:
+        return model._meta.get_field(name)  # pylint: disable=protected-access
+    except FieldDoesNotExist:
+        pass
+    for field in model._meta.related_objects:  # pylint: disable=protected-access
+        if field.get_accessor_name() == name:
+            return field
+    return None
+
+
+class QueryPlan:
+    def __init__(self):
+        self.select_related: List[str] = []
+        self.prefetch_related: List[Prefetch] = []
+        self.only: Set[str] = set()
+
+    def apply(self, queryset: QuerySet, only: bool) -> QuerySet:
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if only and self.only:
+            queryset = queryset.only(*sorted(self.only))
+        return queryset
+
+
+class QuerySetOptimizer:
+    """
+    Middleware adding ``select_related``, ``prefetch_related`` and ``only`` to QuerySets returned by resolvers,
+    based on fields selected in the query.
+
+    ``type_models`` maps names of GraphQL types to Django models. GraphQL fields are matched with model fields
+    of the same name converted to snake case, unless mapped to other model field in ``field_map``
+    (``{"Type": {"field": "model_field"}}``). Fields resolved without accessing the database are mapped
+    to None, and fields computed from model fields are mapped to the list of model fields they use.
+    Models with selected fields that can't be matched with model fields are loaded with all their fields.
+    """
+
+    def __init__(
+        self,
+        type_models: Dict[str, Type[Model]],
+        field_map: Optional[FieldMap] = None,
+        *,
+        only: bool = True,
+    ):
+        self.type_models = type_models
+        self.field_map = field_map or {}
+        self.only = only
+
+    def resolve(self, next_: Callable, obj: Any, info: GraphQLResolveInfo, **kwargs: Any) -> Any:
+        result = next_(obj, info, **kwargs)
+        if isawaitable(result):
+            return self.optimize_awaitable(result, info)
+        if isinstance(result, QuerySet):
+            return self.optimize(result, info)
+        return result
+
+    async def optimize_awaitable(self, result: Awaitable, info: GraphQLResolveInfo) -> Any:
+        # QuerySets returned by async resolvers are lazy, so they can still be optimized after being awaited.
+        value = await result
+        if isinstance(value, QuerySet):
+            return self.optimize(value, info)
+        return value
+
+    def optimize(self, queryset: QuerySet, info: GraphQLResolveInfo) -> QuerySet:
+        """
+        Optimizes the QuerySet of objects returned for the field currently being resolved.
+        """
+        if queryset._result_cache is not None or queryset._fields is not None:  # pylint: disable=protected-access
+            # Evaluated QuerySets (eg. prefetched by the parent field) and values() are left untouched.
+            return queryset
+
+        object_type = get_named_type(info.return_type)
+        if not isinstance(object_type, GraphQLObjectType) or self.type_models.get(object_type.name) is None:
+            return queryset
+        if not issubclass(queryset.model, self.type_models[object_type.name]):
+            return queryset
+
+        return self.optimize_selection(queryset, info, object_type, info.field_nodes)
+
+    def optimize_selection(
+        self,
+        queryset: QuerySet,
+        info: GraphQLResolveInfo,
+        object_type: GraphQLObjectType,
+        field_nodes: List[FieldNode],
+    ) -> QuerySet:
+        plan = QueryPlan()
+        self.plan_selection(plan, info, queryset.model, object_type, field_nodes)
+        only = self.only and queryset.query.deferred_loading == (frozenset(), True)
+        return plan.apply(queryset, only)
+
+    def plan_selection(
+        self,
+        plan: QueryPlan,
+        info: GraphQLResolveInfo,
+        model: Type[Model],
+        object_type: GraphQLObjectType,
+        field_nodes: List[FieldNode],
+        *,
+        prefix: str = "",
+    ):
+        fields = collect_sub_fields(info.schema, info.fragments, info.variable_values, object_type, field_nodes)
+        only = {model._meta.pk.name}  # pylint: disable=protected-access
+        load_all_fields = False
+
+        for subfield_nodes in fields.values():
+            field_name = subfield_nodes[0].name.value
+            if field_name == "__typename":
+                continue
+
+            type_field_map = self.field_map.get(object_type.name, {})
+            if field_name in type_field_map:
+                mapped = type_field_map[field_name]
+                if mapped is None:
+                    continue
+                if not isinstance(mapped, str):
+                    only.update(mapped)
+                    continue
+                model_field_name = mapped
+            else:
+                model_field_name = convert_camel_case_to_snake(field_name)
+
+            model_field = get_model_field(model, model_field_name)
+            if model_field is None:
+                load_all_fields = True
+                continue
+            if not model_field.is_relation:
+                only.add(model_field.name)
+                continue
+
+            related_model = model_field.related_model
+            if related_model is None:
+                # Generic foreign keys can't be joined, and are loaded using all fields of the model.
+                load_all_fields = True
+                continue
+
+            related_type = get_named_type(object_type.fields[field_name].type)
+            if model_field.many_to_one or model_field.one_to_one:
+                if model_field.concrete:
+                    only.add(model_field.name)
+                path = prefix + model_field.name
+                plan.select_related.append(path)
+                if isinstance(related_type, GraphQLObjectType):
+                    self.plan_selection(plan, info, related_model, related_type, subfield_nodes, prefix=path + "__")
+                else:
+                    concrete_fields = related_model._meta.concrete_fields  # pylint: disable=protected-access
+                    plan.only.update(path + "__" + field.name for field in concrete_fields)
+            else:
+                plan.prefetch_related.append(
+                    self.get_prefetch(info, model_field, related_type, subfield_nodes, prefix)  # type: ignore
+                )
+
+        if load_all_fields:
+            only.update(field.name for field in model._meta.concrete_fields)  # pylint: disable=protected-access
+        plan.only.update(prefix + name for name in only)
+
+    def get_prefetch(
+        self,
+        info: GraphQLResolveInfo,
+        model_field: ModelField,
+        related_type: Any,
+        field_nodes: List[FieldNode],
+        prefix: str,
+    ) -> Prefetch:
+        if isinstance(model_field, ForeignObjectRel):
+            lookup = model_field.get_accessor_name()
+        else:
+            lookup = model_field.name
+        queryset = model_field.related_model._default_manager.all()  # pylint: disable=protected-access
+        if not isinstance(related_type, GraphQLObjectType):
+            return Prefetch(prefix + lookup, queryset=queryset)
+
+        plan = QueryPlan()
+        self.plan_selection(plan, info, queryset.model, related_type, field_nodes)
+        if model_field.one_to_many:
+            # Prefetched objects are matched with their parents by the foreign key.
+            plan.only.add(model_field.field.name)  # type: ignore
+        return Prefetch(prefix + lookup, queryset=plan.apply(queryset, self.only))
@@ -0,0 +1,2 @@
+# flake8: noqa: E501
+from .keyset import InvalidCursor, connection_from_queryset, decode_cursor, encode_cursor, page_info_type_defs
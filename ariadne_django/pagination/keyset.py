@@ -0,0 +1,194 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Field, Model, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+
+from graphql import GraphQLError
+
+from ariadne_django.execution.threads import is_event_loop_running
+from ariadne_django.resolvers import acount
+
+
+page_info_type_defs = """
+type PageInfo {
+    hasNextPage: Boolean!
+    hasPreviousPage: Boolean!
+    startCursor: String
+    endCursor: String
+}
+"""
+
+OrderingKey = Tuple[str, bool]
+
+
+class InvalidCursor(GraphQLError):
+    def __init__(self):
+        super().__init__("Invalid cursor", extensions={"code": "INVALID_CURSOR"})
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values), cls=DjangoJSONEncoder).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, fields: Sequence[Field]) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise InvalidCursor()
+        return [field.to_python(value) for field, value in zip(fields, values)]
+    except (binascii.Error, UnicodeError, ValueError, ValidationError) as error:
+        raise InvalidCursor() from error
+
+
+def get_ordering_keys(queryset: QuerySet, ordering: Optional[Sequence[str]]) -> List[OrderingKey]:
+    model = queryset.model
+    if ordering is None:
+        ordering = queryset.query.order_by or model._meta.ordering  # pylint: disable=protected-access
+    keys: List[OrderingKey] = []
+    for name in ordering:
+        if not isinstance(name, str) or name == "?":
+            raise ValueError("Keyset pagination requires ordering by field names")
+        descending = name.startswith("-")
+        keys.append((name.lstrip("-+"), descending))
+    if not any(name in ("pk", model._meta.pk.name) for name, _ in keys):  # pylint: disable=protected-access
+        # Primary key makes the ordering unique, so every row has distinct cursor.
+        keys.append(("pk", keys[-1][1] if keys else False))
+    return keys
+
+
+def get_key_field(model: Type[Model], name: str) -> Field:
+    *relations, field_name = name.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model  # type: ignore  # pylint: disable=protected-access
+    if field_name == "pk":
+        return model._meta.pk  # pylint: disable=protected-access
+    try:
+        return model._meta.get_field(field_name)  # type: ignore  # pylint: disable=protected-access
+    except FieldDoesNotExist as error:
+        raise ValueError("Keyset pagination can't order by '{}'".format(name)) from error
+
+
+def count_rows(queryset: QuerySet) -> Any:
+    if is_event_loop_running():
+        # Eg. totalCount of connection returned by resolver run in the thread pool of GraphQLAsyncView.
+        return acount(queryset)
+    return queryset.count()
+
+
+def get_key_alias(index: int) -> str:
+    return "_keyset_key_{}".format(index)
+
+
+def annotate_key_values(queryset: QuerySet, keys: Sequence[OrderingKey]) -> QuerySet:
+    """
+    Annotates values of ordering keys from related models, so they are selected together with the rows
+    instead of being loaded for every row when its cursor is encoded.
+    """
+    annotations = {get_key_alias(index): F(name) for index, (name, _) in enumerate(keys) if LOOKUP_SEP in name}
+    return queryset.annotate(**annotations) if annotations else queryset
+
+
+def get_key_value(obj: Model, index: int, name: str, field: Field) -> Any:
+    if LOOKUP_SEP in name:
+        return getattr(obj, get_key_alias(index))
+    # Value of the foreign key is read without loading the related object.
+    return getattr(obj, field.attname)
+
+
+def get_keyset_filter(keys: Sequence[OrderingKey], values: Sequence[Any], forward: bool) -> Q:
+    """
+    Returns filter selecting rows ordered after (or before) the row with given ordering key values.
+
+    Row value comparison ``(a, b) > (x, y)`` is expanded to ``a > x OR (a = x AND b > y)``, as keys may
+    be ordered in different directions. The first key is also compared with ``>=``, so the database can
+    use an index on it to skip preceding rows.
+    """
+    keyset_filter = Q()
+    equal: Dict[str, Any] = {}
+    for (name, descending), value in zip(keys, values):
+        lookup = "gt" if forward != descending else "lt"
+        keyset_filter |= Q(**equal, **{"{}__{}".format(name, lookup): value})
+        equal[name] = value
+    name, descending = keys[0]
+    return Q(**{"{}__{}e".format(name, "gt" if forward != descending else "lt"): values[0]}) & keyset_filter
+
+
+def check_limit(name: str, value: Optional[int], max_limit: Optional[int]):
+    if value is None:
+        return
+    if value < 0:
+        raise GraphQLError("Argument '{}' can't be negative".format(name))
+    if max_limit is not None and value > max_limit:
+        raise GraphQLError("Argument '{}' exceeds the maximum of {}".format(name, max_limit))
+
+
+def connection_from_queryset(
+    queryset: QuerySet,
+    *,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    last: Optional[int] = None,
+    before: Optional[str] = None,
+    ordering: Optional[Sequence[str]] = None,
+    max_limit: Optional[int] = 100,
+) -> Dict[str, Any]:
+    """
+    Returns Relay connection with a page of QuerySet results, using keyset pagination.
+
+    Cursors encode values of the ordering keys (``ordering``, QuerySet's or model's ordering, followed
+    by the primary key) and ``after`` and ``before`` filter rows by comparing these keys, instead of
+    skipping rows with ``OFFSET``. Ordering keys must not be null. ``hasNextPage`` (or ``hasPreviousPage``
+    when paginating with ``last``) is found by fetching one extra row, while ``totalCount`` runs
+    a ``COUNT`` query only when it's selected.
+    """
+    check_limit("first", first, max_limit)
+    check_limit("last", last, max_limit)
+
+    keys = get_ordering_keys(queryset, ordering)
+    fields = [get_key_field(queryset.model, name) for name, _ in keys]
+    queryset = queryset.order_by(*("-" + name if descending else name for name, descending in keys))
+    page_queryset = annotate_key_values(queryset, keys)
+    if after is not None:
+        page_queryset = page_queryset.filter(get_keyset_filter(keys, decode_cursor(after, fields), True))
+    if before is not None:
+        page_queryset = page_queryset.filter(get_keyset_filter(keys, decode_cursor(before, fields), False))
+
+    if last is not None and first is None:
+        nodes = list(page_queryset.reverse()[: last + 1])
+        has_previous_page = len(nodes) > last
+        nodes = nodes[:last][::-1]
+        has_next_page = before is not None
+    else:
+        limit = first if first is not None else max_limit
+        nodes = list(page_queryset[: limit + 1] if limit is not None else page_queryset)
+        has_next_page = limit is not None and len(nodes) > limit
+        nodes = nodes[:limit]
+        has_previous_page = after is not None
+        if last is not None and len(nodes) > last:
+            has_previous_page = True
+            nodes = nodes[len(nodes) - last :]
+
+    edges = [
+        {
+            "cursor": encode_cursor(
+                [get_key_value(node, index, name, field) for index, ((name, _), field) in enumerate(zip(keys, fields))]
+            ),
+            "node": node,
+        }
+        for node in nodes
+    ]
+    return {
+        "edges": edges,
+        "pageInfo": {
+            "hasNextPage": has_next_page,
+            "hasPreviousPage": has_previous_page,
+            "startCursor": edges[0]["cursor"] if edges else None,
+            "endCursor": edges[-1]["cursor"] if edges else None,
+        },
+        "totalCount": lambda *_args, **_kwargs: count_rows(queryset),
+    }
@@ -0,0 +1,2 @@
+# flake8: noqa: E501
+from .querysets import acount, aevaluate, aget_or_none, async_queryset_middleware, async_queryset_resolver
@@ -0,0 +1,78 @@
+from functools import wraps
+from inspect import isawaitable
+from typing import Any, List, Optional
+
+import django
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Model, QuerySet
+
+from ariadne.types import Resolver
+
+from asgiref.sync import sync_to_async
+from graphql import GraphQLResolveInfo
+
+
+# Asynchronous QuerySet API (aiter, aget, acount, ain_bulk...) is available since Django 4.1.
+HAS_ASYNC_QUERYSETS = django.VERSION >= (4, 1)
+
+
+async def aevaluate(queryset: QuerySet) -> List[Any]:
+    """
+    Returns list of QuerySet results, evaluated with the asynchronous QuerySet API,
+    or in a thread on Django versions without it.
+    """
+    if queryset._result_cache is not None:  # pylint: disable=protected-access
+        return list(queryset)
+    if HAS_ASYNC_QUERYSETS:
+        return [item async for item in queryset]
+    return await sync_to_async(list)(queryset)
+
+
+async def aget_or_none(queryset: QuerySet, *args, **kwargs) -> Optional[Model]:
+    """
+    Returns the single object matching the lookup parameters, or None if there is no such object.
+    """
+    try:
+        if HAS_ASYNC_QUERYSETS:
+            return await queryset.aget(*args, **kwargs)
+        return await sync_to_async(queryset.get)(*args, **kwargs)
+    except ObjectDoesNotExist:
+        return None
+
+
+async def acount(queryset: QuerySet) -> int:
+    if HAS_ASYNC_QUERYSETS:
+        return await queryset.acount()
+    return await sync_to_async(queryset.count)()
+
+
+async def resolve_queryset(result: Any) -> Any:
+    if isawaitable(result):
+        result = await result
+    if isinstance(result, QuerySet):
+        return await aevaluate(result)
+    return result
+
+
+def async_queryset_resolver(resolver: Resolver) -> Resolver:
+    """
+    Decorator of resolvers returning QuerySets, which evaluates them with the asynchronous QuerySet API,
+    so they can be used by GraphQLAsyncView.
+    """
+
+    @wraps(resolver)
+    async def wrapper(*args, **kwargs):
+        return await resolve_queryset(resolver(*args, **kwargs))
+
+    return wrapper
+
+
+def async_queryset_middleware(next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs) -> Any:
+    """
+    Middleware evaluating QuerySets returned by resolvers with the asynchronous QuerySet API,
+    including QuerySets returned by ``async def`` resolvers.
+    """
+    result = next_(obj, info, **kwargs)
+    if isinstance(result, QuerySet) or isawaitable(result):
+        return resolve_queryset(result)
+    return result
@@ -0,0 +1,4 @@
+# flake8: noqa: E501
+from .cache import SchemaCache, get_document_key, load_document
+from .lazy import LazySchema, build_schema
+from .loader import find_app_graphql_files, read_graphql_files
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+from graphql import DocumentNode, Source, parse
+from graphql import version as graphql_core_version
+from graphql.language import ast
+from graphql.utilities import ast_to_dict
+
+
+CACHE_FORMAT_VERSION = 1
+
+NODE_CLASSES: Dict[str, Type[ast.Node]] = {
+    cls.kind: cls
+    for cls in vars(ast).values()
+    if isinstance(cls, type) and issubclass(cls, ast.Node) and getattr(cls, "kind", None)
+}
+
+
+def get_document_key(sources: Sequence[Tuple[str, str]]) -> str:
+    digest = hashlib.sha256("{}:{}".format(CACHE_FORMAT_VERSION, graphql_core_version).encode("utf-8"))
+    for _, text in sources:
+        digest.update(hashlib.sha256(text.encode("utf-8")).digest())
+    return digest.hexdigest()
+
+
+def parse_sources(sources: Sequence[Tuple[str, str]]) -> DocumentNode:
+    definitions = []
+    for name, text in sources:
+        # Locations would make cached documents several times bigger and slower to load.
+        definitions.extend(parse(Source(text, name), no_location=True).definitions)
+    return DocumentNode(definitions=tuple(definitions))
+
+
+def node_from_dict(value: Any) -> Any:
+    if isinstance(value, dict):
+        node_class = NODE_CLASSES[value["kind"]]
+        return node_class(**{key: node_from_dict(item) for key, item in value.items() if key != "kind"})
+    if isinstance(value, list):
+        return tuple(node_from_dict(item) for item in value)
+    return value
+
+
+class SchemaCache:
+    """
+    Cache of parsed SDL documents stored as JSON files in the ``directory``, keyed by hash of the SDL.
+
+    Documents are only stored after the schema built from them was validated,
+    so cached documents don't have to be validated again.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, "schema-{}.json".format(key))
+
+    def get(self, key: str) -> Optional[DocumentNode]:
+        try:
+            with open(self.get_path(key), "r", encoding="utf-8") as cache_file:
+                data = cache_file.read()
+        except OSError:
+            return None
+
+        try:
+            return node_from_dict(json.loads(data))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, document: DocumentNode):
+        data = json.dumps(ast_to_dict(document), separators=(",", ":"))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # File is written under temporary name and then renamed, so other processes never read partial file.
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                cache_file.write(data)
+            os.replace(temp_path, self.get_path(key))
+        except OSError:
+            pass
+
+
+def load_document(sources: Sequence[Tuple[str, str]], cache: Optional[SchemaCache] = None) -> Tuple[DocumentNode, bool]:
+    """
+    Returns document loaded from the cache or parsed from the SDL sources, and whether it was loaded from the cache.
+    """
+    if cache is not None:
+        document = cache.get(get_document_key(sources))
+        if document is not None:
+            return document, True
+    return parse_sources(sources), False
@@ -0,0 +1,115 @@
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from django.conf import settings
+
+from ariadne import (
+    EnumType,
+    SchemaBindable,
+    SchemaDirectiveVisitor,
+    set_default_enum_values_on_schema,
+    validate_schema_enum_values,
+)
+
+from graphql import GraphQLSchema, assert_valid_schema, build_ast_schema
+
+from .cache import SchemaCache, get_document_key, load_document
+from .loader import find_app_graphql_files, read_graphql_files
+
+
+def flatten_bindables(*bindables: Union[SchemaBindable, List[SchemaBindable]]) -> List[SchemaBindable]:
+    flat_bindables: List[SchemaBindable] = []
+    for bindable in bindables:
+        if isinstance(bindable, list):
+            flat_bindables.extend(bindable)
+        else:
+            flat_bindables.append(bindable)
+    return flat_bindables
+
+
+def build_schema(
+    sources: Sequence[Tuple[str, str]],
+    *bindables: Union[SchemaBindable, List[SchemaBindable]],
+    directives: Optional[Dict[str, Type[SchemaDirectiveVisitor]]] = None,
+    cache: Optional[SchemaCache] = None,
+) -> GraphQLSchema:
+    """
+    Counterpart of ``ariadne.make_executable_schema`` taking a list of ``(name, sdl)`` sources,
+    which loads their parsed document from the cache and skips validation of cached documents.
+
+    Schema is built in the same steps as ``make_executable_schema``, using only public API of Ariadne.
+    """
+    document, cached = load_document(sources, cache)
+    schema = build_ast_schema(document, assume_valid_sdl=cached)
+    flat_bindables = flatten_bindables(*bindables)
+
+    for bindable in flat_bindables:
+        bindable.bind_to_schema(schema)
+
+    set_default_enum_values_on_schema(schema)
+
+    if directives:
+        SchemaDirectiveVisitor.visit_schema_directives(schema, directives)
+
+    assert_valid_schema(schema)
+    validate_schema_enum_values(schema)
+    for bindable in flat_bindables:
+        if isinstance(bindable, EnumType):
+            bindable.bind_to_default_values(schema)
+
+    if cache is not None and not cached:
+        cache.set(get_document_key(sources), document)
+    return schema
+
+
+class LazySchema:
+    """
+    Executable schema built from ``.graphql`` files of installed apps on first use.
+
+    Files are read from the ``app_dirname`` directory of every installed app (or only of apps with
+    ``app_labels``), followed by ``type_defs``. Parsed SDL is cached in ``cache_dir`` (or the
+    ``ARIADNE_DJANGO_SCHEMA_CACHE_DIR`` setting), so processes starting with unchanged files skip parsing
+    and validation of the SDL. Schemas listed in the ``ARIADNE_DJANGO_SCHEMAS`` setting are built
+    when the app registry is ready instead.
+    """
+
+    def __init__(
+        self,
+        *bindables: Union[SchemaBindable, List[SchemaBindable]],
+        type_defs: Union[str, List[str], None] = None,
+        app_dirname: str = "graphql",
+        app_labels: Optional[Sequence[str]] = None,
+        directives: Optional[Dict[str, Type[SchemaDirectiveVisitor]]] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        self.bindables = bindables
+        self.type_defs = [type_defs] if isinstance(type_defs, str) else list(type_defs or [])
+        self.app_dirname = app_dirname
+        self.app_labels = app_labels
+        self.directives = directives
+        self.cache_dir = cache_dir
+        self._schema: Optional[GraphQLSchema] = None
+        self._lock = Lock()
+
+    def get(self) -> GraphQLSchema:
+        if self._schema is None:
+            with self._lock:
+                if self._schema is None:
+                    self._schema = self.build()
+        return self._schema
+
+    def get_sources(self) -> List[Tuple[str, str]]:
+        sources = read_graphql_files(find_app_graphql_files(self.app_dirname, self.app_labels))
+        sources.extend(("type_defs[{}]".format(i), type_defs) for i, type_defs in enumerate(self.type_defs))
+        return sources
+
+    def get_cache(self) -> Optional[SchemaCache]:
+        cache_dir = self.cache_dir or getattr(settings, "ARIADNE_DJANGO_SCHEMA_CACHE_DIR", None)
+        return SchemaCache(cache_dir) if cache_dir else None
+
+    def build(self) -> GraphQLSchema:
+        return build_schema(self.get_sources(), *self.bindables, directives=self.directives, cache=self.get_cache())
+
+    @property
+    def is_built(self) -> bool:
+        return self._schema is not None
@@ -0,0 +1,30 @@
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from django.apps import apps
+
+from ariadne.load_schema import walk_graphql_files
+
+
+def find_app_graphql_files(dirname: str = "graphql", app_labels: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Returns paths of ``.graphql``, ``.graphqls`` and ``.gql`` files in the ``dirname`` directory
+    of installed apps (or apps with given labels), in order of INSTALLED_APPS and file paths.
+    """
+    app_configs = (
+        [apps.get_app_config(label) for label in app_labels] if app_labels is not None else apps.get_app_configs()
+    )
+    paths = []
+    for app_config in app_configs:
+        directory = os.path.join(app_config.path, dirname)
+        if os.path.isdir(directory):
+            paths.extend(sorted(walk_graphql_files(directory)))
+    return paths
+
+
+def read_graphql_files(paths: Sequence[str]) -> List[Tuple[str, str]]:
+    sources = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as graphql_file:
+            sources.append((path, graphql_file.read()))
+    return sources
@@ -0,0 +1,3 @@
+# flake8: noqa: E501
+from .broadcast import Broadcaster, BroadcastBackend, MemoryBroadcastBackend
+from .consumer import GRAPHQL_TRANSPORT_WS, GRAPHQL_WS, GraphQLWebSocketConsumer
@@ -0,0 +1,102 @@
+import asyncio
+from collections import defaultdict
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from ariadne_django.compat import get_running_loop
+
+
+class BroadcastBackend:
+    """
+    Interface of broadcaster backends, delivering messages published to a channel to its subscribers.
+
+    Backends using external services (eg. Redis or PostgreSQL LISTEN/NOTIFY) deliver messages
+    to subscribers in all processes.
+    """
+
+    async def publish(self, channel: str, message: Any):
+        raise NotImplementedError()
+
+    def subscribe(self, channel: str) -> AsyncIterator[Any]:
+        """
+        Returns asynchronous iterator of messages published to the channel after this call.
+        Subscription ends when the iterator is closed with ``aclose()``.
+        """
+        raise NotImplementedError()
+
+
+class MemorySubscription:
+    def __init__(self, backend: "MemoryBroadcastBackend", channel: str):
+        self.backend = backend
+        self.channel = channel
+        self.loop = get_running_loop()
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self.closed = False
+        backend.add_subscriber(channel, self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.closed:
+            raise StopAsyncIteration
+        return await self.queue.get()
+
+    def put(self, message: Any):
+        try:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+        except RuntimeError:
+            # Event loop of the subscriber is closed.
+            self.backend.remove_subscriber(self.channel, self)
+
+    async def aclose(self):
+        self.closed = True
+        self.backend.remove_subscriber(self.channel, self)
+
+
+class MemoryBroadcastBackend(BroadcastBackend):
+    """
+    Backend delivering messages to subscribers in the same process. Messages may be published from any thread.
+    """
+
+    def __init__(self):
+        self.subscribers: Dict[str, Set[MemorySubscription]] = defaultdict(set)
+        self._lock = Lock()
+
+    async def publish(self, channel: str, message: Any):
+        with self._lock:
+            subscribers = list(self.subscribers.get(channel, ()))
+        for subscriber in subscribers:
+            subscriber.put(message)
+
+    def subscribe(self, channel: str) -> MemorySubscription:
+        return MemorySubscription(self, channel)
+
+    def add_subscriber(self, channel: str, subscriber: MemorySubscription):
+        with self._lock:
+            self.subscribers[channel].add(subscriber)
+
+    def remove_subscriber(self, channel: str, subscriber: MemorySubscription):
+        with self._lock:
+            self.subscribers[channel].discard(subscriber)
+            if not self.subscribers[channel]:
+                del self.subscribers[channel]
+
+
+class Broadcaster:
+    """
+    Publishes messages to subscribers of channels. Subscription sources return ``subscribe()`` result::
+
+        @subscription.source("documentAdded")
+        def document_added_source(*_):
+            return broadcaster.subscribe("documents")
+    """
+
+    def __init__(self, backend: Optional[BroadcastBackend] = None):
+        self.backend = backend or MemoryBroadcastBackend()
+
+    async def publish(self, channel: str, message: Any):
+        await self.backend.publish(channel, message)
+
+    def subscribe(self, channel: str) -> AsyncIterator[Any]:
+        return self.backend.subscribe(channel)
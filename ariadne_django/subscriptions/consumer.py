@@ -0,0 +1,369 @@
+import asyncio
+import io
+from inspect import isawaitable
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Type, cast
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest
+
+from ariadne.format_error import format_error
+from ariadne.logger import log_error
+
+from graphql import ExecutionResult, GraphQLError, GraphQLSchema, OperationType, get_operation_ast
+
+from ariadne_django.compat import current_task
+from ariadne_django.execution import (
+    DocumentCache,
+    graphql,
+    parse_and_validate_query,
+    resolve_persisted_query,
+    subscribe,
+)
+from ariadne_django.views import GraphQLAsyncView
+
+
+GRAPHQL_TRANSPORT_WS = "graphql-transport-ws"
+GRAPHQL_WS = "graphql-ws"
+
+SUBSCRIBE_KWARGS = (
+    "context_value",
+    "root_value",
+    "debug",
+    "introspection",
+    "logger",
+    "validation_rules",
+    "error_formatter",
+    "middleware",
+    "extensions",
+    "document_cache",
+)
+
+
+class GraphQLWebSocketConsumer:
+    """
+    ASGI application executing GraphQL operations sent over WebSocket, with the graphql-transport-ws
+    and the legacy graphql-ws (subscriptions-transport-ws) protocols.
+
+    Schema, context value, extensions, error formatter and other options are taken from the view
+    created with ``view_class`` and ``initkwargs``, so the consumer serves operations just like
+    the HTTP view would. Context value is created for every operation, with the request wrapping
+    connection's scope, and the ``connection_init`` payload set as its ``connection_params``.
+    """
+
+    protocols = (GRAPHQL_TRANSPORT_WS, GRAPHQL_WS)
+
+    def __init__(
+        self,
+        view_class: Type[GraphQLAsyncView] = GraphQLAsyncView,
+        *,
+        on_connect: Optional[Callable[[HttpRequest, dict], Any]] = None,
+        connection_init_wait_timeout: float = 10,
+        keepalive_interval: Optional[float] = None,
+        **initkwargs,
+    ):
+        self.view = view_class(**initkwargs)
+        # Response cache is only used by HTTP requests, as its scope may depend on the lazily loaded user,
+        # which can't be loaded in the event loop, and its results are serialized for HTTP responses.
+        self.view.response_cache = None
+        if self.view.document_cache is None and self.view.document_cache_size:
+            self.view.document_cache = DocumentCache(self.view.document_cache_size)
+        self.on_connect = on_connect
+        self.connection_init_wait_timeout = connection_init_wait_timeout
+        self.keepalive_interval = keepalive_interval
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable):
+        if scope["type"] != "websocket":
+            raise ValueError("GraphQLWebSocketConsumer only handles WebSocket connections")
+
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+
+        protocol = self.select_protocol(scope.get("subprotocols") or [])
+        if protocol is None:
+            # Closing before accepting the connection rejects the handshake.
+            await send({"type": "websocket.close", "code": 4406})
+            return
+
+        await send({"type": "websocket.accept", "subprotocol": protocol})
+        connection_class = GraphQLTransportWSConnection if protocol == GRAPHQL_TRANSPORT_WS else GraphQLWSConnection
+        await connection_class(self, self.get_request(scope), send).run(receive)
+
+    def select_protocol(self, subprotocols: List[str]) -> Optional[str]:
+        for protocol in subprotocols:
+            if protocol in self.protocols:
+                return protocol
+        return None
+
+    def get_request(self, scope: dict) -> HttpRequest:
+        # Context value factories expect an HttpRequest, so the connection's scope is wrapped in one.
+        request = ASGIRequest({**scope, "method": "GET"}, io.BytesIO())
+        for name in ("user", "session"):
+            if name in scope:
+                setattr(request, name, scope[name])
+        request.connection_params = {}  # type: ignore
+        return request
+
+    async def connect(self, request: HttpRequest, payload: Any) -> bool:
+        request.connection_params = payload if isinstance(payload, dict) else {}  # type: ignore
+        if self.on_connect is None:
+            return True
+        result = self.on_connect(request, request.connection_params)  # type: ignore
+        if isawaitable(result):
+            result = await result
+        return result is not False
+
+    def get_kwargs_graphql(self, request: HttpRequest) -> dict:
+        kwargs = self.view.get_kwargs_graphql(request)
+        # Restrictions of GET requests don't apply to operations sent over WebSocket.
+        kwargs["allowed_operation_types"] = None
+        return kwargs
+
+    def get_operation_type(self, data: dict, kwargs: dict) -> Optional[OperationType]:
+        try:
+            document, _ = parse_and_validate_query(
+                self.schema,
+                data,
+                context_value=kwargs["context_value"],
+                validation_rules=kwargs["validation_rules"],
+                introspection=kwargs["introspection"],
+                document_cache=kwargs["document_cache"],
+            )
+        except GraphQLError:
+            return None
+        operation = get_operation_ast(document, data.get("operationName"))
+        return operation.operation if operation else None
+
+    @property
+    def schema(self) -> GraphQLSchema:
+        return self.view.get_schema()
+
+    def format_error(self, error: Exception) -> dict:
+        if not isinstance(error, GraphQLError):
+            error = GraphQLError(str(error), original_error=error)
+        log_error(error, self.view.logger)
+        return (self.view.error_formatter or format_error)(error, settings.DEBUG)
+
+    def format_result(self, result: ExecutionResult, kwargs: dict) -> dict:
+        response: Dict[str, Any] = {"data": result.data}
+        if result.errors:
+            for error in result.errors:
+                log_error(error, kwargs["logger"])
+            response["errors"] = [kwargs["error_formatter"](error, kwargs["debug"]) for error in result.errors]
+        if result.extensions:
+            response["extensions"] = result.extensions
+        return response
+
+
+class BaseConnection:
+    def __init__(self, consumer: GraphQLWebSocketConsumer, request: HttpRequest, send: Callable):
+        self.consumer = consumer
+        self.request = request
+        self._send = send
+        self.acknowledged = False
+        self.closed = False
+        self.operations: Dict[str, "asyncio.Task[None]"] = {}
+        self.tasks: List["asyncio.Future[None]"] = []
+
+    async def run(self, receive: Callable):
+        try:
+            await self.on_open()
+            while not self.closed:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message["type"] == "websocket.receive":
+                    await self.receive(message.get("text") or (message.get("bytes") or b"").decode("utf-8"))
+        finally:
+            self.closed = True
+            for task in [*self.operations.values(), *self.tasks]:
+                task.cancel()
+
+    async def on_open(self):
+        pass
+
+    async def receive(self, text: str):
+        try:
+            message = self.consumer.view.json_codec.loads(text)
+        except (TypeError, ValueError):
+            message = None
+        if not isinstance(message, dict):
+            await self.handle_invalid_message("Invalid message")
+            return
+        await self.handle_message(message)
+
+    async def handle_message(self, message: dict):
+        raise NotImplementedError()
+
+    async def handle_invalid_message(self, reason: str):
+        raise NotImplementedError()
+
+    async def send_json(self, message: dict):
+        if not self.closed:
+            await self._send({"type": "websocket.send", "text": self.consumer.view.json_codec.dumps(message).decode()})
+
+    async def close(self, code: int, reason: str = ""):
+        if not self.closed:
+            self.closed = True
+            await self._send({"type": "websocket.close", "code": code, "reason": reason})
+
+    def start_operation(self, operation_id: str, payload: dict):
+        self.operations[operation_id] = asyncio.ensure_future(self.run_operation(operation_id, payload))
+
+    def stop_operation(self, operation_id: str):
+        task = self.operations.pop(operation_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def run_operation(self, operation_id: str, payload: dict):
+        try:
+            kwargs = self.consumer.get_kwargs_graphql(self.request)
+            completed = await self.execute_operation(operation_id, payload, kwargs)
+        except Exception as error:  # pylint: disable=broad-except
+            # Unexpected errors end the operation with an error message, instead of leaving the client waiting.
+            await self.send_errors(operation_id, [self.consumer.format_error(error)])
+            completed = False
+        finally:
+            if self.operations.get(operation_id) is current_task():
+                del self.operations[operation_id]
+        if completed:
+            await self.send_complete(operation_id)
+
+    async def execute_operation(self, operation_id: str, payload: dict, kwargs: dict) -> bool:
+        consumer = self.consumer
+        data = resolve_persisted_query(payload, kwargs.pop("persisted_queries"))
+        operation_type = consumer.get_operation_type(data, kwargs) if isinstance(data.get("query"), str) else None
+        if operation_type != OperationType.SUBSCRIPTION:
+            success, result = await graphql(consumer.schema, data, **kwargs)
+            if not success:
+                await self.send_errors(operation_id, result["errors"])
+                return False
+            await self.send_result(operation_id, result)
+            return True
+
+        subscribe_kwargs = {name: kwargs[name] for name in SUBSCRIBE_KWARGS}
+        success, results = await subscribe(consumer.schema, data, **subscribe_kwargs)
+        if not success:
+            await self.send_errors(operation_id, cast(List[dict], results))
+            return False
+
+        try:
+            async for result in cast(AsyncGenerator, results):
+                await self.send_result(operation_id, consumer.format_result(result, kwargs))
+        finally:
+            await cast(AsyncGenerator, results).aclose()
+        return True
+
+    async def send_result(self, operation_id: str, result: dict):
+        raise NotImplementedError()
+
+    async def send_errors(self, operation_id: str, errors: List[dict]):
+        raise NotImplementedError()
+
+    async def send_complete(self, operation_id: str):
+        await self.send_json({"type": "complete", "id": operation_id})
+
+
+class GraphQLTransportWSConnection(BaseConnection):
+    """
+    Connection using the graphql-transport-ws protocol (https://github.com/enisdenjo/graphql-ws).
+    """
+
+    init_received = False
+
+    async def on_open(self):
+        self.tasks.append(asyncio.ensure_future(self.close_if_not_initialized()))
+
+    async def close_if_not_initialized(self):
+        await asyncio.sleep(self.consumer.connection_init_wait_timeout)
+        if not self.acknowledged:
+            await self.close(4408, "Connection initialisation timeout")
+
+    async def handle_message(self, message: dict):
+        message_type = message.get("type")
+        if message_type == "connection_init":
+            if self.init_received:
+                await self.close(4429, "Too many initialisation requests")
+                return
+            self.init_received = True
+            if not await self.consumer.connect(self.request, message.get("payload")):
+                await self.close(4403, "Forbidden")
+                return
+            self.acknowledged = True
+            await self.send_json({"type": "connection_ack"})
+        elif message_type == "ping":
+            await self.send_json({"type": "pong"})
+        elif message_type == "pong":
+            pass
+        elif message_type == "subscribe":
+            operation_id, payload = message.get("id"), message.get("payload")
+            if not self.acknowledged:
+                await self.close(4401, "Unauthorized")
+            elif not isinstance(operation_id, str) or not isinstance(payload, dict):
+                await self.handle_invalid_message("Invalid subscribe message")
+            elif operation_id in self.operations:
+                await self.close(4409, "Subscriber for {} already exists".format(operation_id))
+            else:
+                self.start_operation(operation_id, payload)
+        elif message_type == "complete":
+            self.stop_operation(message.get("id"))  # type: ignore
+        else:
+            await self.handle_invalid_message("Invalid message type")
+
+    async def handle_invalid_message(self, reason: str):
+        await self.close(4400, reason)
+
+    async def send_result(self, operation_id: str, result: dict):
+        await self.send_json({"type": "next", "id": operation_id, "payload": result})
+
+    async def send_errors(self, operation_id: str, errors: List[dict]):
+        await self.send_json({"type": "error", "id": operation_id, "payload": errors})
+
+
+class GraphQLWSConnection(BaseConnection):
+    """
+    Connection using the legacy graphql-ws protocol (https://github.com/apollographql/subscriptions-transport-ws).
+    """
+
+    async def handle_message(self, message: dict):
+        message_type = message.get("type")
+        if message_type == "connection_init":
+            if not await self.consumer.connect(self.request, message.get("payload")):
+                await self.send_json({"type": "connection_error", "payload": {"message": "Forbidden"}})
+                await self.close(4403, "Forbidden")
+                return
+            self.acknowledged = True
+            await self.send_json({"type": "connection_ack"})
+            if self.consumer.keepalive_interval:
+                self.tasks.append(asyncio.ensure_future(self.keepalive()))
+        elif message_type == "start":
+            operation_id, payload = message.get("id"), message.get("payload")
+            if not self.acknowledged:
+                await self.close(4401, "Unauthorized")
+            elif not isinstance(operation_id, str) or not isinstance(payload, dict):
+                await self.handle_invalid_message("Invalid start message")
+            else:
+                # Operation started with id of an active operation replaces it.
+                self.stop_operation(operation_id)
+                self.start_operation(operation_id, payload)
+        elif message_type == "stop":
+            self.stop_operation(message.get("id"))  # type: ignore
+        elif message_type == "connection_terminate":
+            await self.close(1000)
+        else:
+            await self.handle_invalid_message("Invalid message type")
+
+    async def keepalive(self):
+        while not self.closed:
+            await self.send_json({"type": "ka"})
+            await asyncio.sleep(cast(float, self.consumer.keepalive_interval))
+
+    async def handle_invalid_message(self, reason: str):
+        await self.send_json({"type": "connection_error", "payload": {"message": reason}})
+
+    async def send_result(self, operation_id: str, result: dict):
+        await self.send_json({"type": "data", "id": operation_id, "payload": result})
+
+    async def send_errors(self, operation_id: str, errors: List[dict]):
+        await self.send_json({"type": "error", "id": operation_id, "payload": errors})
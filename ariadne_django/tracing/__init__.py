@@ -0,0 +1,5 @@
+# flake8: noqa: E501
+from .extension import TracingExtension
+from .metrics import Histogram, MetricsRegistry, default_metrics
+from .queries import QueryCountingExtension, get_statement_shape
+from .views import MetricsView
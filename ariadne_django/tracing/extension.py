@@ -0,0 +1,102 @@
+from inspect import isawaitable
+from random import random
+from time import perf_counter
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+from ariadne.contrib.tracing.utils import should_trace
+from ariadne.types import ContextValue, Extension, Resolver
+
+from graphql import GraphQLError, GraphQLResolveInfo, OperationDefinitionNode
+
+from .metrics import MetricsRegistry, default_metrics
+
+
+UNKNOWN_OPERATION = "unknown"
+ANONYMOUS_OPERATION = "anonymous"
+
+
+class TracingExtension(Extension):
+    """
+    Extension recording durations of operations and their phases in MetricsRegistry for every request,
+    and durations of resolvers for the ``sample_rate`` fraction of requests.
+    Configure it with ``functools.partial(TracingExtension, sample_rate=0.1)``.
+
+    Resolver durations are collected in the extension and added to the histograms once the request is finished.
+    Resolvers are wrapped in coroutines only if they return awaitables, so same extension is used
+    by both GraphQLView and GraphQLAsyncView.
+    """
+
+    def __init__(
+        self,
+        *,
+        metrics: MetricsRegistry = default_metrics,
+        sample_rate: float = 1.0,
+        trace_default_resolvers: bool = False,
+    ):
+        self.metrics = metrics
+        self.sampled = sample_rate >= 1 or random() < sample_rate
+        self.trace_default_resolvers = trace_default_resolvers
+        self.operation: Optional[OperationDefinitionNode] = None
+        self.status = "success"
+        self.start_time = 0.0
+        self.phase_start_times: Dict[str, float] = {}
+        self.phase_durations: List[Tuple[str, float]] = []
+        self.resolver_durations: List[Tuple[Tuple[str, ...], float]] = []
+
+    def request_started(self, context: ContextValue):
+        self.start_time = perf_counter()
+
+    def phase_started(self, phase: str, context: ContextValue):  # pylint: disable=unused-argument
+        self.phase_start_times[phase] = perf_counter()
+
+    def phase_finished(self, phase: str, context: ContextValue):  # pylint: disable=unused-argument
+        self.phase_durations.append((phase, perf_counter() - self.phase_start_times.pop(phase)))
+
+    def has_errors(self, errors: List[GraphQLError], context: ContextValue):
+        self.status = "error"
+
+    def request_finished(self, context: ContextValue):
+        duration = perf_counter() - self.start_time
+        operation = self.metrics.get_operation_label(self.get_operation_name())
+        self.metrics.operation_duration.observe(duration, operation, self.status)
+        self.metrics.phase_duration.observe_many(((operation, phase), value) for phase, value in self.phase_durations)
+        if self.resolver_durations:
+            self.metrics.resolver_duration.observe_many(self.resolver_durations)
+
+    def get_operation_name(self) -> str:
+        if self.operation is None:
+            return UNKNOWN_OPERATION
+        if self.operation.name is None:
+            return ANONYMOUS_OPERATION
+        return self.operation.name.value
+
+    def should_trace(self, info: GraphQLResolveInfo) -> bool:
+        if self.operation is None:
+            self.operation = info.operation
+        return self.sampled and should_trace(info, self.trace_default_resolvers)
+
+    def record_resolver(self, info: GraphQLResolveInfo, duration: float):
+        self.resolver_durations.append((("{}.{}".format(info.parent_type.name, info.field_name),), duration))
+
+    def resolve(  # type: ignore[override] # pylint: disable=invalid-overridden-method
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):
+        if not self.should_trace(info):
+            return next_(obj, info, **kwargs)
+
+        start_time = perf_counter()
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            self.record_resolver(info, perf_counter() - start_time)
+            raise
+        if isawaitable(result):
+            return self.resolve_async(result, info, start_time)
+        self.record_resolver(info, perf_counter() - start_time)
+        return result
+
+    async def resolve_async(self, result: Awaitable, info: GraphQLResolveInfo, start_time: float):
+        try:
+            return await result
+        finally:
+            self.record_resolver(info, perf_counter() - start_time)
@@ -0,0 +1,146 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RESOLVER_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+OTHER_OPERATIONS = "other"
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    return ",".join('{}="{}"'.format(name, escape_label_value(value)) for name, value in labels)
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """
+    In-process histogram with a series of cumulative buckets for every combination of label values.
+    """
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *label_values: str):
+        self.observe_many([(label_values, value)])
+
+    def observe_many(self, observations: Iterable[Tuple[Tuple[str, ...], float]]):
+        # Series hold counts of values falling into every bucket (with +Inf as the last one), followed by their sum.
+        with self._lock:
+            for label_values, value in observations:
+                series = self._series.get(label_values)
+                if series is None:
+                    series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+                series[bisect_left(self.buckets, value)] += 1
+                series[-1] += value
+
+    def get_count(self, *label_values: str) -> int:
+        with self._lock:
+            series = self._series.get(label_values)
+            return int(sum(series[:-1])) if series else 0
+
+    def get_sum(self, *label_values: str) -> float:
+        with self._lock:
+            series = self._series.get(label_values)
+            return series[-1] if series else 0.0
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        lines = [
+            "# HELP {} {}".format(self.name, self.documentation),
+            "# TYPE {} histogram".format(self.name),
+        ]
+        with self._lock:
+            series = sorted((label_values, list(values)) for label_values, values in self._series.items())
+        for label_values, values in series:
+            labels = list(zip(self.label_names, label_values))
+            count = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), values):
+                count += int(bucket_count)
+                lines.append(
+                    "{}_bucket{{{}}} {}".format(
+                        self.name, format_labels(labels + [("le", format_value(upper_bound))]), count
+                    )
+                )
+            suffix = "{{{}}}".format(format_labels(labels)) if labels else ""
+            lines.append("{}_sum{} {}".format(self.name, suffix, format_value(values[-1])))
+            lines.append("{}_count{} {}".format(self.name, suffix, count))
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Histograms of operation, phase and resolver durations recorded by TracingExtension.
+
+    Operation names are sent by clients, so only the first ``max_operations`` distinct names
+    are used as label values and the remaining operations are recorded as ``other``.
+    Metrics are kept in memory of the process, each worker process exposes its own.
+    """
+
+    def __init__(self, *, max_operations: int = 100, resolver_buckets: Sequence[float] = RESOLVER_BUCKETS):
+        self.max_operations = max_operations
+        self.operation_duration = Histogram(
+            "graphql_operation_duration_seconds",
+            "Duration of GraphQL operations.",
+            ("operation", "status"),
+        )
+        self.phase_duration = Histogram(
+            "graphql_phase_duration_seconds",
+            "Duration of parsing, validation and execution phases of GraphQL operations.",
+            ("operation", "phase"),
+        )
+        self.resolver_duration = Histogram(
+            "graphql_resolver_duration_seconds",
+            "Duration of GraphQL field resolvers in sampled operations.",
+            ("field",),
+            resolver_buckets,
+        )
+        self._operations: set = set()
+        self._lock = Lock()
+
+    def get_operation_label(self, operation_name: str) -> str:
+        if operation_name in self._operations:
+            return operation_name
+        with self._lock:
+            if len(self._operations) >= self.max_operations:
+                return OTHER_OPERATIONS
+            self._operations.add(operation_name)
+        return operation_name
+
+    def histograms(self) -> List[Histogram]:
+        return [self.operation_duration, self.phase_duration, self.resolver_duration]
+
+    def clear(self):
+        for histogram in self.histograms():
+            histogram.clear()
+        with self._lock:
+            self._operations.clear()
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for histogram in self.histograms():
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+
+default_metrics = MetricsRegistry()
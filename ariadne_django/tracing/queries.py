@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import re
+from contextvars import ContextVar
+from functools import partial
+from inspect import isawaitable
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+
+from ariadne.contrib.tracing.utils import format_path, is_introspection_field
+from ariadne.types import ContextValue, Extension, Resolver
+
+from asgiref.sync import sync_to_async
+from graphql import GraphQLResolveInfo
+
+
+IN_PLACEHOLDERS_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+
+current_collector: ContextVar[Optional["QueryCountingExtension"]] = ContextVar("current_collector", default=None)
+current_path: ContextVar[Optional[str]] = ContextVar("current_path", default=None)
+
+
+def get_statement_shape(sql: str) -> str:
+    """
+    Returns SQL statement with lists of placeholders of IN clauses collapsed, so statements
+    differing only in number of values have the same shape.
+    """
+    return IN_PLACEHOLDERS_RE.sub("(...)", sql)
+
+
+def get_field_path(info: GraphQLResolveInfo) -> str:
+    return ".".join("*" if isinstance(key, int) else key for key in format_path(info.path))
+
+
+def execute_wrapper(  # pylint: disable=too-many-positional-arguments
+    collector: "QueryCountingExtension", execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]
+):
+    # Connections may be shared by concurrent operations, so queries are only recorded by their collector.
+    if current_collector.get() is not collector:
+        return execute(sql, params, many, context)
+    start_time = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        collector.record_query(current_path.get(), sql, perf_counter() - start_time)
+
+
+def count_queries_for_path(queryset: QuerySet, path: str) -> QuerySet:
+    """
+    Returns copy of the lazy QuerySet, which records queries executed when it's evaluated for the path
+    of the field returning it, without evaluating it.
+    """
+    queryset = queryset.all()
+    fetch_all = queryset._fetch_all  # pylint: disable=protected-access
+
+    def fetch_all_for_path():
+        token = current_path.set(path)
+        try:
+            fetch_all()
+        finally:
+            current_path.reset(token)
+
+    queryset._fetch_all = fetch_all_for_path  # type: ignore # pylint: disable=protected-access
+    return queryset
+
+
+class QueryCountingExtension(Extension):
+    """
+    Extension counting SQL queries and their duration per resolver path, and detecting N+1 queries:
+    statements of the same shape executed ``n_plus_one_threshold`` or more times by a field of list items.
+
+    Summary is added to the response extensions as ``sqlQueries`` when ``settings.DEBUG`` is enabled
+    (or ``report`` is True), and logged as a warning when the operation executes ``log_threshold``
+    or more queries or N+1 queries are detected.
+
+    Queries are recorded by the execute wrapper, applied to database connections of the thread executing
+    the operation and of threads running synchronous code of ``GraphQLAsyncView`` resolvers
+    (``sync_to_async`` and the resolver thread pool) until the operation is finished.
+    Lazy QuerySets returned by resolvers are not evaluated by the extension.
+    """
+
+    def __init__(
+        self,
+        *,
+        report: Optional[bool] = None,
+        log_threshold: Optional[int] = 50,
+        n_plus_one_threshold: int = 2,
+        logger: Optional[str] = None,
+    ):
+        self.report = settings.DEBUG if report is None else report
+        self.log_threshold = log_threshold
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.logger = logger
+        self.count = 0
+        self.duration = 0.0
+        self.paths: Dict[str, List[Any]] = {}
+        self.shapes: Dict[Tuple[str, str], int] = {}
+        self._collector_token = None
+        self._summary: Optional[dict] = None
+        self._execute_wrapper = partial(execute_wrapper, self)
+        self._wrapped_connections: List[Any] = []
+        self._thread_wrapper_installed: Optional[Awaitable] = None
+
+    def request_started(self, context: ContextValue):  # pylint: disable=unused-argument
+        self.install_execute_wrapper()
+        self._collector_token = current_collector.set(self)
+
+    def request_finished(self, context: ContextValue):  # pylint: disable=unused-argument
+        if self._collector_token is not None:
+            current_collector.reset(self._collector_token)
+            self._collector_token = None
+        self.uninstall_execute_wrapper()
+        if self.log_threshold is None:
+            return
+        summary = self.get_summary()
+        if summary["count"] >= self.log_threshold or summary["nPlusOne"]:
+            logging.getLogger(self.logger or "ariadne_django").warning(
+                "GraphQL operation executed %d SQL queries in %.3f s, with N+1 queries in fields: %s",
+                summary["count"],
+                summary["duration"],
+                ", ".join(item["path"] for item in summary["nPlusOne"]) or "none",
+                extra={"sql_queries": summary},
+            )
+
+    def install_execute_wrapper(self):
+        """
+        Applies the execute wrapper to database connections of the current thread, until the operation is finished.
+        """
+        # Wrappers are removed by the thread finishing the operation, and operations executed concurrently
+        # in the event loop don't finish in order, so wrappers are not applied with ``connection.execute_wrapper()``.
+        for connection in connections.all():
+            if self._execute_wrapper not in connection.execute_wrappers:
+                connection.execute_wrappers.append(self._execute_wrapper)
+                self._wrapped_connections.append(connection)
+
+    def uninstall_execute_wrapper(self):
+        for connection in self._wrapped_connections:
+            if self._execute_wrapper in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self._execute_wrapper)
+        self._wrapped_connections = []
+
+    def resolve(  # type: ignore[override] # pylint: disable=invalid-overridden-method
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ):
+        if is_introspection_field(info):
+            return next_(obj, info, **kwargs)
+
+        path = get_field_path(info)
+        token = current_path.set(path)
+        try:
+            result = next_(obj, info, **kwargs)
+        finally:
+            current_path.reset(token)
+        if isawaitable(result):
+            return self.resolve_async(result, path)
+        if isinstance(result, QuerySet) and result._result_cache is None:  # pylint: disable=protected-access
+            # Queries of lazy QuerySets are executed when they are evaluated, after the resolver returns.
+            return count_queries_for_path(result, path)
+        return result
+
+    async def resolve_async(self, result: Awaitable, path: str):
+        # Synchronous code called with ``sync_to_async`` runs in a single thread per request, so its
+        # connections are wrapped once for the operation.
+        if self._thread_wrapper_installed is None:
+            self._thread_wrapper_installed = asyncio.ensure_future(sync_to_async(self.install_execute_wrapper)())
+        await self._thread_wrapper_installed
+
+        token = current_path.set(path)
+        try:
+            return await result
+        finally:
+            current_path.reset(token)
+
+    def record_query(self, path: Optional[str], sql: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        if path is None:
+            return
+        stats = self.paths.setdefault(path, [0, 0.0])
+        stats[0] += 1
+        stats[1] += duration
+        if "*" in path:
+            key = (path, get_statement_shape(sql))
+            self.shapes[key] = self.shapes.get(key, 0) + 1
+
+    def get_summary(self) -> dict:
+        if self._summary is None:
+            self._summary = {
+                "count": self.count,
+                "duration": self.duration,
+                "resolvers": [
+                    {"path": path, "count": count, "duration": duration}
+                    for path, (count, duration) in self.paths.items()
+                ],
+                "nPlusOne": [
+                    {"path": path, "sql": sql, "count": count}
+                    for (path, sql), count in self.shapes.items()
+                    if count >= self.n_plus_one_threshold
+                ],
+            }
+        return self._summary
+
+    def format(self, context: ContextValue) -> dict:
+        if not self.report:
+            return {}
+        return {"sqlQueries": self.get_summary()}
@@ -0,0 +1,26 @@
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.views import View
+
+from .metrics import MetricsRegistry, default_metrics
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsView(View):
+    """
+    Exposes histograms of MetricsRegistry in the Prometheus text exposition format.
+
+    Metrics reveal names of operations, so only staff users can access them, unless the view
+    is created with ``staff_only=False`` (eg. for scrapers without a session, when access
+    to the view is restricted otherwise).
+    """
+
+    http_method_names = ["get", "head", "options"]
+    metrics: MetricsRegistry = default_metrics
+    staff_only: bool = True
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:  # pylint: disable=unused-argument
+        if self.staff_only and not getattr(getattr(request, "user", None), "is_staff", False):
+            return HttpResponseForbidden()
+        return HttpResponse(self.metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
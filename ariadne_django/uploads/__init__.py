@@ -0,0 +1,3 @@
+# flake8: noqa: E501
+from .handlers import StoredUploadedFile, StorageUploadHandler
+from .parser import MultipartUploadParser
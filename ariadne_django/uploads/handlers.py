@@ -0,0 +1,97 @@
+import os
+import posixpath
+from typing import Optional
+
+from django.core.files.storage import Storage, default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.http import HttpRequest
+
+
+class StoredUploadedFile(UploadedFile):
+    """
+    File uploaded straight to the storage. It's saved under ``storage_name`` and opened on first use.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        storage_name: str,
+        name: str,
+        content_type: str,
+        size: int,
+        charset: Optional[str],
+        content_type_extra: Optional[dict] = None,
+    ):
+        super().__init__(None, name, content_type, size, charset, content_type_extra)
+        self.storage = storage
+        self.storage_name = storage_name
+
+    def open(self, mode="rb"):
+        self.file = self.storage.open(self.storage_name, mode)
+        return self
+
+    def read(self, *args, **kwargs):
+        if self.file is None:
+            self.open()
+        return self.file.read(*args, **kwargs)
+
+    def chunks(self, chunk_size=None):
+        if self.file is None:
+            self.open()
+        return super().chunks(chunk_size)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+    def delete(self):
+        self.close()
+        self.storage.delete(self.storage_name)
+
+
+class StorageUploadHandler(FileUploadHandler):
+    """
+    Upload handler writing received chunks straight to the file opened for writing in the storage.
+    """
+
+    def __init__(self, request: Optional[HttpRequest] = None, storage: Optional[Storage] = None, upload_to: str = ""):
+        super().__init__(request)
+        self.storage = storage or default_storage
+        self.upload_to = upload_to
+        self.storage_name = ""
+        self.file = None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        name = self.storage.generate_filename(posixpath.join(self.upload_to, self.file_name))
+        self.storage_name = self.storage.get_available_name(name)
+        try:
+            path = self.storage.path(self.storage_name)
+        except NotImplementedError:
+            pass
+        else:
+            # Local storages don't create missing directories for files opened for writing.
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file = self.storage.open(self.storage_name, "wb")
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.close()
+        self.file = None
+        return StoredUploadedFile(
+            self.storage,
+            self.storage_name,
+            self.file_name,
+            self.content_type,
+            file_size,
+            self.charset,
+            self.content_type_extra,
+        )
+
+    def upload_interrupted(self):
+        if self.file is not None:
+            self.file.close()
+            self.storage.delete(self.storage_name)
@@ -0,0 +1,154 @@
+import posixpath
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.http import HttpRequest
+from django.http.multipartparser import FIELD, FILE, ChunkIter, LazyStream, MultiPartParserError, Parser, exhaust
+from django.utils.encoding import force_str
+
+from ariadne.exceptions import HttpBadRequestError
+from ariadne.file_uploads import SPEC_URL
+
+from ariadne_django.codecs import JSONCodec
+
+from .handlers import StoredUploadedFile
+
+
+Operations = Union[dict, list]
+
+
+class MultipartUploadParser:
+    """
+    Parses GraphQL multipart request, streaming every file to a new upload handler as it's received.
+
+    The ``operations`` and ``map`` fields have to precede files, so they are validated before any
+    file is read. Files that are not mapped, or exceed the maximum size or number of files,
+    fail the request as soon as they are encountered. Files of operations rejected by
+    ``validate_operations`` are skipped without being stored.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        create_upload_handler: Callable[[HttpRequest], FileUploadHandler],
+        *,
+        json_codec: JSONCodec,
+        max_file_size: Optional[int] = None,
+        max_files: Optional[int] = None,
+        validate_operations: Optional[Callable[[Operations], bool]] = None,
+    ):
+        self.request = request
+        self.create_upload_handler = create_upload_handler
+        self.json_codec = json_codec
+        self.max_file_size = max_file_size
+        self.max_files = max_files
+        self.validate_operations = validate_operations
+        self.files: Dict[str, Optional[UploadedFile]] = {}
+
+    def parse(self) -> Tuple[Operations, dict, Dict[str, Optional[UploadedFile]]]:
+        try:
+            return self._parse()
+        except Exception:
+            for uploaded_file in self.files.values():
+                if isinstance(uploaded_file, StoredUploadedFile):
+                    uploaded_file.delete()
+                elif uploaded_file is not None:
+                    uploaded_file.close()
+            raise
+
+    def _parse(self) -> Tuple[Operations, dict, Dict[str, Optional[UploadedFile]]]:
+        boundary = self.request.content_params.get("boundary") if self.request.content_params else None
+        if not boundary:
+            raise HttpBadRequestError("Request multipart boundary is missing")
+
+        fields: Dict[str, Any] = {}
+        store_files = True
+        stream = LazyStream(ChunkIter(self.request, self.chunk_size))
+        try:
+            for item_type, meta_data, field_stream in Parser(stream, boundary.encode("ascii")):
+                try:
+                    disposition = meta_data["content-disposition"][1]
+                    field_name = force_str(disposition["name"].strip(), errors="replace")
+                except (KeyError, IndexError, AttributeError):
+                    continue
+
+                if item_type == FIELD and field_name in ("operations", "map"):
+                    fields[field_name] = self.read_json_field(field_name, field_stream)
+                    if len(fields) == 2:
+                        self.validate_files_map(fields["map"])
+                        if self.validate_operations is not None:
+                            store_files = self.validate_operations(fields["operations"])
+                elif item_type == FILE:
+                    if len(fields) < 2:
+                        raise HttpBadRequestError(
+                            "Request 'operations' and 'map' multipart fields must precede files ({}).".format(SPEC_URL)
+                        )
+                    self.validate_file(field_name, fields["map"])
+                    if store_files:
+                        self.files[field_name] = self.receive_file(field_name, disposition, meta_data, field_stream)
+                    else:
+                        self.files[field_name] = None
+                        exhaust(field_stream)
+                else:
+                    exhaust(field_stream)
+        except MultiPartParserError as ex:
+            raise HttpBadRequestError("Request multipart body is not valid") from ex
+
+        if len(fields) < 2:
+            raise HttpBadRequestError("Request 'operations' and 'map' multipart fields are required")
+        return fields["operations"], fields["map"], self.files
+
+    def read_json_field(self, field_name: str, field_stream) -> Any:
+        max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        data = field_stream.read(size=max_size + 1 if max_size is not None else None)
+        if max_size is not None and len(data) > max_size:
+            raise HttpBadRequestError("Request '{}' multipart field is too large".format(field_name))
+        try:
+            return self.json_codec.loads(data)
+        except (TypeError, ValueError) as ex:
+            raise HttpBadRequestError("Request '{}' multipart field is not a valid JSON".format(field_name)) from ex
+
+    def validate_files_map(self, files_map: Any):
+        if not isinstance(files_map, dict):
+            raise HttpBadRequestError("Invalid type for the 'map' multipart field ({}).".format(SPEC_URL))
+        if self.max_files is not None and len(files_map) > self.max_files:
+            raise HttpBadRequestError("Request exceeds the limit of {} files".format(self.max_files))
+
+    def validate_file(self, field_name: str, files_map: dict):
+        if field_name not in files_map:
+            raise HttpBadRequestError("File '{}' is not in the 'map' multipart field".format(field_name))
+        if field_name in self.files:
+            raise HttpBadRequestError("File '{}' is sent more than once".format(field_name))
+
+    def receive_file(self, field_name: str, disposition: dict, meta_data: dict, field_stream) -> Optional[UploadedFile]:
+        content_type, content_type_extra = meta_data.get("content-type", ("", {}))
+        file_name = posixpath.basename(
+            force_str(disposition.get("filename") or "", errors="replace").replace("\\", "/")
+        )
+        handler = self.create_upload_handler(self.request)
+        handler.new_file(
+            field_name,
+            file_name if file_name not in ("", ".", "..") else field_name,
+            content_type.strip(),
+            None,
+            content_type_extra.get("charset"),
+            content_type_extra,
+        )
+
+        size = 0
+        try:
+            for chunk in field_stream:
+                size += len(chunk)
+                if self.max_file_size is not None and size > self.max_file_size:
+                    raise HttpBadRequestError(
+                        "File '{}' exceeds the maximum size of {} bytes".format(field_name, self.max_file_size)
+                    )
+                handler.receive_data_chunk(chunk, size - len(chunk))
+        except Exception:
+            handler.upload_interrupted()
+            raise
+        return handler.file_complete(size)
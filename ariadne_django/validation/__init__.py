@@ -0,0 +1,3 @@
+# flake8: noqa: E501
+from .cost import CostValidator, cost_directive, cost_validator
+from .limits import QueryLimitsValidator, query_limits_validator
@@ -0,0 +1,228 @@
+import json
+from functools import lru_cache
+from typing import Any, Collection, Dict, List, Optional, Tuple, Type, cast
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    TypeInfo,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_list_type,
+)
+from graphql.execution.values import get_argument_values, get_directive_values, get_variable_values
+from graphql.validation import ValidationContext, ValidationRule
+
+
+cost_directive = """
+directive @cost(complexity: Int, multipliers: [String!], useMultipliers: Boolean) on FIELD_DEFINITION
+"""
+
+DEFAULT_MULTIPLIERS = ("first", "last", "limit")
+
+CostMap = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+class CostValidator(ValidationRule):
+    """
+    Rejects operations with cost exceeding the maximum cost.
+
+    Cost of a field is its complexity plus the cost of its selections, multiplied by the values of its
+    multiplier arguments. Complexity and multipliers are set with the ``@cost`` directive in the schema
+    or in the cost map (``{"Type": {"field": {"complexity": 2, "multipliers": ["first"]}}}``).
+    Other fields cost ``default_complexity``, or ``default_cost`` if they have no selections, and list
+    fields are multiplied by their ``first``, ``last`` or ``limit`` argument.
+
+    Values of variables are not known when the document is validated, so multipliers set by variables
+    are validated with their values by ``validate_variables``, after the document is validated.
+    """
+
+    maximum_cost: int = 0
+    default_cost: int = 0
+    default_complexity: int = 1
+    default_multipliers: Collection[str] = DEFAULT_MULTIPLIERS
+    variables: Optional[Dict[str, Any]] = None
+    cost_map: Optional[CostMap] = None
+
+    def __init__(self, context: ValidationContext):
+        super().__init__(context)
+        self.fragment_costs: Dict[Tuple[str, str], int] = {}
+
+    @classmethod
+    def validate_variables(
+        cls,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> List[GraphQLError]:
+        """
+        Validates cost of the operation with values of its variables.
+        """
+        operation = get_operation_ast(document, operation_name)
+        if operation is None or not operation.variable_definitions:
+            return []
+        variable_values = get_variable_values(schema, operation.variable_definitions, variables or {})
+        if isinstance(variable_values, list):
+            # Invalid variables are reported by the executor.
+            return []
+        errors: List[GraphQLError] = []
+        rule = cls(ValidationContext(schema, document, TypeInfo(schema), errors.append))
+        rule.variables = variable_values
+        rule.enter_operation_definition(operation)
+        return errors
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args):
+        schema = self.context.schema
+        if node.operation == OperationType.QUERY:
+            root_type = schema.query_type
+        elif node.operation == OperationType.MUTATION:
+            root_type = schema.mutation_type
+        else:
+            root_type = schema.subscription_type
+        if root_type is None:
+            return
+
+        cost = self.compute_selection_set_cost(node.selection_set, root_type)
+        if cost > self.maximum_cost:
+            self.report_error(
+                GraphQLError(
+                    "The query exceeds the maximum cost of {}. Actual cost is {}".format(self.maximum_cost, cost),
+                    node,
+                    extensions={"cost": {"requestedQueryCost": cost, "maximumAvailable": self.maximum_cost}},
+                )
+            )
+
+    def compute_selection_set_cost(self, selection_set: Optional[SelectionSetNode], parent_type) -> int:
+        if selection_set is None:
+            return 0
+        total = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                total += self.compute_field_cost(selection, parent_type)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = self.context.schema.get_type(selection.type_condition.name.value) or parent_type
+                total += self.compute_selection_set_cost(selection.selection_set, fragment_type)
+            elif isinstance(selection, FragmentSpreadNode):
+                total += self.compute_fragment_cost(selection.name.value, parent_type)
+        return total
+
+    def compute_fragment_cost(self, name: str, parent_type: GraphQLNamedType) -> int:
+        key = (name, parent_type.name)
+        if key not in self.fragment_costs:
+            # Guards against fragment cycles, which are reported by other validation rules.
+            self.fragment_costs[key] = 0
+            fragment = self.context.get_fragment(name)
+            if fragment is not None:
+                fragment_type = self.context.schema.get_type(fragment.type_condition.name.value) or parent_type
+                self.fragment_costs[key] = self.compute_selection_set_cost(fragment.selection_set, fragment_type)
+        return self.fragment_costs[key]
+
+    def compute_field_cost(self, node: FieldNode, parent_type) -> int:
+        if not isinstance(parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
+            return 0
+        field = parent_type.fields.get(node.name.value)
+        if field is None:
+            return 0
+
+        field_cost = self.get_field_cost_args(parent_type.name, node.name.value, field)
+        if field_cost is None:
+            complexity = self.default_complexity if node.selection_set else self.default_cost
+            multipliers = self.default_multipliers if is_list_type(get_nullable_type(field.type)) else ()
+            use_multipliers = True
+        else:
+            complexity = field_cost.get("complexity", self.default_complexity)
+            multipliers = field_cost.get("multipliers") or ()
+            use_multipliers = field_cost.get("useMultipliers", True)
+
+        cost = complexity + self.compute_selection_set_cost(node.selection_set, get_named_type(field.type))
+        if use_multipliers and multipliers:
+            cost *= self.get_multiplier(node, field, multipliers)
+        return cost
+
+    def get_field_cost_args(self, type_name: str, field_name: str, field: GraphQLField) -> Optional[Dict[str, Any]]:
+        field_costs = (self.cost_map or {}).get(type_name, {})
+        if field_name in field_costs:
+            return field_costs[field_name]
+        directive = self.context.schema.get_directive("cost")
+        if directive is not None and field.ast_node is not None:
+            return get_directive_values(directive, field.ast_node)
+        return None
+
+    def get_multiplier(self, node: FieldNode, field: GraphQLField, multipliers: Collection[str]) -> int:
+        try:
+            arguments = get_argument_values(field, node, self.variables)
+        except GraphQLError:
+            # Invalid arguments are reported by other validation rules.
+            return 1
+        values = [arguments[name] for name in multipliers if isinstance(arguments.get(name), int)]
+        return max(sum(values), 1) if values else 1
+
+
+def cost_validator(
+    maximum_cost: int,
+    *,
+    default_cost: int = 0,
+    default_complexity: int = 1,
+    default_multipliers: Collection[str] = DEFAULT_MULTIPLIERS,
+    cost_map: Optional[CostMap] = None,
+) -> Type[CostValidator]:
+    """
+    Creates the cost validation rule.
+
+    Same configuration always returns the same rule, so results of cost validation are stored
+    in the document cache together with the parsed document.
+    """
+    try:
+        config = json.dumps(
+            [maximum_cost, default_cost, default_complexity, list(default_multipliers), cost_map],
+            cls=DjangoJSONEncoder,
+            sort_keys=True,
+        )
+    except TypeError:
+        return _create_cost_validator(maximum_cost, default_cost, default_complexity, default_multipliers, cost_map)
+    return _get_cost_validator(config)
+
+
+@lru_cache(maxsize=256)
+def _get_cost_validator(config: str) -> Type[CostValidator]:
+    return _create_cost_validator(*json.loads(config))
+
+
+def _create_cost_validator(
+    maximum_cost: int,
+    default_cost: int,
+    default_complexity: int,
+    default_multipliers: Collection[str],
+    cost_map: Optional[CostMap],
+) -> Type[CostValidator]:
+    return cast(
+        Type[CostValidator],
+        type(
+            "CostValidator",
+            (CostValidator,),
+            {
+                "maximum_cost": maximum_cost,
+                "default_cost": default_cost,
+                "default_complexity": default_complexity,
+                "default_multipliers": tuple(default_multipliers),
+                "cost_map": cost_map,
+            },
+        ),
+    )
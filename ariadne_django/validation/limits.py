@@ -0,0 +1,91 @@
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Type, cast
+
+from graphql import FieldNode, FragmentSpreadNode, GraphQLError, OperationDefinitionNode, SelectionSetNode
+from graphql.validation import ValidationRule
+from graphql.validation.rules import ASTValidationRule
+
+
+SelectionStats = NamedTuple("SelectionStats", [("depth", int), ("fields", int), ("aliases", int)])
+
+EMPTY_SELECTION_STATS = SelectionStats(0, 0, 0)
+
+
+class QueryLimitsValidator(ValidationRule):
+    """
+    Rejects operations exceeding the maximum selection depth, number of aliases or total number of fields.
+
+    Stats of every fragment are computed once and reused for each of its spreads.
+    """
+
+    max_depth: Optional[int] = None
+    max_aliases: Optional[int] = None
+    max_fields: Optional[int] = None
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.fragment_stats: Dict[str, SelectionStats] = {}
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args):
+        stats = self.get_selection_set_stats(node.selection_set)
+        for name, limit, value in (
+            ("depth", self.max_depth, stats.depth),
+            ("aliases", self.max_aliases, stats.aliases),
+            ("fields", self.max_fields, stats.fields),
+        ):
+            if limit is not None and value > limit:
+                self.report_error(
+                    GraphQLError(
+                        "Query {} of {} exceeds the maximum of {}".format(name, value, limit),
+                        node,
+                        extensions={"limits": {name: value, "maximum": limit}},
+                    )
+                )
+
+    def get_selection_set_stats(self, selection_set: Optional[SelectionSetNode]) -> SelectionStats:
+        if selection_set is None:
+            return EMPTY_SELECTION_STATS
+        depth = fields = aliases = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                child_stats = self.get_selection_set_stats(selection.selection_set)
+                depth = max(depth, child_stats.depth + 1)
+                fields += child_stats.fields + 1
+                aliases += child_stats.aliases + (1 if selection.alias else 0)
+            else:
+                if isinstance(selection, FragmentSpreadNode):
+                    child_stats = self.get_fragment_stats(selection.name.value)
+                else:
+                    child_stats = self.get_selection_set_stats(selection.selection_set)
+                depth = max(depth, child_stats.depth)
+                fields += child_stats.fields
+                aliases += child_stats.aliases
+        return SelectionStats(depth, fields, aliases)
+
+    def get_fragment_stats(self, name: str) -> SelectionStats:
+        if name not in self.fragment_stats:
+            # Guards against fragment cycles, which are reported by other validation rules.
+            self.fragment_stats[name] = EMPTY_SELECTION_STATS
+            fragment = self.context.get_fragment(name)
+            if fragment is not None:
+                self.fragment_stats[name] = self.get_selection_set_stats(fragment.selection_set)
+        return self.fragment_stats[name]
+
+
+@lru_cache(maxsize=None)
+def query_limits_validator(
+    max_depth: Optional[int] = None,
+    max_aliases: Optional[int] = None,
+    max_fields: Optional[int] = None,
+) -> Type[ASTValidationRule]:
+    """
+    Creates the validation rule limiting selection depth, number of aliases and total number of fields.
+    """
+    return cast(
+        Type[ASTValidationRule],
+        type(
+            "QueryLimitsValidator",
+            (QueryLimitsValidator,),
+            {"max_depth": max_depth, "max_aliases": max_aliases, "max_fields": max_fields},
+        ),
+    )
@@ -1,34 +1,127 @@
 import asyncio
-from typing import cast
+from typing import AsyncIterator, Optional, Union
 
-from django.http import HttpRequest, HttpResponseBadRequest, JsonResponse
+import django
+from django.http import HttpRequest, HttpResponseBadRequest, StreamingHttpResponse
 from django.utils.decorators import classonlymethod, method_decorator
 from django.views.decorators.csrf import csrf_exempt
 
 from ariadne.exceptions import HttpBadRequestError
-from ariadne.graphql import graphql
 
-from graphql import GraphQLSchema
+from asgiref.sync import sync_to_async
+from graphql.execution import MiddlewareManager
 
-from .base import BaseGraphQLView
+from ariadne_django.auth.permissions import get_request_user
+from ariadne_django.dataloaders import LoaderRegistry
+from ariadne_django.execution import graphql, graphql_incremental, thread_pool_middleware
+from ariadne_django.resolvers import async_queryset_middleware
+
+from .base import BaseGraphQLView, get_batch_status_code
+
+
+MULTIPART_MIXED_CONTENT_TYPE = 'multipart/mixed; boundary="-"; deferSpec=20220824'
 
 
 @method_decorator(csrf_exempt, name="dispatch")
 class GraphQLAsyncView(BaseGraphQLView):
+    incremental_delivery: bool = True
+    run_sync_resolvers_in_threads: bool = False
+    async_querysets: bool = False
+
     @classonlymethod
     def as_view(cls, **initkwargs):
         view = super().as_view(**initkwargs)
         view._is_coroutine = asyncio.coroutines._is_coroutine  # pylint: disable=protected-access
         return view
 
-    async def get(self, *args, **kwargs):
-        return self._get(*args, **kwargs)
+    def get_loader_registry(self, request: HttpRequest) -> Optional[LoaderRegistry]:
+        return LoaderRegistry(is_async=True)
+
+    def get_kwargs_graphql(self, request: HttpRequest) -> dict:
+        kwargs = super().get_kwargs_graphql(request)
+        # Middleware added by the view wrap other middleware (the first middleware is the innermost one),
+        # so QuerySets are evaluated after being modified by them, and they run in the same thread as resolvers.
+        # Extensions wrap all middleware, and are run in the event loop.
+        view_middlewares = []
+        if self.async_querysets:
+            view_middlewares.append(async_queryset_middleware)
+        if self.run_sync_resolvers_in_threads:
+            view_middlewares.append(thread_pool_middleware)
+        if view_middlewares:
+            middlewares = self.middleware.middlewares if self.middleware else ()
+            kwargs["middleware"] = MiddlewareManager(*middlewares, *view_middlewares)
+        return kwargs
+
+    def get_streaming_content(self, result: Union[dict, list]):
+        if django.VERSION < (4, 2):
+            # Asynchronous iterators are supported by StreamingHttpResponse since Django 4.2.
+            return super().get_streaming_content(result)
+        return self._aiter_streaming_content(result)
+
+    async def _aiter_streaming_content(self, result: Union[dict, list]) -> AsyncIterator[bytes]:
+        for chunk in super().get_streaming_content(result):
+            yield chunk
+            # Let other tasks run between chunks of large responses.
+            await asyncio.sleep(0)
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        if not self.is_query_get_request(request):
+            return self._get(request, *args, **kwargs)
+        try:
+            data = self.extract_data_from_get_request(request)
+        except HttpBadRequestError as error:
+            return HttpResponseBadRequest(error.message)
+        response = await self.execute_query(request, data)
+        return self._finalize_get_response(request, response)
 
     async def post(self, request: HttpRequest, *args, **kwargs):  # pylint: disable=unused-argument
         try:
             data = self.extract_data_from_request(request)
         except HttpBadRequestError as error:
             return HttpResponseBadRequest(error.message)
-        success, result = await graphql(cast(GraphQLSchema, self.schema), data, **self.get_kwargs_graphql(request))
+        return await self.execute_query(request, data)
+
+    async def execute_query(self, request: HttpRequest, data):
+        if self.response_cache is not None and hasattr(request, "user"):
+            # User set by AuthenticationMiddleware is loaded from the session by the response cache scope function,
+            # which can't be done in the event loop.
+            await sync_to_async(get_request_user)(request)
+        kwargs = self.get_kwargs_graphql(request)
+        if self.is_batch(data):
+            # Operations in a batch are executed concurrently, sharing the request context.
+            results = await asyncio.gather(*(graphql(self.get_schema(), operation, **kwargs) for operation in data))
+            return self.create_json_response([result for _, result in results], status=get_batch_status_code(results))
+
+        cached_response = self._get_cached_introspection_response(data)
+        if cached_response is not None:
+            return cached_response
+
+        if self.accepts_incremental_delivery(request):
+            success, result, subsequent = await graphql_incremental(self.get_schema(), data, **kwargs)
+            if subsequent is not None:
+                return StreamingHttpResponse(
+                    self._aiter_multipart_content(result, subsequent), content_type=MULTIPART_MIXED_CONTENT_TYPE
+                )
+        else:
+            success, result = await graphql(self.get_schema(), data, **kwargs)
+        self._cache_introspection_result(data, success, result)
         status_code = 200 if success else 400
-        return JsonResponse(result, status=status_code)
+        return self.create_json_response(result, status=status_code)
+
+    def accepts_incremental_delivery(self, request: HttpRequest) -> bool:
+        # Payloads are flushed as they are ready only by asynchronous iterators, supported since Django 4.2.
+        if not self.incremental_delivery or django.VERSION < (4, 2):
+            return False
+        return "multipart/mixed" in request.META.get("HTTP_ACCEPT", "")
+
+    async def _aiter_multipart_content(self, result: dict, subsequent: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+        # Every part is followed by the boundary, so clients can process it without waiting for the next one.
+        yield b"\r\n---" + self.get_multipart_part(result)
+        async for payload in subsequent:
+            yield self.get_multipart_part(payload)
+        yield b"--\r\n"
+
+    def get_multipart_part(self, payload: dict) -> bytes:
+        return (
+            b"\r\nContent-Type: application/json; charset=utf-8\r\n\r\n" + self.json_codec.dumps(payload) + b"\r\n---"
+        )
@@ -1,9 +1,13 @@
-import json
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Iterable, List, Optional, Union, cast
 
+from django.apps import apps
 from django.conf import settings
-from django.http import HttpRequest
-from django.shortcuts import render
+from django.core.files.storage import Storage
+from django.core.files.uploadhandler import FileUploadHandler, TemporaryFileUploadHandler
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers, set_response_etag
+from django.utils.datastructures import MultiValueDict
+from django.utils.decorators import classonlymethod
 from django.views.generic import View
 from django.views.generic.base import ContextMixin, TemplateResponseMixin
 
@@ -11,14 +15,32 @@ from ariadne.constants import DATA_TYPE_JSON, DATA_TYPE_MULTIPART
 from ariadne.exceptions import HttpBadRequestError
 from ariadne.file_uploads import combine_multipart_data
 from ariadne.format_error import format_error
-from ariadne.types import ContextValue, ErrorFormatter, ExtensionList, RootValue, ValidationRules
+from ariadne.types import ContextValue, ErrorFormatter, ExtensionList, GraphQLResult, RootValue, ValidationRules
 
-from graphql import GraphQLSchema
+from graphql import GraphQLError, GraphQLSchema, OperationType
 from graphql.execution import MiddlewareManager
 
+from ariadne_django.codecs import JSONCodec
+from ariadne_django.dataloaders import LoaderRegistry
+from ariadne_django.execution import (
+    CachedResult,
+    DocumentCache,
+    IntrospectionCache,
+    PersistedQueryStore,
+    ResponseCache,
+    get_introspection_cache_key,
+    parse_and_validate_query,
+)
+from ariadne_django.schema import LazySchema
+from ariadne_django.uploads import MultipartUploadParser, StorageUploadHandler
+
+from .playground import PlaygroundPage
+
 
 Extensions = Union[Callable[[Any, Optional[ContextValue]], ExtensionList], ExtensionList]
 
+DEFAULT_PLAYGROUND_TEMPLATE = "ariadne_django/graphql_playground.html"
+
 # https://github.com/graphql/graphql-playground#properties
 # For complete fields list see PlaygroundWrapperProps interface
 DEFAULT_PLAYGROUND_OPTIONS = {
@@ -31,12 +53,23 @@ DEFAULT_PLAYGROUND_OPTIONS = {
 }
 
 
+def get_batch_status_code(results: List[GraphQLResult]) -> int:
+    # Batch is answered with an error status only if none of its operations succeeded.
+    return 200 if any(success for success, _ in results) else 400
+
+
 class BaseGraphQLView(TemplateResponseMixin, ContextMixin, View):
     http_method_names = ["get", "post", "options"]
-    template_name = "ariadne_django/graphql_playground.html"
+    template_name = DEFAULT_PLAYGROUND_TEMPLATE
     playground_options: Optional[dict] = None
+    playground_static: bool = False
+    # Playground is cached by default only for the built-in template, which doesn't use the request.
+    playground_cache: Optional[bool] = None
+    playground_page: Optional[PlaygroundPage] = None
     introspection: bool = True
-    schema: Optional[GraphQLSchema] = None
+    cache_introspection: bool = True
+    introspection_cache: Optional[IntrospectionCache] = None
+    schema: Union[GraphQLSchema, LazySchema, None] = None
     context_value: Optional[ContextValue] = None
     root_value: Optional[RootValue] = None
     logger = None
@@ -44,47 +77,177 @@ class BaseGraphQLView(TemplateResponseMixin, ContextMixin, View):
     error_formatter: Optional[ErrorFormatter] = None
     extensions: Optional[Extensions] = None
     middleware: Optional[MiddlewareManager] = None
+    document_cache_size: int = 128
+    document_cache: Optional[DocumentCache] = None
+    persisted_queries: bool = False
+    persisted_queries_cache_alias: str = "default"
+    persisted_queries_timeout: Optional[int] = None
+    json_codec: JSONCodec = JSONCodec()
+    streaming: bool = False
+    streaming_chunk_size: int = 65536
+    response_cache: Optional[ResponseCache] = None
+    cache_control: Optional[str] = None
+    etag: bool = True
+    batching: bool = False
+    max_batch_size: int = 10
+    streaming_uploads: bool = False
+    max_upload_size: Optional[int] = None
+    max_upload_files: Optional[int] = None
+    upload_storage: Optional[Storage] = None
+    upload_to: str = ""
 
-    def _get(self, request: HttpRequest, *args, **kwargs):  # pylint: disable=unused-argument
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        # Each view gets its own cache of parsed and validated documents, shared by all requests it handles.
+        document_cache = initkwargs.get("document_cache", cls.document_cache)
+        document_cache_size = initkwargs.get("document_cache_size", cls.document_cache_size)
+        if document_cache is None and document_cache_size:
+            document_cache = initkwargs["document_cache"] = DocumentCache(document_cache_size)
+
+        # Introspection results are cached per view, as they depend on its validation rules.
+        introspection_cache = initkwargs.get("introspection_cache", cls.introspection_cache)
+        if introspection_cache is None and initkwargs.get("cache_introspection", cls.cache_introspection):
+            introspection_cache = initkwargs["introspection_cache"] = IntrospectionCache()
+
+        # Playground is rendered once, when templates can be loaded, instead of on every GET request.
+        playground_page = initkwargs.get("playground_page", cls.playground_page)
+        if playground_page is None:
+            playground_page = initkwargs["playground_page"] = cls(**initkwargs).create_playground_page()
+        if apps.ready and playground_page.cache:
+            playground_page.content  # pylint: disable=pointless-statement
+
+        view = super().as_view(**initkwargs)
+        view.document_cache = document_cache
+        view.introspection_cache = introspection_cache
+        view.playground_page = playground_page
+        return view
+
+    def create_playground_page(self) -> PlaygroundPage:
         options = DEFAULT_PLAYGROUND_OPTIONS.copy()
         if self.playground_options:
             options.update(self.playground_options)
+        cache = self.playground_cache
+        if cache is None:
+            cache = self.get_template_names() == [DEFAULT_PLAYGROUND_TEMPLATE]
+        return PlaygroundPage(self.get_template_names(), options, static_assets=self.playground_static, cache=cache)
 
-        return render(
-            request,
-            self.get_template_names(),
-            {"playground_options": json.dumps(options)},
-        )
+    def _get(self, request: HttpRequest, *args, **kwargs):  # pylint: disable=unused-argument
+        playground_page = self.playground_page or self.create_playground_page()
+        return playground_page.get_response(request)
+
+    def is_query_get_request(self, request: HttpRequest) -> bool:
+        # Browsers asking for HTML are always served the playground.
+        if "text/html" in request.META.get("HTTP_ACCEPT", ""):
+            return False
+        return "query" in request.GET or "extensions" in request.GET
+
+    def extract_data_from_get_request(self, request: HttpRequest):
+        data = {}
+        for name in ("query", "operationName"):
+            if name in request.GET:
+                data[name] = request.GET[name]
+        for name in ("variables", "extensions"):
+            if name in request.GET:
+                try:
+                    data[name] = self.json_codec.loads(request.GET[name])
+                except (TypeError, ValueError) as ex:
+                    raise HttpBadRequestError("Request '{}' query parameter is not a valid JSON".format(name)) from ex
+        return data
 
     def extract_data_from_request(self, request: HttpRequest):
         content_type = request.content_type or ""
         content_type = content_type.split(";")[0]
 
         if content_type == DATA_TYPE_JSON:
-            return self.extract_data_from_json_request(request)
-        if content_type == DATA_TYPE_MULTIPART:
-            return self.extract_data_from_multipart_request(request)
+            data = self.extract_data_from_json_request(request)
+        elif content_type == DATA_TYPE_MULTIPART:
+            data = self.extract_data_from_multipart_request(request)
+        else:
+            raise HttpBadRequestError(
+                "Posted content must be of type {} or {}".format(DATA_TYPE_JSON, DATA_TYPE_MULTIPART)
+            )
+
+        if self.is_batch(data):
+            self.validate_batch(data)
+        return data
+
+    def is_batch(self, data) -> bool:
+        return self.batching and isinstance(data, list)
 
-        raise HttpBadRequestError("Posted content must be of type {} or {}".format(DATA_TYPE_JSON, DATA_TYPE_MULTIPART))
+    def validate_batch(self, data: list):
+        if not data:
+            raise HttpBadRequestError("Batch must contain at least one operation")
+        if len(data) > self.max_batch_size:
+            raise HttpBadRequestError("Batch size exceeds the limit of {} operations".format(self.max_batch_size))
 
     def extract_data_from_json_request(self, request: HttpRequest):
         try:
-            return json.loads(request.body)
+            return self.json_codec.loads(request.body)
         except (TypeError, ValueError) as ex:
             raise HttpBadRequestError("Request body is not a valid JSON") from ex
 
     def extract_data_from_multipart_request(self, request: HttpRequest):
+        if self.streaming_uploads:
+            return self.extract_data_from_streaming_multipart_request(request)
+
         try:
-            operations = json.loads(request.POST.get("operations", "{}"))
+            operations = self.json_codec.loads(request.POST.get("operations", "{}"))
         except (TypeError, ValueError) as ex:
             raise HttpBadRequestError("Request 'operations' multipart field is not a valid JSON") from ex
         try:
-            files_map = json.loads(request.POST.get("map", "{}"))
+            files_map = self.json_codec.loads(request.POST.get("map", "{}"))
         except (TypeError, ValueError) as ex:
             raise HttpBadRequestError("Request 'map' multipart field is not a valid JSON") from ex
 
         return combine_multipart_data(operations, files_map, request.FILES)
 
+    def extract_data_from_streaming_multipart_request(self, request: HttpRequest):
+        parser = MultipartUploadParser(
+            request,
+            self.get_upload_handler,
+            json_codec=self.json_codec,
+            max_file_size=self.max_upload_size,
+            max_files=self.max_upload_files,
+            validate_operations=lambda operations: self.validate_multipart_operations(request, operations),
+        )
+        operations, files_map, files = parser.parse()
+        # Uploaded files are closed together with the request, like files parsed by Django.
+        request._files = MultiValueDict(  # pylint: disable=protected-access
+            {name: [uploaded_file] for name, uploaded_file in files.items() if uploaded_file is not None}
+        )
+        return combine_multipart_data(operations, files_map, files)
+
+    def get_upload_handler(self, request: HttpRequest) -> FileUploadHandler:
+        if self.upload_storage is not None:
+            return StorageUploadHandler(request, self.upload_storage, self.upload_to)
+        return TemporaryFileUploadHandler(request)
+
+    def validate_multipart_operations(
+        self, request: HttpRequest, operations: Union[dict, list]  # pylint: disable=unused-argument
+    ) -> bool:
+        # Files uploaded for invalid operations are never used, so they are skipped instead of being stored.
+        for data in operations if isinstance(operations, list) else [operations]:
+            if not isinstance(data, dict) or not isinstance(data.get("query"), str):
+                continue
+            try:
+                _, errors = parse_and_validate_query(
+                    self.get_schema(),
+                    data,
+                    validation_rules=None if callable(self.validation_rules) else self.validation_rules,
+                    introspection=self.introspection,
+                    document_cache=self.document_cache,
+                )
+            except GraphQLError:
+                return False
+            if errors:
+                return False
+        return True
+
+    def get_schema(self) -> GraphQLSchema:
+        if isinstance(self.schema, LazySchema):
+            return self.schema.get()
+        return cast(GraphQLSchema, self.schema)
+
     def get_kwargs_graphql(self, request: HttpRequest) -> dict:
         context_value = self.get_context_for_request(request)
         extensions = self.get_extensions_for_request(request, context_value)
@@ -99,12 +262,95 @@ class BaseGraphQLView(TemplateResponseMixin, ContextMixin, View):
             "error_formatter": self.error_formatter or format_error,
             "extensions": extensions,
             "middleware": self.middleware,
+            "document_cache": self.document_cache,
+            "persisted_queries": self.get_persisted_query_store(),
+            # Only queries can be executed over GET, as it's not supposed to have side effects.
+            "allowed_operation_types": (OperationType.QUERY,) if request.method == "GET" else None,
+            "response_cache": self.response_cache,
+            "response_cache_scope": self.response_cache.scope(request) if self.response_cache else "public",
         }
 
+    def create_json_response(self, result: Union[dict, list], status: int = 200) -> HttpResponse:
+        if isinstance(result, CachedResult):
+            response = HttpResponse(
+                result.get_content(self.json_codec), status=status, content_type=self.json_codec.content_type
+            )
+            # ETag of the cached result is reused, so conditional GET requests are answered without
+            # executing the operation again.
+            response["ETag"] = result.etag
+            return response
+        if isinstance(result, list):
+            # Results of a batch are serialized together.
+            result = [dict(item) if isinstance(item, CachedResult) else item for item in result]
+        if self.streaming:
+            return StreamingHttpResponse(
+                self.get_streaming_content(result), status=status, content_type=self.json_codec.content_type
+            )
+        return HttpResponse(self.json_codec.dumps(result), status=status, content_type=self.json_codec.content_type)
+
+    def _get_cached_introspection_response(self, data) -> Optional[HttpResponse]:
+        key = self._get_introspection_cache_key(data)
+        cached_result = self.introspection_cache.get(self.get_schema(), key) if key is not None else None  # type: ignore
+        if cached_result is None:
+            return None
+        response = HttpResponse(cached_result.content, content_type=self.json_codec.content_type)
+        response["ETag"] = cached_result.etag
+        return response
+
+    def _cache_introspection_result(self, data, success: bool, result: dict):
+        key = self._get_introspection_cache_key(data)
+        # Results with extensions are specific to the request.
+        if key is not None and success and isinstance(result, dict) and set(result) == {"data"}:
+            self.introspection_cache.set(self.get_schema(), key, data, self.json_codec.dumps(result))  # type: ignore
+
+    def _get_introspection_cache_key(self, data) -> Optional[str]:
+        # Validation rules depending on the request (eg. disabling introspection for some users) are always run.
+        if (
+            not self.cache_introspection
+            or self.introspection_cache is None
+            or not self.introspection
+            or callable(self.validation_rules)
+        ):
+            return None
+        return get_introspection_cache_key(data)
+
+    def get_streaming_content(self, result: Union[dict, list]) -> Iterable[bytes]:
+        return self.json_codec.iterencode(result, self.streaming_chunk_size)
+
+    def _finalize_get_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        # Same URL serves either the playground or query results, depending on the Accept header.
+        patch_vary_headers(response, ("Accept",))
+        if response.status_code != 200:
+            return response
+        if self.cache_control:
+            response["Cache-Control"] = self.cache_control
+        # ETag of streamed responses would require their whole content, so they are sent without it.
+        if self.etag and not response.streaming:
+            if not response.has_header("ETag"):
+                set_response_etag(response)
+            return get_conditional_response(request, etag=response["ETag"], response=response)
+        return response
+
+    def get_persisted_query_store(self) -> Optional[PersistedQueryStore]:
+        if not self.persisted_queries:
+            return None
+        return PersistedQueryStore(self.persisted_queries_cache_alias, self.persisted_queries_timeout)
+
     def get_context_for_request(self, request: HttpRequest) -> Optional[ContextValue]:
         if callable(self.context_value):
             return self.context_value(request)  # pylint: disable=not-callable
-        return self.context_value or {"request": request}
+        if self.context_value:
+            return self.context_value
+        context_value = {"request": request}
+        loaders = self.get_loader_registry(request)
+        if loaders is not None:
+            context_value["loaders"] = loaders
+        return context_value
+
+    def get_loader_registry(self, request: HttpRequest) -> Optional[LoaderRegistry]:  # pylint: disable=unused-argument
+        # Synchronous execution resolves fields one by one, so loaders of this registry load keys right away,
+        # caching loaded values until the end of the request.
+        return LoaderRegistry()
 
     def get_extensions_for_request(self, request: HttpRequest, context: Optional[ContextValue]) -> ExtensionList:
         if callable(self.extensions):
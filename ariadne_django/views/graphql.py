@@ -1,15 +1,12 @@
-from typing import cast
-
-from django.http import HttpRequest, HttpResponseBadRequest, JsonResponse
+from django.http import HttpRequest, HttpResponseBadRequest
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 
 from ariadne.exceptions import HttpBadRequestError
-from ariadne.graphql import graphql_sync
 
-from graphql import GraphQLSchema
+from ariadne_django.execution import graphql_sync
 
-from .base import BaseGraphQLView
+from .base import BaseGraphQLView, get_batch_status_code
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -22,14 +19,35 @@ class GraphQLView(BaseGraphQLView):
         except HttpBadRequestError as error:
             return HttpResponseBadRequest(error.message)
 
-    def get(self, *args, **kwargs):
-        return self._get(*args, **kwargs)
+    def get(self, request: HttpRequest, *args, **kwargs):
+        if not self.is_query_get_request(request):
+            return self._get(request, *args, **kwargs)
+        try:
+            data = self.extract_data_from_get_request(request)
+        except HttpBadRequestError as error:
+            return HttpResponseBadRequest(error.message)
+        response = self.execute_query(request, data)
+        return self._finalize_get_response(request, response)
 
     def post(self, request: HttpRequest, *args, **kwargs):  # pylint: disable=unused-argument
         try:
             data = self.extract_data_from_request(request)
         except HttpBadRequestError as error:
             return HttpResponseBadRequest(error.message)
-        success, result = graphql_sync(cast(GraphQLSchema, self.schema), data, **self.get_kwargs_graphql(request))
+        return self.execute_query(request, data)
+
+    def execute_query(self, request: HttpRequest, data):
+        kwargs = self.get_kwargs_graphql(request)
+        if self.is_batch(data):
+            # Operations in a batch are executed one after another, sharing the request context.
+            results = [graphql_sync(self.get_schema(), operation, **kwargs) for operation in data]
+            return self.create_json_response([result for _, result in results], status=get_batch_status_code(results))
+
+        cached_response = self._get_cached_introspection_response(data)
+        if cached_response is not None:
+            return cached_response
+
+        success, result = graphql_sync(self.get_schema(), data, **kwargs)
+        self._cache_introspection_result(data, success, result)
         status_code = 200 if success else 400
-        return JsonResponse(result, status=status_code)
+        return self.create_json_response(result, status=status_code)
@@ -0,0 +1,82 @@
+import hashlib
+import json
+from typing import Dict, List, Optional, Union
+
+from django.http import HttpRequest, HttpResponse
+from django.template.loader import render_to_string
+from django.templatetags.static import static
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
+from django.utils.functional import cached_property
+
+
+PLAYGROUND_VERSION = "1.7.26"
+PLAYGROUND_CDN_URL = "//cdn.jsdelivr.net/npm/graphql-playground-react/build/"
+PLAYGROUND_STATIC_PATH = "ariadne_django/playground/{}/".format(PLAYGROUND_VERSION)
+
+# Paths of assets relative to the build directory of graphql-playground-react package
+PLAYGROUND_ASSETS = {
+    "playground_css_url": "static/css/index.css",
+    "playground_favicon_url": "favicon.png",
+    "playground_js_url": "static/js/middleware.js",
+}
+
+
+def get_playground_asset_urls(static_assets: bool = False) -> Dict[str, str]:
+    """
+    Returns URLs of GraphQL Playground assets, either on the CDN or in static files
+    downloaded with the ``download_playground_assets`` management command.
+    """
+    if static_assets:
+        return {name: static(PLAYGROUND_STATIC_PATH + path) for name, path in PLAYGROUND_ASSETS.items()}
+    return {name: PLAYGROUND_CDN_URL + path for name, path in PLAYGROUND_ASSETS.items()}
+
+
+class PlaygroundPage:
+    """
+    GraphQL Playground HTML rendered once for the view configuration, together with its ETag.
+
+    Pages with ``cache`` disabled are rendered with the request on every request instead, so templates
+    can use context processors and the request (eg. ``{% csrf_token %}``).
+    """
+
+    content_type = "text/html; charset=utf-8"
+
+    def __init__(
+        self,
+        template_names: Union[str, List[str]],
+        options: dict,
+        static_assets: bool = False,
+        cache: bool = True,
+    ):
+        self.template_names = template_names
+        self.options = options
+        self.static_assets = static_assets
+        self.cache = cache
+
+    def get_context(self) -> dict:
+        return {"playground_options": json.dumps(self.options), **get_playground_asset_urls(self.static_assets)}
+
+    def render(self, request: Optional[HttpRequest] = None) -> bytes:
+        return render_to_string(self.template_names, self.get_context(), request=request).encode("utf-8")
+
+    @cached_property
+    def content(self) -> bytes:
+        return self.render()
+
+    @cached_property
+    def etag(self) -> str:
+        return quote_etag(hashlib.sha256(self.content).hexdigest())
+
+    def get_response(self, request: HttpRequest) -> HttpResponse:
+        if not self.cache:
+            response = HttpResponse(self.render(request), content_type=self.content_type)
+            patch_vary_headers(response, ("Accept",))
+            return response
+
+        response = get_conditional_response(request, etag=self.etag)
+        if response is None:
+            response = HttpResponse(self.content, content_type=self.content_type)
+            response["ETag"] = self.etag
+        # Same URL serves either the playground or query results, depending on the Accept header.
+        patch_vary_headers(response, ("Accept",))
+        return response
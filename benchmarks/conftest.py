@@ -0,0 +1,39 @@
+import asyncio
+
+from django.conf import settings
+from django.test import AsyncClient, Client
+
+import pytest
+
+
+def pytest_configure():
+    if not settings.configured:
+        settings.configure(
+            USE_TZ=True,
+            INSTALLED_APPS=["ariadne_django"],
+            ROOT_URLCONF="benchmarks.urls",
+            ALLOWED_HOSTS=["testserver"],
+            TEMPLATES=[
+                {
+                    "BACKEND": "django.template.backends.django.DjangoTemplates",
+                    "APP_DIRS": True,
+                }
+            ],
+        )
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+@pytest.fixture
+def async_client():
+    return AsyncClient()
+
+
+@pytest.fixture
+def run_async():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+
+from ariadne import MutationType, QueryType, make_executable_schema, upload_scalar
+
+from ariadne_django.scalars import datetime_scalar, decimal_scalar
+
+
+type_defs = """
+    scalar Upload
+    scalar DateTime
+    scalar Decimal
+
+    type Query {
+        item: Item!
+        items(count: Int!): [Item!]!
+        node: Node!
+        errors(count: Int!): [Failing!]!
+    }
+
+    type Mutation {
+        upload(files: [Upload!]!): Int!
+    }
+
+    type Item {
+        id: ID!
+        name: String!
+        price: Decimal!
+        createdAt: DateTime!
+    }
+
+    type Failing {
+        value: Int
+    }
+
+    type Node {
+        id: ID!
+        child: Node
+    }
+"""
+
+ITEM = {"id": 1, "name": "Item", "price": Decimal("9.99"), "createdAt": datetime(2021, 1, 1, tzinfo=timezone.utc)}
+
+# Node is its own child, so queries select nodes nested as deep as they need.
+NODE: dict = {"id": 1}
+NODE["child"] = NODE
+
+
+def raise_validation_error(*_):
+    raise ValidationError({"name": ["This field is required."]})
+
+
+query = QueryType()
+query.set_field("item", lambda *_: ITEM)
+query.set_field("items", lambda *_, count: [dict(ITEM, id=i) for i in range(count)])
+query.set_field("node", lambda *_: NODE)
+query.set_field("errors", lambda *_, count: [{"value": raise_validation_error} for _ in range(count)])
+
+mutation = MutationType()
+mutation.set_field("upload", lambda *_, files: sum(file.size for file in files))
+
+schema = make_executable_schema(type_defs, [query, mutation, upload_scalar, datetime_scalar, decimal_scalar])
@@ -0,0 +1,35 @@
+import django.core.exceptions
+
+import pytest
+from graphql import GraphQLError
+
+from ariadne_django.formatters.errors.simple import format_graphql_error
+
+
+ERRORS_COUNT = 1000
+
+ORIGINAL_ERRORS = {
+    "no_original_error": lambda: None,
+    "validation_error": lambda: django.core.exceptions.ValidationError(
+        {"name": ["This field is required."], "email": ["Enter a valid email address.", "Email is taken."]}
+    ),
+    "permission_denied": django.core.exceptions.PermissionDenied,
+    "does_not_exist": django.core.exceptions.ObjectDoesNotExist,
+    "unknown_error": lambda: ValueError("Unknown"),
+}
+
+
+def get_errors(original_error_factory):
+    errors = []
+    for i in range(ERRORS_COUNT):
+        error = GraphQLError("Error", path=["items", i, "value"])
+        error.original_error = original_error_factory()
+        errors.append(error)
+    return errors
+
+
+@pytest.mark.parametrize("original_error", ORIGINAL_ERRORS)
+def test_format_many_errors(benchmark, original_error):
+    errors = get_errors(ORIGINAL_ERRORS[original_error])
+    formatted = benchmark(lambda: [format_graphql_error(error) for error in errors])
+    assert len(formatted) == ERRORS_COUNT
@@ -0,0 +1,48 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from ariadne_django.scalars import (
+    parse_date_value,
+    parse_datetime_value,
+    parse_decimal_value,
+    parse_json_value,
+    parse_time_value,
+    parse_uuid_value,
+    serialize_date,
+    serialize_datetime,
+    serialize_decimal,
+    serialize_json,
+    serialize_time,
+    serialize_uuid,
+)
+from ariadne_django.scalars.timedelta import parse_timedelta_value, serialize_timedelta
+
+
+JSON_VALUE = {"name": "Document", "tags": ["a", "b", "c"], "author": {"id": 1, "name": "Author"}}
+
+SCALARS = {
+    "date": (serialize_date, parse_date_value, date(2021, 1, 1)),
+    "datetime": (serialize_datetime, parse_datetime_value, datetime(2021, 1, 1, 12, 30, tzinfo=timezone.utc)),
+    "time": (serialize_time, parse_time_value, time(12, 30, 15)),
+    "decimal": (serialize_decimal, parse_decimal_value, Decimal("1234.5678")),
+    "json": (serialize_json, parse_json_value, JSON_VALUE),
+    "uuid": (serialize_uuid, parse_uuid_value, UUID("a7d9e0c4-6a15-4a8e-9a1b-3f0e2d8c9b71")),
+    "timedelta": (serialize_timedelta, parse_timedelta_value, timedelta(hours=1, seconds=30)),
+}
+
+
+@pytest.mark.parametrize("scalar", SCALARS)
+def test_serialize(benchmark, scalar):
+    serialize, _, value = SCALARS[scalar]
+    benchmark(serialize, value)
+
+
+@pytest.mark.parametrize("scalar", SCALARS)
+def test_parse_value(benchmark, scalar):
+    serialize, parse_value, value = SCALARS[scalar]
+    serialized = serialize(value)
+    assert parse_value(serialized) is not None
+    benchmark(parse_value, serialized)
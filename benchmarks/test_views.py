@@ -0,0 +1,67 @@
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+import pytest
+
+
+SMALL_QUERY = "{ item { id name price createdAt } }"
+LARGE_LIST_QUERY = "{ items(count: 1000) { id name price createdAt } }"
+DEEPLY_NESTED_QUERY = "{ node " + "{ id child " * 30 + "{ id }" + " }" * 30 + " }"
+MANY_ERRORS_QUERY = "{ errors(count: 100) { value } }"
+
+QUERIES = {
+    "small": SMALL_QUERY,
+    "large_list": LARGE_LIST_QUERY,
+    "deeply_nested": DEEPLY_NESTED_QUERY,
+    "many_errors": MANY_ERRORS_QUERY,
+}
+
+UPLOAD_MUTATION = "mutation($files: [Upload!]!) { upload(files: $files) }"
+UPLOAD_FILES_COUNT = 3
+UPLOAD_FILE_SIZE = 64 * 1024
+
+
+def get_upload_data():
+    # Files are read by every request, so new ones are created for each of them.
+    return {
+        "operations": json.dumps({"query": UPLOAD_MUTATION, "variables": {"files": [None] * UPLOAD_FILES_COUNT}}),
+        "map": json.dumps({str(i): ["variables.files.{}".format(i)] for i in range(UPLOAD_FILES_COUNT)}),
+        **{
+            str(i): SimpleUploadedFile("file{}.txt".format(i), b"x" * UPLOAD_FILE_SIZE)
+            for i in range(UPLOAD_FILES_COUNT)
+        },
+    }
+
+
+def assert_success(response, expected_status_code=200):
+    assert response.status_code == expected_status_code
+    return json.loads(response.content)
+
+
+@pytest.mark.parametrize("query_name", QUERIES)
+def test_sync_view_post(benchmark, client, query_name):
+    response = benchmark(client.post, "/graphql/", data={"query": QUERIES[query_name]}, content_type="application/json")
+    assert_success(response)
+
+
+@pytest.mark.parametrize("query_name", QUERIES)
+def test_async_view_post(benchmark, async_client, run_async, query_name):
+    response = benchmark(
+        lambda: run_async(
+            async_client.post("/graphql/async/", data={"query": QUERIES[query_name]}, content_type="application/json")
+        )
+    )
+    assert_success(response)
+
+
+@pytest.mark.parametrize("path", ["/graphql/", "/graphql/streaming/"])
+def test_sync_view_multipart_upload(benchmark, client, path):
+    response = benchmark(lambda: client.post(path, data=get_upload_data()))
+    assert assert_success(response)["data"] == {"upload": UPLOAD_FILES_COUNT * UPLOAD_FILE_SIZE}
+
+
+@pytest.mark.parametrize("path", ["/graphql/async/", "/graphql/async/streaming/"])
+def test_async_view_multipart_upload(benchmark, async_client, run_async, path):
+    response = benchmark(lambda: run_async(async_client.post(path, data=get_upload_data())))
+    assert assert_success(response)["data"] == {"upload": UPLOAD_FILES_COUNT * UPLOAD_FILE_SIZE}
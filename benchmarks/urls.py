@@ -0,0 +1,18 @@
+from django.urls import path
+
+from ariadne_django.formatters.errors.simple import format_graphql_error
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+from .schema import schema
+
+
+def error_formatter(error, debug):
+    return format_graphql_error(error, debug=debug)
+
+
+urlpatterns = [
+    path("graphql/", GraphQLView.as_view(schema=schema, error_formatter=error_formatter)),
+    path("graphql/streaming/", GraphQLView.as_view(schema=schema, streaming_uploads=True)),
+    path("graphql/async/", GraphQLAsyncView.as_view(schema=schema, error_formatter=error_formatter)),
+    path("graphql/async/streaming/", GraphQLAsyncView.as_view(schema=schema, streaming_uploads=True)),
+]
@@ -13,6 +13,7 @@ CLASSIFIERS = [
     "Programming Language :: Python :: 3.6",
     "Programming Language :: Python :: 3.7",
     "Programming Language :: Python :: 3.8",
+    "Programming Language :: Python :: 3.9",
     "Topic :: Software Development :: Libraries :: Python Modules",
 ]
 
@@ -35,6 +36,7 @@ setup(
     install_requires=[
         "django>=2.2.0",
         "ariadne>=0.13.0",
+        "contextvars; python_version < '3.7'",
     ],
     classifiers=CLASSIFIERS,
     platforms=["any"],
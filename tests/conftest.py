@@ -13,7 +13,9 @@ def pytest_configure():
     settings.configure(
         USE_TZ=True,
         TIME_ZONE="America/Chicago",
-        INSTALLED_APPS=["ariadne_django"],
+        INSTALLED_APPS=["django.contrib.contenttypes", "ariadne_django", "tests"],
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+        DEFAULT_AUTO_FIELD="django.db.models.AutoField",
         TEMPLATES=[
             {
                 "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -0,0 +1,130 @@
+import json
+from functools import partial
+
+from ariadne import QueryType, make_executable_schema
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from ariadne_django.dataloaders import aload_by_field, aload_related, orm
+from ariadne_django.resolvers import acount, aevaluate, aget_or_none, async_queryset_resolver, querysets
+from ariadne_django.resolvers.querysets import HAS_ASYNC_QUERYSETS
+from ariadne_django.tracing import QueryCountingExtension
+from ariadne_django.views import GraphQLAsyncView
+
+from .models import Author, Document
+
+
+@pytest.fixture
+def authors_schema():
+    type_defs = """
+        type Query {
+            authors: [Author!]!
+        }
+
+        type Author {
+            name: String!
+        }
+    """
+    query = QueryType()
+    query.set_field("authors", lambda *_: Author.objects.order_by("name"))
+    return make_executable_schema(type_defs, query)
+
+
+async def execute_query(view, request_factory, query):
+    response = await view(request_factory.post("/graphql/", data={"query": query}, content_type="application/json"))
+    return json.loads(response.content)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_queryset_is_evaluated_asynchronously():
+    author = await sync_to_async(Author.objects.create)(name="Bob")
+    assert await aevaluate(Author.objects.all()) == [author]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_queryset_is_evaluated_in_thread_without_async_queryset_api(mocker):
+    mocker.patch.object(querysets, "HAS_ASYNC_QUERYSETS", False)
+    author = await sync_to_async(Author.objects.create)(name="Bob")
+    assert await aevaluate(Author.objects.all()) == [author]
+    assert await aget_or_none(Author.objects.all(), name="Bob") == author
+    assert await acount(Author.objects.all()) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_get_or_none_returns_none_for_missing_object():
+    author = await sync_to_async(Author.objects.create)(name="Bob")
+    assert await aget_or_none(Author.objects.all(), name="Bob") == author
+    assert await aget_or_none(Author.objects.all(), name="Alice") is None
+    assert await acount(Author.objects.all()) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "has_async_querysets",
+    [
+        pytest.param(True, marks=pytest.mark.skipif(not HAS_ASYNC_QUERYSETS, reason="requires Django 4.1+")),
+        False,
+    ],
+)
+async def test_async_orm_loaders(mocker, has_async_querysets):
+    mocker.patch.object(orm, "HAS_ASYNC_QUERYSETS", has_async_querysets)
+    bob, alice = await sync_to_async(Author.objects.create)(name="Bob"), await sync_to_async(Author.objects.create)(
+        name="Alice"
+    )
+    document = await sync_to_async(Document.objects.create)(name="Document", author=bob)
+    assert await aload_by_field(Author, "pk", [alice.pk, str(bob.pk), 0]) == [alice, bob, None]
+    assert await aload_related(Document, "author", [bob.pk, alice.pk]) == [[document], []]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_async_queryset_resolver_evaluates_returned_queryset(authors_schema, request_factory):
+    await sync_to_async(Author.objects.create)(name="Bob")
+    authors_field = authors_schema.query_type.fields["authors"]
+    authors_field.resolve = async_queryset_resolver(authors_field.resolve)
+    view = GraphQLAsyncView.as_view(schema=authors_schema)
+    result = await execute_query(view, request_factory, "{ authors { name } }")
+    assert result == {"data": {"authors": [{"name": "Bob"}]}}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_async_view_evaluates_querysets_returned_by_resolvers(authors_schema, request_factory):
+    await sync_to_async(Author.objects.create)(name="Bob")
+    await sync_to_async(Author.objects.create)(name="Alice")
+    view = GraphQLAsyncView.as_view(schema=authors_schema, async_querysets=True)
+    result = await execute_query(view, request_factory, "{ authors { name } }")
+    assert result == {"data": {"authors": [{"name": "Alice"}, {"name": "Bob"}]}}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_query_counting_extension_counts_querysets_evaluated_in_async_view(authors_schema, request_factory):
+    await sync_to_async(Author.objects.create)(name="Bob")
+    view = GraphQLAsyncView.as_view(
+        schema=authors_schema, async_querysets=True, extensions=[partial(QueryCountingExtension, report=True)]
+    )
+    result = await execute_query(view, request_factory, "{ authors { name } }")
+    assert result["data"] == {"authors": [{"name": "Bob"}]}
+    assert result["extensions"]["sqlQueries"]["resolvers"] == [
+        {"path": "authors", "count": 1, "duration": pytest.approx(0, abs=1)}
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_async_view_evaluates_querysets_returned_by_async_resolvers(authors_schema, request_factory):
+    await sync_to_async(Author.objects.create)(name="Bob")
+
+    async def resolve_authors(*_):
+        return Author.objects.order_by("name")
+
+    authors_schema.query_type.fields["authors"].resolve = resolve_authors
+    view = GraphQLAsyncView.as_view(schema=authors_schema, async_querysets=True)
+    result = await execute_query(view, request_factory, "{ authors { name } }")
+    assert result == {"data": {"authors": [{"name": "Bob"}]}}
@@ -0,0 +1,91 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+def post_batch(view, request_factory, data):
+    request = request_factory.post("/graphql/", data=data, content_type="application/json")
+    return view(request)
+
+
+def test_batched_operations_are_rejected_if_batching_is_disabled(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema)
+    response = post_batch(view, request_factory, [{"query": "{ status }"}])
+    assert response.status_code == 400
+    assert json.loads(response.content)["errors"][0]["message"] == "Operation data should be a JSON object"
+
+
+def test_batched_operations_are_executed(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, batching=True)
+    response = post_batch(
+        view,
+        request_factory,
+        [
+            {"query": "{ status }"},
+            {"query": "query($name: String) { hello(name: $name) }", "variables": {"name": "Bob"}},
+        ],
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content) == [{"data": {"status": True}}, {"data": {"hello": "Hello, Bob!"}}]
+
+
+def test_batched_operations_share_request_context(schema, request_factory):
+    get_context_value = Mock(return_value={"test": "TEST-CONTEXT"})
+    view = GraphQLView.as_view(schema=schema, batching=True, context_value=get_context_value)
+    response = post_batch(view, request_factory, [{"query": "{ testContext }"}, {"query": "{ testContext }"}])
+    get_context_value.assert_called_once()
+    assert json.loads(response.content) == [{"data": {"testContext": "TEST-CONTEXT"}}] * 2
+
+
+def test_batch_with_failed_operation_is_executed(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, batching=True)
+    response = post_batch(view, request_factory, [{"query": "{ status }"}, {"query": "{ unknown }"}])
+    assert response.status_code == 200
+    result = json.loads(response.content)
+    assert result[0] == {"data": {"status": True}}
+    assert "errors" in result[1]
+
+
+def test_batch_with_only_failed_operations_returns_bad_request(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, batching=True)
+    response = post_batch(view, request_factory, [{"query": "{ unknown }"}])
+    assert response.status_code == 400
+
+
+def test_batch_exceeding_max_batch_size_is_rejected(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, batching=True, max_batch_size=2)
+    response = post_batch(view, request_factory, [{"query": "{ status }"}] * 3)
+    assert response.status_code == 400
+    assert response.content == b"Batch size exceeds the limit of 2 operations"
+
+
+def test_empty_batch_is_rejected(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, batching=True)
+    response = post_batch(view, request_factory, [])
+    assert response.status_code == 400
+    assert response.content == b"Batch must contain at least one operation"
+
+
+@pytest.mark.asyncio
+async def test_batched_operations_are_executed_by_async_view(schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=schema, batching=True)
+    response = await post_batch(
+        view,
+        request_factory,
+        [
+            {"query": "{ status }"},
+            {"query": "query($name: String) { hello(name: $name) }", "variables": {"name": "Bob"}},
+        ],
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content) == [{"data": {"status": True}}, {"data": {"hello": "Hello, Bob!"}}]
+
+
+@pytest.mark.asyncio
+async def test_batch_exceeding_max_batch_size_is_rejected_by_async_view(schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=schema, batching=True, max_batch_size=2)
+    response = await post_batch(view, request_factory, [{"query": "{ status }"}] * 3)
+    assert response.status_code == 400
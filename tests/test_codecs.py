@@ -0,0 +1,99 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.http import JsonResponse
+from django.utils import timezone
+
+import pytest
+
+from ariadne_django.codecs import JSONCodec
+from ariadne_django.codecs.orjson import OrjsonCodec
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+@pytest.fixture
+def value():
+    return {
+        "data": {
+            "decimal": Decimal("1.10"),
+            "uuid": uuid.UUID("b8ab4d4b-3c6c-4d2f-8a0c-0c9f3f6a2b1e"),
+            "datetime": timezone.make_aware(datetime.datetime(2021, 5, 4, 12, 30, 15, 123456)),
+            "date": datetime.date(2021, 5, 4),
+            "time": datetime.time(12, 30, 15, 123456),
+            "timedelta": datetime.timedelta(days=1, seconds=5),
+            "list": [1, 2.5, "text", None, True],
+            "unicode": "zażółć",
+        },
+        "errors": [{"message": "Error", "path": ["field", 0]}],
+    }
+
+
+def test_default_codec_output_is_identical_to_json_response(value):
+    assert JSONCodec().dumps(value) == JsonResponse(value).content
+
+
+def test_orjson_codec_output_is_equivalent_to_default_codec(value):
+    assert json.loads(OrjsonCodec().dumps(value)) == json.loads(JSONCodec().dumps(value))
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), OrjsonCodec()])
+def test_codec_loads_request_body(codec):
+    assert codec.loads(b'{"query": "{ status }"}') == {"query": "{ status }"}
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), OrjsonCodec()])
+def test_codec_raises_value_error_for_malformed_json(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"{malformed")
+
+
+def test_view_uses_custom_codec(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, json_codec=OrjsonCodec())
+    request = request_factory.post("/graphql/", data={"query": "{ status }"}, content_type="application/json")
+    response = view(request)
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.content == b'{"data":{"status":true}}'
+
+
+def test_view_with_custom_codec_rejects_malformed_json(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, json_codec=OrjsonCodec())
+    request = request_factory.post("/graphql/", data="{malformed", content_type="application/json")
+    response = view(request)
+    assert response.status_code == 400
+    assert response.content == b"Request body is not a valid JSON"
+
+
+@pytest.mark.asyncio
+async def test_async_view_uses_custom_codec(schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=schema, json_codec=OrjsonCodec())
+    request = request_factory.post("/graphql/", data={"query": "{ status }"}, content_type="application/json")
+    response = await view(request)
+    assert response.status_code == 200
+    assert response.content == b'{"data":{"status":true}}'
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), OrjsonCodec()])
+def test_codec_iterencode_output_is_equivalent_to_dumps(codec, value):
+    assert json.loads(b"".join(codec.iterencode(value))) == json.loads(codec.dumps(value))
+
+
+def test_default_codec_iterencode_output_is_identical_to_dumps(value):
+    value["data"]["empty_list"] = []
+    value["data"]["empty_dict"] = {}
+    codec = JSONCodec()
+    assert b"".join(codec.iterencode(value)) == codec.dumps(value)
+
+
+def test_orjson_codec_iterencode_output_is_identical_to_dumps(value):
+    codec = OrjsonCodec()
+    assert b"".join(codec.iterencode(value)) == codec.dumps(value)
+
+
+def test_codec_iterencode_yields_chunks_of_given_size():
+    chunks = list(JSONCodec().iterencode({"data": {"items": list(range(1000))}}, chunk_size=100))
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+    assert all(len(chunk) < 110 for chunk in chunks)
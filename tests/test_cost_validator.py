@@ -0,0 +1,139 @@
+import json
+
+from ariadne import QueryType, make_executable_schema
+
+import pytest
+from graphql import parse, validate
+
+from ariadne_django.execution import DocumentCache
+from ariadne_django.validation import CostValidator, cost_directive, cost_validator
+from ariadne_django.views import GraphQLView
+
+
+@pytest.fixture
+def cost_schema():
+    type_defs = """
+        type Query {
+            constant: Int!
+            simple(value: Int!): Int!
+            complex(value: Int): Int! @cost(complexity: 5, multipliers: ["value"])
+            items(first: Int, limit: Int): [Item!]!
+            node: Node
+        }
+
+        interface Node {
+            id: ID!
+        }
+
+        type Item implements Node {
+            id: ID!
+            name: String
+            children(first: Int): [Item!]!
+        }
+    """
+    query = QueryType()
+    query.set_field("items", lambda *_, **__: [])
+    return make_executable_schema([cost_directive, type_defs], query)
+
+
+def validate_cost(schema, query, maximum_cost, **kwargs):
+    return validate(schema, parse(query), [cost_validator(maximum_cost, **kwargs)])
+
+
+def get_cost(error):
+    return error.extensions["cost"]["requestedQueryCost"]
+
+
+def test_query_within_maximum_cost_is_valid(cost_schema):
+    assert validate_cost(cost_schema, "{ constant simple(value: 1) }", 0) == []
+
+
+def test_complexity_and_multipliers_are_read_from_cost_directive(cost_schema):
+    errors = validate_cost(cost_schema, "{ complex(value: 3) }", 10)
+    assert len(errors) == 1
+    assert get_cost(errors[0]) == 15
+    assert errors[0].message == "The query exceeds the maximum cost of 10. Actual cost is 15"
+
+
+def test_multipliers_are_read_from_variables(cost_schema):
+    document = parse("query($value: Int) { complex(value: $value) }")
+    assert validate(cost_schema, document, [cost_validator(10)]) == []
+    errors = cost_validator(10).validate_variables(cost_schema, document, {"value": 4}, None)
+    assert get_cost(errors[0]) == 20
+
+
+def test_default_values_of_variables_are_used_as_multipliers(cost_schema):
+    document = parse("query($value: Int = 3) { complex(value: $value) }")
+    errors = cost_validator(10).validate_variables(cost_schema, document, None, None)
+    assert get_cost(errors[0]) == 15
+
+
+def test_operations_with_invalid_variables_are_not_validated(cost_schema):
+    document = parse("query($value: Int) { complex(value: $value) }")
+    assert cost_validator(10).validate_variables(cost_schema, document, {"value": "many"}, None) == []
+
+
+def test_list_fields_are_multiplied_by_first_and_limit_arguments(cost_schema):
+    errors = validate_cost(cost_schema, "{ items(first: 10) { id children(first: 5) { id } } }", 0)
+    assert get_cost(errors[0]) == 10 * (1 + 5 * 1)
+
+    errors = validate_cost(cost_schema, "{ items(limit: 3) { id } }", 0)
+    assert get_cost(errors[0]) == 3
+
+
+def test_cost_map_overrides_default_costs(cost_schema):
+    cost_map = {"Query": {"simple": {"complexity": 7}}, "Item": {"name": {"complexity": 2}}}
+    errors = validate_cost(cost_schema, "{ simple(value: 1) items(first: 2) { name } }", 0, cost_map=cost_map)
+    assert get_cost(errors[0]) == 7 + 2 * (1 + 2)
+
+
+def test_fragments_are_included_in_cost(cost_schema):
+    query = """
+        { items(first: 2) { ...ItemFields } node { ... on Item { ...ItemFields } } }
+        fragment ItemFields on Item { children(first: 3) { id } }
+    """
+    errors = validate_cost(cost_schema, query, 0)
+    assert get_cost(errors[0]) == 2 * (1 + 3) + (1 + 3)
+
+
+def test_same_configuration_returns_same_rule():
+    assert cost_validator(10, cost_map={"Query": {"items": {"complexity": 2}}}) is cost_validator(
+        10, cost_map={"Query": {"items": {"complexity": 2}}}
+    )
+    assert cost_validator(10) is not cost_validator(20)
+
+
+def test_cost_validation_result_is_cached_with_document(cost_schema, request_factory, mocker):
+    compute_cost = mocker.spy(CostValidator, "enter_operation_definition")
+    document_cache = DocumentCache()
+    view = GraphQLView.as_view(
+        schema=cost_schema,
+        document_cache=document_cache,
+        validation_rules=lambda context, document, data: [cost_validator(5)],
+    )
+
+    def execute_query(query, variables=None):
+        request = request_factory.post(
+            "/graphql/", data={"query": query, "variables": variables}, content_type="application/json"
+        )
+        return view(request)
+
+    response = execute_query("{ items(first: 10) { id } }")
+    assert response.status_code == 400
+    assert json.loads(response.content)["errors"][0]["extensions"]["cost"]["requestedQueryCost"] == 10
+    assert compute_cost.call_count == 1
+
+    response = execute_query("{ items(first: 10) { id } }")
+    assert response.status_code == 400
+    assert compute_cost.call_count == 1
+
+    # Cost of operations with variables is computed with their values for every request,
+    # while the result of validation of the document is cached once.
+    query = "query($n: Int) { items(first: $n) { id } }"
+    response = execute_query(query, {"n": 2})
+    assert response.status_code == 200
+    response = execute_query(query, {"n": 10})
+    assert response.status_code == 400
+    assert json.loads(response.content)["errors"][0]["extensions"]["cost"]["requestedQueryCost"] == 10
+    assert compute_cost.call_count == 4
+    assert len(document_cache.get(query).validation_errors) == 1
@@ -0,0 +1,267 @@
+import asyncio
+import json
+
+from ariadne import ObjectType, QueryType, make_executable_schema
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from ariadne_django.dataloaders import AsyncDataLoader, DataLoader, LoaderRegistry, registry
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+from .models import Author, Document
+
+
+try:
+    from unittest.mock import AsyncMock
+except ImportError:  # Python < 3.8
+    from mock import AsyncMock  # type: ignore
+
+
+def test_data_loader_loads_many_keys_in_one_batch(mocker):
+    batch_load = mocker.Mock(side_effect=lambda keys: [key * 2 for key in keys])
+    loader = DataLoader(batch_load)
+    assert loader.load_many([1, 2, 1, 3]) == [2, 4, 2, 6]
+    batch_load.assert_called_once_with([1, 2, 3])
+
+
+def test_data_loader_caches_loaded_values(mocker):
+    batch_load = mocker.Mock(side_effect=lambda keys: [key * 2 for key in keys])
+    loader = DataLoader(batch_load)
+    assert loader.load(1) == 2
+    assert loader.load_many([1, 2]) == [2, 4]
+    assert batch_load.call_count == 2
+    batch_load.assert_called_with([2])
+
+
+def test_data_loader_without_cache_loads_values_every_time(mocker):
+    batch_load = mocker.Mock(side_effect=lambda keys: keys)
+    loader = DataLoader(batch_load, cache=False)
+    loader.load(1)
+    loader.load(1)
+    assert batch_load.call_count == 2
+
+
+def test_data_loader_splits_keys_in_batches_of_max_size(mocker):
+    batch_load = mocker.Mock(side_effect=lambda keys: keys)
+    loader = DataLoader(batch_load, max_batch_size=2)
+    assert loader.load_many([1, 2, 3]) == [1, 2, 3]
+    assert batch_load.call_args_list == [mocker.call([1, 2]), mocker.call([3])]
+
+
+def test_data_loader_raises_error_returned_for_key():
+    loader = DataLoader(lambda keys: [ValueError(key) if key == 2 else key for key in keys])
+    assert loader.load(1) == 1
+    with pytest.raises(ValueError):
+        loader.load(2)
+
+
+def test_data_loader_raises_error_if_batch_result_has_invalid_length():
+    loader = DataLoader(lambda keys: [])
+    with pytest.raises(ValueError):
+        loader.load(1)
+
+
+def test_primed_value_is_returned_without_loading(mocker):
+    batch_load = mocker.Mock(side_effect=lambda keys: keys)
+    loader = DataLoader(batch_load)
+    loader.prime(1, "primed")
+    assert loader.load(1) == "primed"
+    batch_load.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_data_loader_batches_keys_loaded_in_same_loop_iteration():
+    batch_load = AsyncMock(side_effect=lambda keys: [key * 2 for key in keys])
+    loader = AsyncDataLoader(batch_load)
+    assert await asyncio.gather(loader.load(1), loader.load(2), loader.load(1)) == [2, 4, 2]
+    batch_load.assert_awaited_once_with([1, 2])
+    assert await loader.load(2) == 4
+    assert batch_load.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_data_loader_sets_errors_for_keys():
+    async def batch_load(keys):
+        return [ValueError(key) if key == 2 else key for key in keys]
+
+    loader = AsyncDataLoader(batch_load)
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert results[0] == 1
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_async_data_loader_does_not_cache_failed_batch():
+    async def batch_load(keys):
+        raise ValueError()
+
+    loader = AsyncDataLoader(batch_load)
+    with pytest.raises(ValueError):
+        await loader.load(1)
+    assert not loader._futures  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_async_data_loader_skips_cancelled_futures():
+    batch_load = AsyncMock(side_effect=lambda keys: keys)
+    loader = AsyncDataLoader(batch_load)
+    cancelled, loaded = loader.load(1), loader.load(2)
+    cancelled.cancel()
+    assert await loaded == 2
+    batch_load.assert_awaited_once_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_async_data_loader_keeps_dispatch_task_until_done():
+    loader = AsyncDataLoader(lambda keys: asyncio.sleep(0, keys))
+    future = loader.load(1)
+    await asyncio.sleep(0)
+    assert loader._dispatch_tasks  # pylint: disable=protected-access
+    assert await future == 1
+    await asyncio.sleep(0)
+    assert not loader._dispatch_tasks  # pylint: disable=protected-access
+
+
+def test_registry_returns_same_loader_for_same_key():
+    registry = LoaderRegistry()
+    assert registry.model(Author) is registry.model(Author)
+    assert registry.model(Author) is not registry.model(Author, "name")
+    assert isinstance(registry.model(Author), DataLoader)
+    assert isinstance(LoaderRegistry(is_async=True).model(Author), AsyncDataLoader)
+
+
+@pytest.mark.django_db
+def test_model_loader_loads_instances_by_pk(django_assert_num_queries):
+    authors = [Author.objects.create(name=name) for name in ("Bob", "Alice")]
+    loader = LoaderRegistry().model(Author)
+    with django_assert_num_queries(1):
+        assert loader.load_many([authors[1].pk, str(authors[0].pk), 0]) == [authors[1], authors[0], None]
+
+
+@pytest.mark.django_db
+def test_related_loader_loads_lists_of_instances(django_assert_num_queries):
+    bob, alice = Author.objects.create(name="Bob"), Author.objects.create(name="Alice")
+    documents = [Document.objects.create(name=str(i), author=bob) for i in range(2)]
+    loader = LoaderRegistry().related(Document, "author")
+    with django_assert_num_queries(1):
+        assert loader.load_many([bob.pk, alice.pk]) == [documents, []]
+
+
+@pytest.fixture
+def documents_schema():
+    type_defs = """
+        type Query {
+            documents: [Document!]!
+        }
+
+        type Document {
+            name: String!
+            author: Author!
+        }
+
+        type Author {
+            name: String!
+        }
+    """
+    query = QueryType()
+    query.set_field("documents", lambda *_: list(Document.objects.order_by("pk")))
+    document = ObjectType("Document")
+    document.set_field("author", lambda obj, info: info.context["loaders"].model(Author).load(obj.author_id))
+    return make_executable_schema(type_defs, query, document)
+
+
+@pytest.fixture
+def documents(db):  # pylint: disable=unused-argument
+    bob, alice = Author.objects.create(name="Bob"), Author.objects.create(name="Alice")
+    for i, author in enumerate((bob, alice, bob)):
+        Document.objects.create(name=str(i), author=author)
+
+
+def get_documents_request(request_factory):
+    return request_factory.post(
+        "/graphql/", data={"query": "{ documents { name author { name } } }"}, content_type="application/json"
+    )
+
+
+def test_sync_view_context_contains_synchronous_loaders(schema, request_factory):
+    view = GraphQLView(schema=schema)
+    request = request_factory.post("/graphql/", data={"query": "{ status }"}, content_type="application/json")
+    context_value = view.get_context_for_request(request)
+    assert context_value["request"] is request
+    assert isinstance(context_value["loaders"], LoaderRegistry)
+    assert not context_value["loaders"].is_async
+
+
+def test_view_context_does_not_contain_loaders_if_registry_is_none(schema, request_factory):
+    class NoLoadersGraphQLView(GraphQLView):
+        def get_loader_registry(self, request):  # pylint: disable=unused-argument
+            return None
+
+    view = NoLoadersGraphQLView(schema=schema)
+    request = request_factory.post("/graphql/", data={"query": "{ status }"}, content_type="application/json")
+    context_value = view.get_context_for_request(request)
+    assert context_value == {"request": request}
+
+
+@pytest.mark.django_db
+def test_sync_view_loads_every_distinct_key_once(
+    documents_schema, documents, request_factory, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    view = GraphQLView.as_view(schema=documents_schema)
+    # One query for documents and one for each distinct author.
+    with django_assert_num_queries(3):
+        response = view(get_documents_request(request_factory))
+    assert json.loads(response.content)["data"]["documents"] == [
+        {"name": "0", "author": {"name": "Bob"}},
+        {"name": "1", "author": {"name": "Alice"}},
+        {"name": "2", "author": {"name": "Bob"}},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_async_view_loads_related_instances_in_one_batch(
+    documents_schema, documents, request_factory, mocker
+):  # pylint: disable=unused-argument
+    documents_schema.query_type.fields["documents"].resolve = sync_to_async(
+        lambda *_: list(Document.objects.order_by("pk"))
+    )
+    aload_by_field = mocker.patch.object(registry, "aload_by_field", AsyncMock(wraps=registry.aload_by_field))
+    view = GraphQLAsyncView.as_view(schema=documents_schema)
+    response = await view(get_documents_request(request_factory))
+    assert json.loads(response.content)["data"]["documents"] == [
+        {"name": "0", "author": {"name": "Bob"}},
+        {"name": "1", "author": {"name": "Alice"}},
+        {"name": "2", "author": {"name": "Bob"}},
+    ]
+    assert aload_by_field.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_async_loaders_are_used_by_resolvers_run_in_thread_pool(
+    documents_schema, documents, request_factory
+):  # pylint: disable=unused-argument
+    view = GraphQLAsyncView.as_view(schema=documents_schema, run_sync_resolvers_in_threads=True)
+    response = await view(get_documents_request(request_factory))
+    assert json.loads(response.content) == {
+        "data": {
+            "documents": [
+                {"name": "0", "author": {"name": "Bob"}},
+                {"name": "1", "author": {"name": "Alice"}},
+                {"name": "2", "author": {"name": "Bob"}},
+            ]
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_loader_called_in_thread_loads_key_in_event_loop():
+    async def batch_load_fn(keys):
+        return [key * 2 for key in keys]
+
+    loader = AsyncDataLoader(batch_load_fn)
+    loop = asyncio.get_event_loop()
+    results = await asyncio.gather(*(await loop.run_in_executor(None, lambda: [loader.load(1), loader.load(2)])))
+    assert results == [2, 4]
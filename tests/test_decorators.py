@@ -1,10 +1,23 @@
+import asyncio
+import threading
 from unittest.mock import Mock
 
 from django.core.exceptions import PermissionDenied
+from django.db.models import QuerySet
+from django.utils.functional import SimpleLazyObject
 
 import pytest
+from asgiref.sync import sync_to_async
 
-from ariadne_django.auth.decorators import login_required, permission_required
+from ariadne_django.auth.decorators import login_required, object_permission_required, permission_required
+
+from .models import Author
+
+
+try:
+    from unittest.mock import AsyncMock
+except ImportError:  # Python < 3.8
+    from mock import AsyncMock  # type: ignore
 
 
 def test_unauthenticated_user(unauthenticated_user, graphql_resolve_info):
@@ -48,3 +61,158 @@ def test_user_without_permissions(authenticated_user_without_permissions, graphq
     decorator = wrapped_decorator(lambda x: x)
     with pytest.raises(PermissionDenied):
         decorator((), info)
+
+
+def test_permissions_are_checked_once_per_request(authenticated_user, graphql_resolve_info):
+    authenticated_user.has_perms = Mock(return_value=True)
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    decorator = permission_required("meow")(Mock())
+    decorator((), info)
+    decorator((), info)
+    authenticated_user.has_perms.assert_called_once_with(("meow",))
+
+
+def test_permission_cache_is_reset_when_user_changes(
+    authenticated_user_with_permissions, authenticated_user_without_permissions, graphql_resolve_info
+):
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user_with_permissions)
+    decorator = permission_required(["meow"])(Mock())
+    decorator((), info)
+    info.context["request"].user = authenticated_user_without_permissions
+    with pytest.raises(PermissionDenied):
+        decorator((), info)
+
+
+def test_object_permissions_filter_list_results(authenticated_user, graphql_resolve_info):
+    authenticated_user.has_perms = Mock(side_effect=lambda perms, obj=None: obj is not None and obj.name == "Bob")
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    authors = [Author(pk=1, name="Bob"), Author(pk=2, name="Alice"), Author(pk=1, name="Bob")]
+    decorator = object_permission_required("tests.view_author")(lambda *_: authors)
+    assert decorator((), info) == [authors[0], authors[2]]
+    assert decorator((), info) == [authors[0], authors[2]]
+    # Global permissions are checked once, and permissions for every distinct object once.
+    assert authenticated_user.has_perms.call_count == 3
+
+
+@pytest.mark.django_db
+def test_object_permissions_filter_queryset_results(
+    authenticated_user, graphql_resolve_info, django_assert_num_queries
+):
+    authenticated_user.has_perms = Mock(side_effect=lambda perms, obj=None: obj is not None and obj.name == "Bob")
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    bob = Author.objects.create(name="Bob")
+    Author.objects.create(name="Alice")
+    decorator = object_permission_required("tests.view_author")(lambda *_: Author.objects.order_by("pk"))
+    with django_assert_num_queries(1):
+        result = decorator((), info)
+        assert isinstance(result, QuerySet)
+        assert list(result) == [bob]
+    # Filtered QuerySet can still be filtered further by other decorators and middleware.
+    assert list(result.filter(name="Alice")) == []
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_async_resolver_object_permissions_filter_queryset_results(authenticated_user, graphql_resolve_info):
+    authenticated_user.has_perms = Mock(side_effect=lambda perms, obj=None: obj is not None and obj.name == "Bob")
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    bob = await sync_to_async(Author.objects.create)(name="Bob")
+    await sync_to_async(Author.objects.create)(name="Alice")
+    decorator = object_permission_required("tests.view_author")(AsyncMock(return_value=Author.objects.order_by("pk")))
+    result = await decorator((), info)
+    assert isinstance(result, QuerySet)
+    # Results are loaded, so the QuerySet can be iterated in the event loop.
+    assert list(result) == [bob]
+
+
+def test_object_permissions_are_not_checked_for_user_with_global_permissions(
+    authenticated_user_with_permissions, graphql_resolve_info
+):
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user_with_permissions)
+    authors = [Author(pk=1, name="Bob"), Author(pk=2, name="Alice")]
+    decorator = object_permission_required("tests.view_author")(lambda *_: authors)
+    assert decorator((), info) == authors
+
+
+def test_object_permissions_without_global_permissions(authenticated_user, graphql_resolve_info):
+    authenticated_user.has_perms = Mock(side_effect=lambda perms, obj=None: obj is not None)
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    decorator = object_permission_required("tests.view_author", accept_global_perms=False)(lambda *_: Author(pk=1))
+    assert decorator((), info).pk == 1
+    authenticated_user.has_perms.assert_called_once()
+
+
+def test_object_permission_denied_for_single_object(authenticated_user_without_permissions, graphql_resolve_info):
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user_without_permissions)
+    decorator = object_permission_required("tests.view_author")(lambda *_: Author(pk=1))
+    with pytest.raises(PermissionDenied):
+        decorator((), info)
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_with_unauthenticated_user(unauthenticated_user, graphql_resolve_info):
+    info = graphql_resolve_info("GET", "/graphql/", unauthenticated_user)
+    func = AsyncMock()
+    decorator = login_required()(func)
+    with pytest.raises(PermissionDenied):
+        await decorator((), info)
+    func.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_loads_lazy_user_in_thread_once(authenticated_user, graphql_resolve_info):
+    threads = []
+
+    def get_user():
+        threads.append(threading.get_ident())
+        return authenticated_user
+
+    info = graphql_resolve_info("GET", "/graphql/", SimpleLazyObject(get_user))
+    decorator = login_required()(AsyncMock(return_value="result"))
+    assert await asyncio.gather(decorator((), info), decorator((), info)) == ["result", "result"]
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_loads_user_with_auser(authenticated_user, graphql_resolve_info):
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    info.context["request"].auser = AsyncMock(return_value=authenticated_user)
+    decorator = login_required()(AsyncMock())
+    await asyncio.gather(decorator((), info), decorator((), info))
+    info.context["request"].auser.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_permissions_are_checked_once_per_request(authenticated_user, graphql_resolve_info):
+    authenticated_user.has_perms = Mock(return_value=True)
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    func = AsyncMock(return_value="result")
+    decorator = permission_required("meow")(func)
+    assert await asyncio.gather(decorator((), info), decorator((), info)) == ["result", "result"]
+    assert await decorator((), info) == "result"
+    authenticated_user.has_perms.assert_called_once_with(("meow",))
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_without_permissions(authenticated_user_without_permissions, graphql_resolve_info):
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user_without_permissions)
+    decorator = permission_required(["meow"])(AsyncMock())
+    with pytest.raises(PermissionDenied):
+        await decorator((), info)
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_object_permissions_are_checked_in_batch(authenticated_user, graphql_resolve_info):
+    authenticated_user.has_perms = Mock(side_effect=lambda perms, obj=None: obj is not None and obj.name == "Bob")
+    info = graphql_resolve_info("GET", "/graphql/", authenticated_user)
+    authors = [Author(pk=1, name="Bob"), Author(pk=2, name="Alice"), Author(pk=1, name="Bob"), Author(name="Bob")]
+    decorator = object_permission_required("tests.view_author")(AsyncMock(return_value=authors))
+    assert await decorator((), info) == [authors[0], authors[2], authors[3]]
+    assert await decorator((), info) == [authors[0], authors[2], authors[3]]
+    # Global permissions are checked once, and unsaved object every time.
+    assert authenticated_user.has_perms.call_count == 5
+
+    decorator = object_permission_required("tests.view_author")(AsyncMock(return_value=authors[1]))
+    with pytest.raises(PermissionDenied):
+        await decorator((), info)
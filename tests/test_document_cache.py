@@ -0,0 +1,112 @@
+import json
+from unittest.mock import Mock
+
+from ariadne.graphql import parse_query as ariadne_parse_query
+
+import pytest
+
+from ariadne_django.execution import DocumentCache
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+def execute_query(view, request_factory, query):
+    request = request_factory.post("/graphql/", data={"query": query}, content_type="application/json")
+    return view(request)
+
+
+def test_document_cache_is_created_for_view(schema):
+    view = GraphQLView.as_view(schema=schema)
+    assert isinstance(view.document_cache, DocumentCache)  # pylint: disable=no-member
+    assert view.document_cache.maxsize == GraphQLView.document_cache_size  # pylint: disable=no-member
+
+
+def test_document_cache_size_can_be_set_on_view_init(schema):
+    view = GraphQLView.as_view(schema=schema, document_cache_size=2)
+    assert view.document_cache.maxsize == 2  # pylint: disable=no-member
+
+
+def test_document_cache_can_be_disabled_on_view_init(request_factory, schema):
+    view = GraphQLView.as_view(schema=schema, document_cache_size=0)
+    assert view.document_cache is None  # pylint: disable=no-member
+    response = execute_query(view, request_factory, "{ status }")
+    assert json.loads(response.content) == {"data": {"status": True}}
+
+
+def test_repeated_query_is_served_from_document_cache(mocker, request_factory, schema):
+    view = GraphQLView.as_view(schema=schema)
+    parse_query = mocker.patch("ariadne_django.execution.graphql.parse_query", wraps=ariadne_parse_query)
+    for _ in range(3):
+        response = execute_query(view, request_factory, "{ status }")
+        assert json.loads(response.content) == {"data": {"status": True}}
+
+    parse_query.assert_called_once()
+    info = view.document_cache.info()  # pylint: disable=no-member
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_validation_errors_are_served_from_document_cache(request_factory, schema):
+    view = GraphQLView.as_view(schema=schema)
+    first_response = execute_query(view, request_factory, "{ unknown }")
+    second_response = execute_query(view, request_factory, "{ unknown }")
+    assert first_response.status_code == second_response.status_code == 400
+    assert first_response.content == second_response.content
+    assert view.document_cache.info().hits == 1  # pylint: disable=no-member
+
+
+def test_document_is_revalidated_for_different_validation_rules(mocker, request_factory, schema, validation_rule):
+    document_cache = DocumentCache()
+    spy_validation_rule = mocker.spy(validation_rule, "__init__")
+    view = GraphQLView.as_view(schema=schema, document_cache=document_cache, validation_rules=[validation_rule])
+    execute_query(view, request_factory, "{ status }")
+    execute_query(view, request_factory, "{ status }")
+    spy_validation_rule.assert_called_once()
+
+    view = GraphQLView.as_view(schema=schema, document_cache=document_cache)
+    response = execute_query(view, request_factory, "{ status }")
+    assert json.loads(response.content) == {"data": {"status": True}}
+    assert document_cache.info().hits == 2
+
+
+def test_introspection_is_revalidated_when_disabled(request_factory, schema):
+    document_cache = DocumentCache()
+    view = GraphQLView.as_view(schema=schema, document_cache=document_cache)
+    response = execute_query(view, request_factory, "{ __schema { queryType { name } } }")
+    assert response.status_code == 200
+
+    view = GraphQLView.as_view(schema=schema, document_cache=document_cache, introspection=False)
+    response = execute_query(view, request_factory, "{ __schema { queryType { name } } }")
+    assert response.status_code == 400
+
+
+def test_least_recently_used_document_is_evicted():
+    document_cache = DocumentCache(maxsize=2)
+    document_cache.set("{ a }", Mock())
+    document_cache.set("{ b }", Mock())
+    assert document_cache.get("{ a }") is not None
+    document_cache.set("{ c }", Mock())
+
+    assert document_cache.get("{ b }") is None
+    assert document_cache.get("{ a }") is not None
+    assert document_cache.get("{ c }") is not None
+    info = document_cache.info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+
+
+def test_clearing_document_cache_resets_counters():
+    document_cache = DocumentCache()
+    document_cache.set("{ a }", Mock())
+    document_cache.get("{ a }")
+    document_cache.clear()
+    assert document_cache.info() == (0, 0, 0, 128, 0)
+
+
+@pytest.mark.asyncio
+async def test_async_view_uses_document_cache(request_factory, schema):
+    view = GraphQLAsyncView.as_view(schema=schema)
+    for _ in range(2):
+        response = await execute_query(view, request_factory, "{ status }")
+        assert json.loads(response.content) == {"data": {"status": True}}
+    assert view.document_cache.info().hits == 1  # pylint: disable=no-member
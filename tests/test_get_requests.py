@@ -0,0 +1,108 @@
+import json
+
+from django.core.cache import cache
+
+import pytest
+
+from ariadne_django.execution import ResponseCache
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+@pytest.fixture
+def view(schema):
+    return GraphQLView.as_view(schema=schema, cache_control="public, max-age=60")
+
+
+def test_query_is_executed_over_get_request(view, request_factory):
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}))
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"data": {"status": True}}
+
+
+def test_query_variables_and_operation_name_are_read_from_query_string(view, request_factory):
+    request = request_factory.get(
+        "/graphql/",
+        {
+            "query": "query A { status } query B($name: String) { hello(name: $name) }",
+            "variables": json.dumps({"name": "Bob"}),
+            "operationName": "B",
+        },
+    )
+    response = view(request)
+    assert json.loads(response.content) == {"data": {"hello": "Hello, Bob!"}}
+
+
+def test_playground_is_served_for_get_request_accepting_html(view, request_factory):
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}, HTTP_ACCEPT="text/html,*/*"))
+    assert response.status_code == 200
+    assert b"GraphQL Playground" in response.content
+
+
+def test_get_response_has_cache_headers(view, request_factory):
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}))
+    assert response["Cache-Control"] == "public, max-age=60"
+    assert response["ETag"]
+    assert "Accept" in response["Vary"]
+
+
+def test_get_response_has_no_cache_control_by_default(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema)
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}))
+    assert not response.has_header("Cache-Control")
+    assert response.has_header("ETag")
+
+
+def test_etag_can_be_disabled(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, etag=False)
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}))
+    assert not response.has_header("ETag")
+
+
+def test_not_modified_response_is_returned_for_matching_etag(view, request_factory):
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}))
+    etag = response["ETag"]
+
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}, HTTP_IF_NONE_MATCH=etag))
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+
+def test_full_response_is_returned_for_stale_etag(view, request_factory):
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}, HTTP_IF_NONE_MATCH='"stale"'))
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"data": {"status": True}}
+
+
+def test_failed_query_response_is_not_cached(view, request_factory):
+    response = view(request_factory.get("/graphql/", {"query": "{ unknown }"}))
+    assert response.status_code == 400
+    assert not response.has_header("Cache-Control")
+    assert not response.has_header("ETag")
+
+
+@pytest.mark.asyncio
+async def test_async_view_returns_not_modified_response_for_matching_etag(schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=schema, cache_control="public, max-age=60")
+    response = await view(request_factory.get("/graphql/", {"query": "{ status }"}))
+    assert response.status_code == 200
+    assert response["Cache-Control"] == "public, max-age=60"
+
+    request = request_factory.get("/graphql/", {"query": "{ status }"}, HTTP_IF_NONE_MATCH=response["ETag"])
+    response = await view(request)
+    assert response.status_code == 304
+
+
+def test_not_modified_response_is_returned_from_response_cache_without_execution(mocker, schema, request_factory):
+    cache.clear()
+    view = GraphQLView.as_view(schema=schema, response_cache=ResponseCache())
+    response = view(request_factory.get("/graphql/", {"query": "query Status { status }"}))
+    assert response["ETag"].startswith("W/")
+
+    execute = mocker.patch("ariadne_django.execution.graphql.execute_sync")
+    request = request_factory.get(
+        "/graphql/", {"query": "query Status { status }"}, HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+    response = view(request)
+    assert response.status_code == 304
+    assert not execute.called
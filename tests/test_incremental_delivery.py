@@ -0,0 +1,253 @@
+import asyncio
+import json
+from inspect import isawaitable
+
+import django
+
+from ariadne import MutationType, ObjectType, QueryType, make_executable_schema
+from ariadne.types import Extension
+
+import pytest
+from graphql import get_operation_ast, parse, print_ast
+
+from ariadne_django.execution import IncrementalDeliveryPlan, defer_directives
+from ariadne_django.views import GraphQLAsyncView
+
+
+# Multipart responses are streamed with asynchronous iterators, supported since Django 4.2.
+requires_django_42 = pytest.mark.skipif(django.VERSION < (4, 2), reason="requires Django 4.2+")
+
+
+type_defs = """
+    type Query {
+        fast: String!
+        slow: String!
+        failing: String
+        items: [Item!]!
+    }
+
+    type Mutation {
+        update: Item!
+    }
+
+    type Item {
+        id: ID!
+        details: String!
+    }
+"""
+
+
+@pytest.fixture
+def slow_event():
+    return asyncio.Event()
+
+
+@pytest.fixture
+def resolved_fields():
+    return []
+
+
+@pytest.fixture
+def incremental_schema(slow_event, resolved_fields):
+    query = QueryType()
+    query.set_field("fast", lambda *_: "fast")
+
+    @query.field("items")
+    def resolve_items(*_):
+        resolved_fields.append("items")
+        return [{"id": i} for i in range(3)]
+
+    @query.field("slow")
+    async def resolve_slow(*_):
+        await slow_event.wait()
+        return "slow"
+
+    @query.field("failing")
+    def resolve_failing(*_):
+        raise ValueError("Failed")
+
+    mutation = MutationType()
+    mutation.set_field("update", lambda *_: {"id": 1})
+    item = ObjectType("Item")
+    item.set_field("details", lambda obj, *_: "details {}".format(obj["id"]))
+    return make_executable_schema([defer_directives, type_defs], query, mutation, item)
+
+
+def get_plan(schema, query, variables=None):
+    document = parse(query)
+    return IncrementalDeliveryPlan(schema, document, get_operation_ast(document), variables)
+
+
+def test_deferred_fragments_are_split_from_initial_document(incremental_schema):
+    plan = get_plan(
+        incremental_schema,
+        '{ fast ... @defer(label: "s") { slow } items { id ...Details @defer } }'
+        " fragment Details on Item { details }",
+    )
+    assert print_ast(plan.initial_document) == "{\n  fast\n  items {\n    id\n  }\n}"
+    assert [print_ast(part.document) for part in plan.deferred] == [
+        "{\n  ... {\n    slow\n  }\n}",
+        "{\n  ... on Item {\n    details\n  }\n}",
+    ]
+    assert [(part.path, part.label) for part in plan.deferred] == [([], "s"), (["items"], None)]
+
+
+def test_defer_is_disabled_with_if_argument(incremental_schema):
+    plan = get_plan(incremental_schema, "query($d: Boolean!) { ... @defer(if: $d) { slow } }", {"d": False})
+    assert plan.deferred == []
+
+
+def test_streamed_field_is_removed_from_initial_document(incremental_schema):
+    plan = get_plan(incremental_schema, "{ fast items @stream { id } }")
+    assert print_ast(plan.initial_document) == "{\n  fast\n}"
+    assert print_ast(plan.deferred[0].document) == "{\n  items {\n    id\n  }\n}"
+
+
+def get_request(request_factory, query, accept="multipart/mixed"):
+    return request_factory.post("/graphql/", data={"query": query}, content_type="application/json", HTTP_ACCEPT=accept)
+
+
+def parse_part(chunk):
+    headers, body = chunk.split(b"\r\n\r\n", 1)
+    assert headers.strip(b"\r\n-") == b"Content-Type: application/json; charset=utf-8"
+    return json.loads(body.rsplit(b"\r\n---", 1)[0])
+
+
+@requires_django_42
+@pytest.mark.asyncio
+async def test_initial_payload_is_sent_before_deferred_fields_resolve(incremental_schema, slow_event, request_factory):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, '{ fast ... @defer(label: "slow") { slow } }'))
+    assert response["Content-Type"] == 'multipart/mixed; boundary="-"; deferSpec=20220824'
+
+    content = response.streaming_content
+    first = await content.__anext__()
+    assert first.startswith(b"\r\n---\r\n")
+    assert parse_part(first) == {"data": {"fast": "fast"}, "hasNext": True}
+
+    slow_event.set()
+    assert parse_part(await content.__anext__()) == {
+        "hasNext": False,
+        "incremental": [{"data": {"slow": "slow"}, "path": [], "label": "slow"}],
+    }
+    assert await content.__anext__() == b"--\r\n"
+
+
+async def read_parts(response):
+    return [parse_part(chunk) async for chunk in response.streaming_content if chunk != b"--\r\n"]
+
+
+@requires_django_42
+@pytest.mark.asyncio
+async def test_fragments_deferred_in_lists_are_sent_with_item_paths(incremental_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, "{ items { id ... on Item @defer { details } } }"))
+    initial, subsequent = await read_parts(response)
+    assert initial == {"data": {"items": [{"id": "0"}, {"id": "1"}, {"id": "2"}]}, "hasNext": True}
+    assert subsequent == {
+        "hasNext": False,
+        "incremental": [{"data": {"details": "details {}".format(i)}, "path": ["items", i]} for i in range(3)],
+    }
+
+
+@requires_django_42
+@pytest.mark.asyncio
+async def test_deferred_fragments_are_resolved_with_parent_objects_of_initial_payload(
+    incremental_schema, request_factory, resolved_fields
+):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, '{ items { id ... @defer(label: "d") { details } } }'))
+    _, subsequent = await read_parts(response)
+    assert subsequent["incremental"][2] == {"data": {"details": "details 2"}, "path": ["items", 2], "label": "d"}
+    assert resolved_fields == ["items"]
+
+
+@requires_django_42
+@pytest.mark.asyncio
+async def test_items_of_streamed_field_are_sent_after_initial_count(
+    incremental_schema, request_factory, resolved_fields
+):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, "{ items @stream(initialCount: 1) { id } }"))
+    initial, subsequent = await read_parts(response)
+    assert initial == {"data": {"items": [{"id": "0"}]}, "hasNext": True}
+    assert subsequent == {
+        "hasNext": False,
+        "incremental": [{"items": [{"id": "1"}, {"id": "2"}], "path": ["items", 1]}],
+    }
+    assert resolved_fields == ["items"]
+
+
+@requires_django_42
+@pytest.mark.asyncio
+async def test_streamed_field_without_initial_items_is_empty_in_initial_payload(incremental_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, "{ fast items @stream { id } }"))
+    initial, subsequent = await read_parts(response)
+    assert initial == {"data": {"fast": "fast", "items": []}, "hasNext": True}
+    assert subsequent["incremental"][0]["path"] == ["items", 0]
+
+
+@requires_django_42
+@pytest.mark.asyncio
+async def test_errors_of_deferred_fields_are_sent_in_subsequent_payload(incremental_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, "{ fast ... @defer { failing } }"))
+    _, subsequent = await read_parts(response)
+    item = subsequent["incremental"][0]
+    assert item["data"] == {"failing": None}
+    assert item["errors"][0]["message"] == "Failed"
+
+
+@requires_django_42
+@pytest.mark.asyncio
+async def test_extensions_request_lasts_until_last_payload(incremental_schema, slow_event, request_factory):
+    events = []
+
+    class RecordingExtension(Extension):
+        def request_started(self, context):
+            events.append("started")
+
+        def request_finished(self, context):
+            events.append("finished")
+
+        async def resolve(self, next_, obj, info, **kwargs):
+            events.append(info.field_name)
+            result = next_(obj, info, **kwargs)
+            return await result if isawaitable(result) else result
+
+    view = GraphQLAsyncView.as_view(schema=incremental_schema, extensions=[RecordingExtension])
+    response = await view(get_request(request_factory, "{ fast ... @defer { slow } }"))
+    content = response.streaming_content
+    await content.__anext__()
+    assert "finished" not in events
+
+    slow_event.set()
+    await content.__anext__()
+    assert await content.__anext__() == b"--\r\n"
+    assert events == ["started", "fast", "slow", "finished"]
+
+
+@pytest.mark.asyncio
+async def test_query_is_executed_in_one_payload_without_multipart_accept(
+    incremental_schema, slow_event, request_factory
+):
+    slow_event.set()
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, "{ fast ... @defer { slow } }", accept="application/json"))
+    assert json.loads(response.content) == {"data": {"fast": "fast", "slow": "slow"}}
+
+
+@pytest.mark.asyncio
+async def test_mutations_are_executed_in_one_payload(incremental_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, "mutation { update { id ... @defer { details } } }"))
+    assert json.loads(response.content) == {"data": {"update": {"id": "1", "details": "details 1"}}}
+
+
+@pytest.mark.asyncio
+async def test_invalid_query_errors_are_returned_in_one_payload(incremental_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=incremental_schema)
+    response = await view(get_request(request_factory, "{ fast ... @defer { unknown } }"))
+    assert response.status_code == 400
+    assert "errors" in json.loads(response.content)
@@ -0,0 +1,112 @@
+import json
+
+from ariadne import make_executable_schema
+
+import pytest
+from graphql import get_introspection_query, parse
+
+from ariadne_django.execution import IntrospectionCache, graphql_sync, is_introspection_operation
+from ariadne_django.validation import query_limits_validator
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+INTROSPECTION_QUERY = get_introspection_query()
+
+
+def execute_query(view, request_factory, query, **kwargs):
+    return view(request_factory.post("/graphql/", data={"query": query, **kwargs}, content_type="application/json"))
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        INTROSPECTION_QUERY,
+        '{ __typename __type(name: "Query") { name } }',
+        "{ ...Types } fragment Types on Query { __schema { types { name } } }",
+    ],
+)
+def test_operations_selecting_only_introspection_fields_are_detected(query):
+    assert is_introspection_operation(parse(query))
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ __schema { queryType { name } } status }",
+        "query($name: String!) { __type(name: $name) { name } }",
+        "{ ... on Query { status __typename } }",
+        "mutation { __typename }",
+    ],
+)
+def test_operations_selecting_other_fields_are_not_detected(query):
+    assert not is_introspection_operation(parse(query))
+
+
+def test_introspection_result_is_cached(request_factory, schema, mocker):
+    execute = mocker.patch("ariadne_django.views.graphql.graphql_sync", wraps=graphql_sync)
+    view = GraphQLView.as_view(schema=schema)
+    response = execute_query(view, request_factory, INTROSPECTION_QUERY, operationName="IntrospectionQuery")
+    cached_response = execute_query(view, request_factory, INTROSPECTION_QUERY, operationName="IntrospectionQuery")
+
+    assert execute.call_count == 1
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+    assert json.loads(cached_response.content)["data"]["__schema"]["queryType"]["name"] == "Query"
+    assert cached_response["ETag"]
+
+
+def test_cached_introspection_result_has_etag_for_get_requests(request_factory, schema):
+    view = GraphQLView.as_view(schema=schema)
+    execute_query(view, request_factory, INTROSPECTION_QUERY)
+
+    response = view(request_factory.get("/graphql/", {"query": INTROSPECTION_QUERY}))
+    assert response.status_code == 200
+    response = view(
+        request_factory.get("/graphql/", {"query": INTROSPECTION_QUERY}, HTTP_IF_NONE_MATCH=response["ETag"])
+    )
+    assert response.status_code == 304
+
+
+def test_other_operations_are_not_cached(request_factory, schema, mocker):
+    execute = mocker.patch("ariadne_django.views.graphql.graphql_sync", wraps=graphql_sync)
+    view = GraphQLView.as_view(schema=schema)
+    execute_query(view, request_factory, "{ __typename status }")
+    execute_query(view, request_factory, "{ __typename status }")
+    assert execute.call_count == 2
+
+
+def test_introspection_is_not_served_from_cache_if_disabled(request_factory, schema):
+    execute_query(GraphQLView.as_view(schema=schema), request_factory, INTROSPECTION_QUERY)
+    response = execute_query(
+        GraphQLView.as_view(schema=schema, introspection=False), request_factory, INTROSPECTION_QUERY
+    )
+    assert response.status_code == 400
+
+
+def test_introspection_results_are_cached_per_schema(request_factory, schema):
+    cache = IntrospectionCache()
+    other_schema = make_executable_schema("type Query { other: String }")
+    execute_query(GraphQLView.as_view(schema=schema, introspection_cache=cache), request_factory, INTROSPECTION_QUERY)
+    response = execute_query(
+        GraphQLView.as_view(schema=other_schema, introspection_cache=cache), request_factory, INTROSPECTION_QUERY
+    )
+    types = [type_["name"] for type_ in json.loads(response.content)["data"]["__schema"]["types"]]
+    assert "Subscription" not in types
+
+
+def test_introspection_results_are_cached_per_view(request_factory, schema):
+    execute_query(GraphQLView.as_view(schema=schema), request_factory, INTROSPECTION_QUERY)
+    limited_view = GraphQLView.as_view(schema=schema, validation_rules=[query_limits_validator(max_depth=2)])
+    response = execute_query(limited_view, request_factory, INTROSPECTION_QUERY)
+    assert response.status_code == 400
+    assert "exceeds the maximum of 2" in json.loads(response.content)["errors"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_introspection_result_is_cached_by_async_view(request_factory, schema, mocker):
+    view = GraphQLAsyncView.as_view(schema=schema)
+    response = await execute_query(view, request_factory, INTROSPECTION_QUERY)
+    execute = mocker.patch("ariadne_django.views.async_graphql.graphql")
+    cached_response = await execute_query(view, request_factory, INTROSPECTION_QUERY)
+    assert not execute.called
+    assert cached_response.content == response.content
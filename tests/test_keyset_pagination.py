@@ -0,0 +1,192 @@
+import json
+
+from ariadne import QueryType, make_executable_schema
+
+import pytest
+from asgiref.sync import sync_to_async
+from graphql import GraphQLError
+
+from ariadne_django.pagination import (
+    InvalidCursor,
+    connection_from_queryset,
+    decode_cursor,
+    encode_cursor,
+    page_info_type_defs,
+)
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+from .models import Author, Document
+
+
+@pytest.fixture
+def documents(db):  # pylint: disable=unused-argument
+    author = Author.objects.create(name="Bob")
+    return [Document.objects.create(name=name, author=author) for name in "cabdbae"]
+
+
+def get_names(connection):
+    return [edge["node"].name for edge in connection["edges"]]
+
+
+def paginate_forward(ordering, first):
+    names, after = [], None
+    while True:
+        connection = connection_from_queryset(Document.objects.all(), first=first, after=after, ordering=ordering)
+        names += get_names(connection)
+        if not connection["pageInfo"]["hasNextPage"]:
+            return names
+        after = connection["pageInfo"]["endCursor"]
+
+
+def paginate_backward(ordering, last):
+    names, before = [], None
+    while True:
+        connection = connection_from_queryset(Document.objects.all(), last=last, before=before, ordering=ordering)
+        names = get_names(connection) + names
+        if not connection["pageInfo"]["hasPreviousPage"]:
+            return names
+        before = connection["pageInfo"]["startCursor"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", [["name"], ["-name"], ["name", "-pk"], ["-author__name", "-name"]])
+def test_paginating_forward_returns_all_rows_once(documents, ordering):  # pylint: disable=unused-argument
+    expected = list(Document.objects.order_by(*ordering, "pk").values_list("name", flat=True))
+    assert paginate_forward(ordering, 2) == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", [["name"], ["-name"]])
+def test_paginating_backward_returns_all_rows_once(documents, ordering):  # pylint: disable=unused-argument
+    expected = list(Document.objects.order_by(*ordering, "pk").values_list("name", flat=True))
+    assert paginate_backward(ordering, 3) == expected
+
+
+@pytest.mark.django_db
+def test_next_page_is_checked_without_count_and_offset(
+    documents, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    with django_assert_num_queries(1) as context:
+        connection = connection_from_queryset(Document.objects.order_by("name"), first=7)
+    assert connection["pageInfo"]["hasNextPage"] is False
+    assert context.captured_queries[0]["sql"].endswith("LIMIT 8")
+
+    after = connection["edges"][2]["cursor"]
+    with django_assert_num_queries(1) as context:
+        connection = connection_from_queryset(Document.objects.order_by("name"), first=2, after=after)
+    assert get_names(connection) == ["b", "c"]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+    assert "OFFSET" not in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_cursors_of_related_ordering_keys_are_read_from_annotations(documents, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        connection = connection_from_queryset(Document.objects.all(), first=3, ordering=["author__name", "name"])
+        cursors = [edge["cursor"] for edge in connection["edges"]]
+    assert get_names(connection) == ["a", "a", "b"]
+    author_opts = Author._meta  # pylint: disable=protected-access
+    document_opts = Document._meta  # pylint: disable=protected-access
+    fields = [author_opts.get_field("name"), document_opts.get_field("name"), document_opts.pk]
+    assert decode_cursor(cursors[0], fields) == ["Bob", "a", documents[1].pk]
+
+
+@pytest.mark.django_db
+def test_first_and_last_are_combined(documents):  # pylint: disable=unused-argument
+    connection = connection_from_queryset(Document.objects.all(), first=4, last=2, ordering=["name"])
+    assert get_names(connection) == ["b", "b"]
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+
+
+@pytest.mark.django_db
+def test_rows_are_ordered_by_primary_key_by_default(documents):
+    connection = connection_from_queryset(Document.objects.all(), first=3)
+    assert [edge["node"] for edge in connection["edges"]] == documents[:3]
+
+
+def test_cursor_is_decoded_with_field_types():
+    fields = [Document._meta.get_field("name"), Document._meta.pk]  # pylint: disable=protected-access
+    assert decode_cursor(encode_cursor(["a", 1]), fields) == ["a", 1]
+    assert decode_cursor(encode_cursor(["a", "1"]), fields) == ["a", 1]
+
+
+@pytest.mark.parametrize("cursor", ["invalid", encode_cursor([1]), encode_cursor(["a", "b"]), encode_cursor({})])
+def test_invalid_cursor_raises_error(cursor):
+    fields = [Document._meta.get_field("name"), Document._meta.pk]  # pylint: disable=protected-access
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, fields)
+
+
+def test_limit_exceeding_maximum_raises_error():
+    with pytest.raises(GraphQLError):
+        connection_from_queryset(Document.objects.all(), first=101)
+    with pytest.raises(GraphQLError):
+        connection_from_queryset(Document.objects.all(), last=-1)
+
+
+def test_ordering_by_expressions_raises_error():
+    with pytest.raises(ValueError):
+        connection_from_queryset(Document.objects.order_by("?"), first=1)
+
+
+@pytest.fixture
+def connection_schema():
+    type_defs = """
+        type Query {
+            documents(first: Int, after: String, last: Int, before: String): DocumentConnection!
+        }
+
+        type DocumentConnection {
+            edges: [DocumentEdge!]!
+            pageInfo: PageInfo!
+            totalCount: Int!
+        }
+
+        type DocumentEdge {
+            cursor: String!
+            node: Document!
+        }
+
+        type Document {
+            name: String!
+        }
+    """
+    query = QueryType()
+    query.set_field(
+        "documents", lambda *_, **kwargs: connection_from_queryset(Document.objects.order_by("name"), **kwargs)
+    )
+    return make_executable_schema([page_info_type_defs, type_defs], query)
+
+
+@pytest.mark.django_db
+def test_connection_is_resolved_by_schema(
+    connection_schema, documents, request_factory, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    view = GraphQLView.as_view(schema=connection_schema)
+
+    def execute_query(query):
+        request = request_factory.post("/graphql/", data={"query": query}, content_type="application/json")
+        return json.loads(view(request).content)["data"]["documents"]
+
+    with django_assert_num_queries(1):
+        result = execute_query("{ documents(first: 2) { edges { node { name } } pageInfo { hasNextPage } } }")
+    assert result == {"edges": [{"node": {"name": "a"}}, {"node": {"name": "a"}}], "pageInfo": {"hasNextPage": True}}
+
+    with django_assert_num_queries(2):
+        result = execute_query("{ documents(first: 2) { totalCount } }")
+    assert result == {"totalCount": 7}
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_total_count_is_counted_in_async_view(connection_schema, request_factory):
+    author = await sync_to_async(Author.objects.create)(name="Bob")
+    for name in "cab":
+        await sync_to_async(Document.objects.create)(name=name, author=author)
+    view = GraphQLAsyncView.as_view(schema=connection_schema, run_sync_resolvers_in_threads=True)
+    request = request_factory.post(
+        "/graphql/", data={"query": "{ documents(first: 2) { totalCount } }"}, content_type="application/json"
+    )
+    response = await view(request)
+    assert json.loads(response.content) == {"data": {"documents": {"totalCount": 3}}}
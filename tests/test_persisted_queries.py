@@ -0,0 +1,123 @@
+import hashlib
+import json
+
+from django.core.cache import cache, caches
+
+import pytest
+
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+QUERY = "{ status }"
+QUERY_HASH = hashlib.sha256(QUERY.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def view(schema):
+    return GraphQLView.as_view(schema=schema, persisted_queries=True)
+
+
+def get_extensions(query_hash=QUERY_HASH):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+def post_query(view, request_factory, data):
+    request = request_factory.post("/graphql/", data=data, content_type="application/json")
+    response = view(request)
+    return response.status_code, json.loads(response.content)
+
+
+def test_persisted_query_is_not_found_before_registration(view, request_factory):
+    status_code, result = post_query(view, request_factory, {"extensions": get_extensions()})
+    assert status_code == 400
+    assert result["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert result["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_is_executed_by_hash_after_registration(view, request_factory):
+    status_code, result = post_query(view, request_factory, {"query": QUERY, "extensions": get_extensions()})
+    assert status_code == 200
+    assert result == {"data": {"status": True}}
+
+    status_code, result = post_query(view, request_factory, {"extensions": get_extensions()})
+    assert status_code == 200
+    assert result == {"data": {"status": True}}
+
+
+def test_persisted_query_is_not_registered_if_hash_does_not_match_query(view, request_factory):
+    status_code, result = post_query(view, request_factory, {"query": QUERY, "extensions": get_extensions("abc")})
+    assert status_code == 400
+    assert result["errors"][0]["extensions"]["code"] == "INVALID_PERSISTED_QUERY"
+
+    _, result = post_query(view, request_factory, {"extensions": get_extensions("abc")})
+    assert result["errors"][0]["message"] == "PersistedQueryNotFound"
+
+
+def test_persisted_query_with_unsupported_version_is_rejected(view, request_factory):
+    extensions = {"persistedQuery": {"version": 2, "sha256Hash": QUERY_HASH}}
+    status_code, result = post_query(view, request_factory, {"query": QUERY, "extensions": extensions})
+    assert status_code == 400
+    assert result["errors"][0]["extensions"]["code"] == "INVALID_PERSISTED_QUERY"
+
+
+def test_persisted_queries_are_not_supported_if_disabled(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema)
+    status_code, result = post_query(view, request_factory, {"extensions": get_extensions()})
+    assert status_code == 400
+    assert result["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+    status_code, result = post_query(view, request_factory, {"query": QUERY, "extensions": get_extensions()})
+    assert status_code == 200
+    assert result == {"data": {"status": True}}
+
+
+def test_persisted_queries_are_stored_in_configured_cache(schema, request_factory, settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+        "apq": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "apq"},
+    }
+    view = GraphQLView.as_view(schema=schema, persisted_queries=True, persisted_queries_cache_alias="apq")
+    post_query(view, request_factory, {"query": QUERY, "extensions": get_extensions()})
+    assert cache.get("apq:" + QUERY_HASH) is None
+    assert caches["apq"].get("apq:" + QUERY_HASH) == QUERY
+
+
+def test_persisted_query_is_executed_over_get_request(view, request_factory):
+    post_query(view, request_factory, {"query": QUERY, "extensions": get_extensions()})
+    request = request_factory.get("/graphql/", {"extensions": json.dumps(get_extensions())})
+    response = view(request)
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"data": {"status": True}}
+
+
+def test_mutation_is_not_executed_over_get_request(view, request_factory):
+    request = request_factory.get("/graphql/", {"query": "mutation($file: Upload!) { upload(file: $file) }"})
+    response = view(request)
+    assert response.status_code == 400
+    assert json.loads(response.content)["errors"][0]["message"] == (
+        "Mutation operations are not allowed for this request."
+    )
+
+
+def test_get_request_fails_if_variables_are_not_valid_json(view, request_factory):
+    request = request_factory.get("/graphql/", {"query": QUERY, "variables": "{malformed"})
+    response = view(request)
+    assert response.status_code == 400
+    assert response.content == b"Request 'variables' query parameter is not a valid JSON"
+
+
+@pytest.mark.asyncio
+async def test_async_view_executes_persisted_query_by_hash(schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=schema, persisted_queries=True)
+    for data in ({"extensions": get_extensions()}, {"query": QUERY, "extensions": get_extensions()}):
+        await view(request_factory.post("/graphql/", data=data, content_type="application/json"))
+
+    request = request_factory.get("/graphql/", {"extensions": json.dumps(get_extensions())})
+    response = await view(request)
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"data": {"status": True}}
@@ -1,6 +1,10 @@
+from io import StringIO
+
+from django.core.management import call_command
+
 import pytest
 
-from ariadne_django.views import GraphQLAsyncView, GraphQLView
+from ariadne_django.views import GraphQLAsyncView, GraphQLView, playground
 
 
 def test_playground_html_is_served_on_get_request(request_factory, snapshot, schema):
@@ -31,3 +35,65 @@ async def test_async_playground_options_can_be_set_on_view_init(request_factory,
     response = await view(request_factory.get("/graphql/"))
     assert response.status_code == 200
     snapshot.assert_match(response.content)
+
+
+def test_playground_is_rendered_once_for_view(request_factory, schema, mocker):
+    render = mocker.spy(playground, "render_to_string")
+    view = GraphQLView.as_view(schema=schema)
+    view(request_factory.get("/graphql/"))
+    view(request_factory.get("/graphql/"))
+    assert render.call_count == 1
+
+
+def test_playground_with_custom_template_is_rendered_with_request(request_factory, schema, mocker):
+    render = mocker.patch.object(playground, "render_to_string", return_value="Custom playground")
+    view = GraphQLView.as_view(schema=schema, template_name="custom_playground.html")
+    request = request_factory.get("/graphql/")
+    response = view(request)
+    assert response.content == b"Custom playground"
+    assert "ETag" not in response
+    assert render.call_args.kwargs["request"] is request
+
+    view(request_factory.get("/graphql/"))
+    assert render.call_count == 2
+
+
+def test_playground_with_custom_template_can_be_cached(request_factory, schema, mocker):
+    render = mocker.patch.object(playground, "render_to_string", return_value="Custom playground")
+    view = GraphQLView.as_view(schema=schema, template_name="custom_playground.html", playground_cache=True)
+    view(request_factory.get("/graphql/"))
+    view(request_factory.get("/graphql/"))
+    assert render.call_count == 1
+    assert render.call_args.kwargs["request"] is None
+
+
+def test_playground_response_has_etag(request_factory, schema):
+    view = GraphQLView.as_view(schema=schema)
+    response = view(request_factory.get("/graphql/"))
+    assert response["ETag"] == view.playground_page.etag  # pylint: disable=no-member
+    assert response["Vary"] == "Accept"
+
+    response = view(request_factory.get("/graphql/", HTTP_IF_NONE_MATCH=response["ETag"]))
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_playground_assets_are_loaded_from_cdn_by_default(request_factory, schema):
+    response = GraphQLView.as_view(schema=schema)(request_factory.get("/graphql/"))
+    assert b'src="//cdn.jsdelivr.net/npm/graphql-playground-react/build/static/js/middleware.js"' in response.content
+
+
+def test_playground_assets_can_be_loaded_from_static_files(request_factory, schema, settings):
+    settings.STATIC_URL = "/static/"
+    response = GraphQLView.as_view(schema=schema, playground_static=True)(request_factory.get("/graphql/"))
+    assert b'src="/static/ariadne_django/playground/1.7.26/static/js/middleware.js"' in response.content
+    assert b'href="/static/ariadne_django/playground/1.7.26/static/css/index.css"' in response.content
+
+
+def test_playground_assets_are_downloaded_to_static_files(tmp_path, mocker):
+    urlopen = mocker.patch("ariadne_django.management.commands.download_playground_assets.urlopen")
+    urlopen.return_value.__enter__.return_value.read.return_value = b"asset"
+    call_command("download_playground_assets", output=str(tmp_path), stdout=StringIO())
+
+    assert urlopen.call_count == 3
+    assert (tmp_path / "ariadne_django/playground/1.7.26/static/js/middleware.js").read_bytes() == b"asset"
@@ -0,0 +1,174 @@
+import json
+from functools import partial
+from types import SimpleNamespace
+
+from django.db import connection
+
+from ariadne import ObjectType, QueryType, make_executable_schema
+
+import pytest
+from asgiref.sync import sync_to_async
+from graphql.pyutils import Path
+
+from ariadne_django.tracing import QueryCountingExtension, get_statement_shape
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+from .models import Author, Document
+
+
+@pytest.fixture
+def documents_schema():
+    type_defs = """
+        type Query {
+            documents: [Document!]!
+            authors: [Author!]!
+        }
+
+        type Document {
+            name: String!
+            author: Author!
+        }
+
+        type Author {
+            name: String!
+        }
+    """
+    query = QueryType()
+    query.set_field("documents", lambda *_: Document.objects.order_by("pk"))
+    query.set_field("authors", lambda *_: Author.objects.order_by("pk"))
+    return make_executable_schema(type_defs, query, ObjectType("Document"), ObjectType("Author"))
+
+
+@pytest.fixture
+def documents():
+    for i in range(3):
+        author = Author.objects.create(name="Author {}".format(i))
+        Document.objects.create(name="Document {}".format(i), author=author)
+
+
+def execute_query(view, request_factory, query):
+    return view(request_factory.post("/graphql/", data={"query": query}, content_type="application/json"))
+
+
+def get_sql_queries(response):
+    return json.loads(response.content)["extensions"]["sqlQueries"]
+
+
+def test_statement_shape_collapses_in_placeholders():
+    assert get_statement_shape("SELECT * FROM a WHERE id IN (%s, %s, %s)") == "SELECT * FROM a WHERE id IN (...)"
+    assert get_statement_shape("SELECT * FROM a WHERE id IN (%s)") == "SELECT * FROM a WHERE id IN (...)"
+
+
+@pytest.mark.django_db
+def test_queries_are_counted_per_resolver_path(
+    documents_schema, documents, request_factory
+):  # pylint: disable=unused-argument
+    view = GraphQLView.as_view(schema=documents_schema, extensions=[partial(QueryCountingExtension, report=True)])
+    response = execute_query(view, request_factory, "{ documents { name } authors { name } }")
+
+    sql_queries = get_sql_queries(response)
+    assert sql_queries["count"] == 2
+    assert {item["path"]: item["count"] for item in sql_queries["resolvers"]} == {"documents": 1, "authors": 1}
+    assert sql_queries["nPlusOne"] == []
+
+
+@pytest.mark.django_db
+def test_repeated_queries_under_list_field_are_reported_as_n_plus_one(
+    documents_schema, documents, request_factory
+):  # pylint: disable=unused-argument
+    view = GraphQLView.as_view(schema=documents_schema, extensions=[partial(QueryCountingExtension, report=True)])
+    response = execute_query(view, request_factory, "{ documents { author { name } } }")
+
+    sql_queries = get_sql_queries(response)
+    assert sql_queries["count"] == 4
+    assert len(sql_queries["nPlusOne"]) == 1
+    assert sql_queries["nPlusOne"][0]["path"] == "documents.*.author"
+    assert sql_queries["nPlusOne"][0]["count"] == 3
+
+
+@pytest.mark.django_db
+def test_summary_is_not_reported_without_debug(
+    documents_schema, documents, request_factory, settings
+):  # pylint: disable=unused-argument
+    settings.DEBUG = False
+    view = GraphQLView.as_view(schema=documents_schema, extensions=[QueryCountingExtension])
+    response = execute_query(view, request_factory, "{ documents { name } }")
+    assert "sqlQueries" not in json.loads(response.content).get("extensions", {})
+
+
+@pytest.mark.django_db
+def test_summary_is_reported_with_debug(
+    documents_schema, documents, request_factory, settings
+):  # pylint: disable=unused-argument
+    settings.DEBUG = True
+    view = GraphQLView.as_view(schema=documents_schema, extensions=[QueryCountingExtension])
+    response = execute_query(view, request_factory, "{ documents { name } }")
+    assert get_sql_queries(response)["count"] == 1
+
+
+@pytest.mark.django_db
+def test_n_plus_one_queries_are_logged(
+    documents_schema, documents, request_factory, caplog
+):  # pylint: disable=unused-argument
+    view = GraphQLView.as_view(schema=documents_schema, extensions=[QueryCountingExtension])
+    execute_query(view, request_factory, "{ documents { author { name } } }")
+    assert "executed 4 SQL queries" in caplog.text
+    assert "documents.*.author" in caplog.text
+
+
+@pytest.mark.django_db
+def test_operations_above_threshold_are_logged(
+    documents_schema, documents, request_factory, caplog
+):  # pylint: disable=unused-argument
+    view = GraphQLView.as_view(schema=documents_schema, extensions=[partial(QueryCountingExtension, log_threshold=2)])
+    execute_query(view, request_factory, "{ documents { name } }")
+    assert caplog.text == ""
+
+    execute_query(view, request_factory, "{ documents { name } authors { name } }")
+    assert "executed 2 SQL queries" in caplog.text
+
+
+@pytest.mark.django_db
+def test_querysets_are_not_evaluated_by_extension(documents):  # pylint: disable=unused-argument
+    extension = QueryCountingExtension(report=True)
+    info = SimpleNamespace(path=Path(None, "documents", None))
+    extension.request_started({})
+    result = extension.resolve(lambda *_: Document.objects.order_by("pk"), None, info)
+    assert result._result_cache is None  # pylint: disable=protected-access
+    assert extension.count == 0
+
+    assert len(result) == 3
+    extension.request_finished({})
+    assert extension.get_summary()["resolvers"] == [
+        {"path": "documents", "count": 1, "duration": pytest.approx(0, abs=1)}
+    ]
+
+
+@pytest.mark.django_db
+def test_execute_wrapper_is_removed_after_operation(
+    documents_schema, documents, request_factory
+):  # pylint: disable=unused-argument
+    view = GraphQLView.as_view(schema=documents_schema, extensions=[QueryCountingExtension])
+    execute_query(view, request_factory, "{ documents { name } }")
+    assert connection.execute_wrappers == []
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_queries_executed_in_other_threads_are_counted_in_async_view(documents_schema, request_factory):
+    await sync_to_async(Document.objects.create)(
+        name="Document", author=await sync_to_async(Author.objects.create)(name="Author")
+    )
+    documents_schema.query_type.fields["documents"].resolve = sync_to_async(
+        lambda *_: list(Document.objects.order_by("pk"))
+    )
+    documents_schema.type_map["Document"].fields["author"].resolve = sync_to_async(lambda obj, *_: obj.author)
+    view = GraphQLAsyncView.as_view(schema=documents_schema, extensions=[partial(QueryCountingExtension, report=True)])
+    response = await execute_query(view, request_factory, "{ documents { author { name } } }")
+
+    sql_queries = get_sql_queries(response)
+    assert sql_queries["count"] == 2
+    assert {item["path"]: item["count"] for item in sql_queries["resolvers"]} == {
+        "documents": 1,
+        "documents.*.author": 1,
+    }
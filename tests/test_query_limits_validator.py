@@ -0,0 +1,70 @@
+from graphql import parse, validate
+
+from ariadne_django.validation import QueryLimitsValidator, query_limits_validator
+from ariadne_django.views import GraphQLView
+
+
+def validate_limits(schema, query, **kwargs):
+    return validate(schema, parse(query), [query_limits_validator(**kwargs)])
+
+
+def test_query_within_limits_is_valid(schema):
+    assert validate_limits(schema, '{ status hello(name: "Bob") }', max_depth=1, max_aliases=0, max_fields=2) == []
+
+
+def test_query_exceeding_maximum_depth_is_rejected(schema):
+    query = "{ __schema { types { fields { type { name } } } } }"
+    errors = validate_limits(schema, query, max_depth=3)
+    assert len(errors) == 1
+    assert errors[0].message == "Query depth of 5 exceeds the maximum of 3"
+    assert errors[0].extensions == {"limits": {"depth": 5, "maximum": 3}}
+
+
+def test_query_exceeding_maximum_aliases_is_rejected(schema):
+    errors = validate_limits(schema, "{ a: status b: status c: status }", max_aliases=2)
+    assert [error.message for error in errors] == ["Query aliases of 3 exceeds the maximum of 2"]
+
+
+def test_query_exceeding_maximum_fields_is_rejected(schema):
+    errors = validate_limits(schema, "{ status testContext testRoot }", max_fields=2)
+    assert [error.message for error in errors] == ["Query fields of 3 exceeds the maximum of 2"]
+
+
+def test_fragments_are_included_in_limits(schema):
+    query = """
+        { __schema { ...Types queryType { ...TypeFields } } }
+        fragment Types on __Schema { types { ...TypeFields } }
+        fragment TypeFields on __Type { a: name b: name fields { name } }
+    """
+    errors = validate_limits(schema, query, max_depth=3, max_aliases=3, max_fields=10)
+    assert [error.message for error in errors] == [
+        "Query depth of 4 exceeds the maximum of 3",
+        "Query aliases of 4 exceeds the maximum of 3",
+        "Query fields of 11 exceeds the maximum of 10",
+    ]
+
+
+def test_fragment_is_walked_once(schema, mocker):
+    get_stats = mocker.spy(QueryLimitsValidator, "get_selection_set_stats")
+    document = parse(
+        """
+        { a: __type(name: "Query") { ...TypeFields } b: __type(name: "Query") { ...TypeFields } }
+        fragment TypeFields on __Type { fields { name } }
+        """
+    )
+    fragment_selection_set = document.definitions[1].selection_set
+    validate(schema, document, [query_limits_validator(max_depth=10)])
+    assert [call.args[1] for call in get_stats.call_args_list].count(fragment_selection_set) == 1
+
+
+def test_same_limits_return_same_rule():
+    assert query_limits_validator(max_depth=5) is query_limits_validator(max_depth=5)
+
+
+def test_query_limits_validator_can_be_used_with_view(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, validation_rules=[query_limits_validator(max_depth=2)])
+    request = request_factory.post(
+        "/graphql/", data={"query": "{ __schema { types { name } } }"}, content_type="application/json"
+    )
+    response = view(request)
+    assert response.status_code == 400
@@ -0,0 +1,229 @@
+import json
+from inspect import isawaitable
+
+from django.db.models import QuerySet
+
+from ariadne import ObjectType, QueryType, graphql, make_executable_schema
+
+import pytest
+from graphql.execution import MiddlewareManager
+
+from ariadne_django.optimizer import QuerySetOptimizer, get_model_field
+from ariadne_django.resolvers import aevaluate
+from ariadne_django.views import GraphQLView
+
+from .models import Author, Comment, Document, Tag
+
+
+type_defs = """
+    type Query {
+        documents: [Document!]!
+        authors: [Author!]!
+    }
+
+    type Document {
+        id: ID!
+        name: String!
+        title: String!
+        author: Author!
+        tags: [Tag!]!
+    }
+
+    type Author {
+        id: ID!
+        name: String!
+        documentsCount: Int!
+        documents: [Document!]!
+        upperName: String!
+    }
+
+    type Tag {
+        name: String!
+    }
+"""
+
+
+@pytest.fixture
+def optimizer():
+    return QuerySetOptimizer(
+        {"Document": Document, "Author": Author, "Tag": Tag},
+        {"Author": {"upperName": ["name"]}, "Document": {"title": "name"}},
+    )
+
+
+@pytest.fixture
+def optimized_schema():
+    query = QueryType()
+    query.set_field("documents", lambda *_: Document.objects.order_by("pk"))
+    query.set_field("authors", lambda *_: Author.objects.order_by("pk"))
+    author = ObjectType("Author")
+    author.set_field("documents", lambda obj, *_: obj.documents.all())
+    author.set_field("documentsCount", lambda obj, *_: len(obj.documents.all()))
+    author.set_field("upperName", lambda obj, *_: obj.name.upper())
+    document = ObjectType("Document")
+    document.set_field("title", lambda obj, *_: obj.name)
+    document.set_field("tags", lambda obj, *_: obj.tags.all())
+    return make_executable_schema(type_defs, query, author, document)
+
+
+@pytest.fixture
+def documents(db):  # pylint: disable=unused-argument
+    bob, alice = Author.objects.create(name="Bob"), Author.objects.create(name="Alice")
+    news = Tag.objects.create(name="news")
+    for i, author in enumerate((bob, alice, bob)):
+        document = Document.objects.create(name=str(i), author=author)
+        document.tags.add(news)
+
+
+@pytest.fixture
+def execute_query(optimized_schema, optimizer, request_factory):
+    def execute(query):
+        view = GraphQLView.as_view(schema=optimized_schema, middleware=MiddlewareManager(optimizer))
+        request = request_factory.post("/graphql/", data={"query": query}, content_type="application/json")
+        result = json.loads(view(request).content)
+        assert "errors" not in result
+        return result["data"]
+
+    return execute
+
+
+@pytest.mark.django_db
+def test_forward_relations_are_selected_with_join(
+    documents, execute_query, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    with django_assert_num_queries(1) as context:
+        data = execute_query("{ documents { name author { name } } }")
+    assert [document["author"]["name"] for document in data["documents"]] == ["Bob", "Alice", "Bob"]
+    assert "JOIN" in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_only_selected_fields_are_loaded(
+    documents, execute_query, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    with django_assert_num_queries(1) as context:
+        execute_query("{ documents { name } }")
+    sql = context.captured_queries[0]["sql"]
+    assert '"tests_document"."name"' in sql
+    assert '"tests_document"."author_id"' not in sql
+
+
+@pytest.mark.django_db
+def test_reverse_and_many_to_many_relations_are_prefetched(
+    documents, execute_query, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    query = "{ authors { name documents { name tags { name } } } }"
+    with django_assert_num_queries(3):
+        data = execute_query(query)
+    assert data["authors"] == [
+        {
+            "name": "Bob",
+            "documents": [{"name": "0", "tags": [{"name": "news"}]}, {"name": "2", "tags": [{"name": "news"}]}],
+        },
+        {"name": "Alice", "documents": [{"name": "1", "tags": [{"name": "news"}]}]},
+    ]
+
+
+@pytest.mark.django_db
+def test_fragments_are_included_in_selection(
+    documents, execute_query, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    query = """
+        { documents { ...DocumentFields } }
+        fragment DocumentFields on Document { ... on Document { author { name } } }
+    """
+    with django_assert_num_queries(1):
+        execute_query(query)
+
+
+@pytest.mark.django_db
+def test_field_map_maps_fields_to_model_fields(
+    documents, execute_query, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    with django_assert_num_queries(1):
+        data = execute_query("{ documents { title author { upperName } } }")
+    assert data["documents"][0] == {"title": "0", "author": {"upperName": "BOB"}}
+
+
+@pytest.mark.django_db
+def test_fields_not_matching_model_fields_load_all_fields(
+    documents, execute_query, django_assert_num_queries
+):  # pylint: disable=unused-argument
+    with django_assert_num_queries(3) as context:
+        data = execute_query("{ authors { documentsCount } }")
+    assert data["authors"] == [{"documentsCount": 2}, {"documentsCount": 1}]
+    assert '"tests_author"."name"' in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_querysets_returned_by_async_resolvers_are_optimized(optimized_schema, optimizer, mocker):
+    async def resolve_documents(*_):
+        return Document.objects.order_by("pk")
+
+    async def evaluate_querysets(next_, obj, info, **kwargs):
+        result = next_(obj, info, **kwargs)
+        if isawaitable(result):
+            result = await result
+        return await aevaluate(result) if isinstance(result, QuerySet) else result
+
+    optimized_schema.query_type.fields["documents"].resolve = resolve_documents
+    optimize = mocker.spy(optimizer, "optimize")
+    success, result = await graphql(
+        optimized_schema,
+        {"query": "{ documents { name author { name } } }"},
+        # First middleware is the innermost one, so QuerySets are evaluated after being optimized.
+        middleware=MiddlewareManager(optimizer, evaluate_querysets),
+    )
+    assert success, result
+    assert result == {"data": {"documents": []}}
+    assert optimize.spy_return.query.select_related == {"author": {}}
+
+
+def test_evaluated_querysets_are_not_optimized(optimizer, mocker):
+    queryset = mocker.Mock(spec=Document.objects.all(), _result_cache=[], _fields=None)
+    assert optimizer.optimize(queryset, mocker.Mock()) is queryset
+
+
+def test_querysets_of_other_models_are_not_optimized(optimizer, mocker):
+    queryset = Tag.objects.all()
+    info = mocker.Mock(return_type=mocker.Mock())
+    assert optimizer.optimize(queryset, info) is queryset
+
+
+def test_reverse_relations_are_found_by_accessor_name():
+    assert get_model_field(Author, "documents").related_model is Document
+    assert get_model_field(Author, "name").name == "name"
+    assert get_model_field(Author, "unknown") is None
+
+
+@pytest.mark.django_db
+def test_generic_foreign_keys_are_not_selected_with_join(request_factory):
+    comment_type_defs = """
+        type Query {
+            comments: [Comment!]!
+        }
+
+        type Comment {
+            text: String!
+            contentObject: Author!
+        }
+
+        type Author {
+            name: String!
+        }
+    """
+    query = QueryType()
+    query.set_field("comments", lambda *_: Comment.objects.order_by("pk"))
+    comment = ObjectType("Comment")
+    comment.set_field("contentObject", lambda obj, *_: obj.content_object)
+    schema = make_executable_schema(comment_type_defs, query, comment)
+    Comment.objects.create(text="Hello", content_object=Author.objects.create(name="Bob"))
+
+    optimizer = QuerySetOptimizer({"Comment": Comment, "Author": Author})
+    view = GraphQLView.as_view(schema=schema, middleware=MiddlewareManager(optimizer))
+    request = request_factory.post(
+        "/graphql/", data={"query": "{ comments { text contentObject { name } } }"}, content_type="application/json"
+    )
+    result = json.loads(view(request).content)
+    assert result == {"data": {"comments": [{"text": "Hello", "contentObject": {"name": "Bob"}}]}}
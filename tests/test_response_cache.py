@@ -0,0 +1,166 @@
+import json
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils.asyncio import async_unsafe
+from django.utils.functional import SimpleLazyObject
+
+import pytest
+
+from ariadne_django.execution import ResponseCache, get_user_scope
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def response_cache():
+    return ResponseCache(operation_tags={"TestContext": ["test"]})
+
+
+def execute_query(request_factory, schema, response_cache, context, data=None, **kwargs):
+    view = GraphQLView.as_view(schema=schema, response_cache=response_cache, context_value={"test": context})
+    data = data or {"query": "query TestContext { testContext }"}
+    request = request_factory.post("/graphql/", data=data, content_type="application/json", **kwargs)
+    response = view(request)
+    return json.loads(response.content)
+
+
+def test_query_result_is_served_from_response_cache(request_factory, schema, response_cache):
+    result = execute_query(request_factory, schema, response_cache, "first")
+    assert result == {"data": {"testContext": "first"}, "extensions": {"responseCache": {"hit": False}}}
+
+    result = execute_query(request_factory, schema, response_cache, "second")
+    assert result == {"data": {"testContext": "first"}, "extensions": {"responseCache": {"hit": True}}}
+
+
+def test_query_result_is_cached_separately_for_different_variables(request_factory, schema, response_cache):
+    query = "query Hello($name: String) { hello(name: $name) }"
+    result = execute_query(
+        request_factory, schema, response_cache, None, {"query": query, "variables": {"name": "Bob"}}
+    )
+    assert result["extensions"]["responseCache"]["hit"] is False
+
+    result = execute_query(
+        request_factory, schema, response_cache, None, {"query": query, "variables": {"name": "Alice"}}
+    )
+    assert result["data"] == {"hello": "Hello, Alice!"}
+    assert result["extensions"]["responseCache"]["hit"] is False
+
+
+def test_query_result_is_cached_separately_for_each_scope(request_factory, schema):
+    response_cache = ResponseCache(scope=lambda request: request.META.get("HTTP_X_SCOPE", "public"))
+    execute_query(request_factory, schema, response_cache, "first", HTTP_X_SCOPE="a")
+    result = execute_query(request_factory, schema, response_cache, "second", HTTP_X_SCOPE="b")
+    assert result["data"] == {"testContext": "second"}
+
+    result = execute_query(request_factory, schema, response_cache, "third", HTTP_X_SCOPE="a")
+    assert result["data"] == {"testContext": "first"}
+
+
+def test_operation_with_zero_timeout_is_not_cached(request_factory, schema):
+    response_cache = ResponseCache(operation_timeouts={"TestContext": 0})
+    execute_query(request_factory, schema, response_cache, "first")
+    result = execute_query(request_factory, schema, response_cache, "second")
+    assert result == {"data": {"testContext": "second"}}
+
+
+def test_result_with_errors_is_not_cached(request_factory, schema, response_cache):
+    data = {"query": "query TestError { testError }"}
+    execute_query(request_factory, schema, response_cache, None, data)
+    result = execute_query(request_factory, schema, response_cache, None, data)
+    assert result["extensions"]["responseCache"]["hit"] is False
+    assert "errors" in result
+
+
+def test_mutations_bypass_response_cache(request_factory, schema, response_cache, mocker):
+    cache_get = mocker.spy(response_cache, "get")
+    view = GraphQLView.as_view(schema=schema, response_cache=response_cache)
+    request = request_factory.post(
+        "/",
+        {
+            "operations": json.dumps({"query": "mutation($file: Upload) { upload(file: $file) }"}),
+            "map": json.dumps({}),
+        },
+    )
+    response = view(request)
+    assert "extensions" not in json.loads(response.content)
+    cache_get.assert_not_called()
+
+
+def test_invalidating_tag_invalidates_cached_results(request_factory, schema, response_cache):
+    execute_query(request_factory, schema, response_cache, "first")
+    response_cache.invalidate("test")
+    result = execute_query(request_factory, schema, response_cache, "second")
+    assert result["data"] == {"testContext": "second"}
+
+
+def test_model_changes_invalidate_tagged_results(request_factory, schema, response_cache):
+    model = type("Model", (), {"_meta": SimpleNamespace(label="tests.Model")})
+    response_cache.invalidate_on_change(model, "test")
+
+    execute_query(request_factory, schema, response_cache, "first")
+    post_save.send(sender=model, instance=None, created=True)
+    result = execute_query(request_factory, schema, response_cache, "second")
+    assert result["data"] == {"testContext": "second"}
+
+    post_delete.send(sender=model, instance=None)
+    result = execute_query(request_factory, schema, response_cache, "third")
+    assert result["data"] == {"testContext": "third"}
+
+
+def test_user_scope_is_based_on_authenticated_user(authenticated_user, unauthenticated_user, request_factory):
+    request = request_factory.get("/")
+    assert get_user_scope(request) == "public"
+    request.user = unauthenticated_user
+    assert get_user_scope(request) == "public"
+    authenticated_user.pk = 42
+    request.user = authenticated_user
+    assert get_user_scope(request) == "user:42"
+
+
+@pytest.mark.asyncio
+async def test_async_view_serves_query_result_from_response_cache(request_factory, schema, response_cache):
+    for context, expected_hit in (("first", False), ("second", True)):
+        view = GraphQLAsyncView.as_view(schema=schema, response_cache=response_cache, context_value={"test": context})
+        request = request_factory.post(
+            "/graphql/", data={"query": "query TestContext { testContext }"}, content_type="application/json"
+        )
+        result = json.loads((await view(request)).content)
+        assert result["data"] == {"testContext": "first"}
+        assert result["extensions"]["responseCache"]["hit"] is expected_hit
+
+
+@pytest.mark.asyncio
+async def test_async_view_loads_user_of_response_cache_scope_in_thread(
+    request_factory, schema, response_cache, authenticated_user
+):
+    authenticated_user.pk = 42
+    view = GraphQLAsyncView.as_view(schema=schema, response_cache=response_cache, context_value={"test": "first"})
+    request = request_factory.post(
+        "/graphql/", data={"query": "query TestContext { testContext }"}, content_type="application/json"
+    )
+    # Like the user set by AuthenticationMiddleware, loaded from the session with a database query.
+    request.user = SimpleLazyObject(async_unsafe(lambda: authenticated_user))
+    result = json.loads((await view(request)).content)
+    assert result["data"] == {"testContext": "first"}
+    assert result["extensions"]["responseCache"]["hit"] is False
+
+
+def test_response_cache_stores_serialized_result(mocker, request_factory, schema, response_cache):
+    cache_set = mocker.spy(response_cache.cache, "set")
+    execute_query(request_factory, schema, response_cache, "first")
+    assert cache_set.call_args.args[1].content == b'{"data": {"testContext": "first"}}'
+
+
+def test_batched_query_results_are_served_from_response_cache(request_factory, schema, response_cache):
+    view = GraphQLView.as_view(schema=schema, response_cache=response_cache, batching=True, context_value={"test": "a"})
+    operation = {"query": "query TestContext { testContext }"}
+    request = request_factory.post("/graphql/", data=[operation, operation], content_type="application/json")
+    result = json.loads(view(request).content)
+    assert [item["data"] for item in result] == [{"testContext": "a"}, {"testContext": "a"}]
+    assert [item["extensions"]["responseCache"]["hit"] for item in result] == [False, True]
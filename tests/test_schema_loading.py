@@ -0,0 +1,107 @@
+import json
+import os
+
+from django.apps import apps
+
+from ariadne import QueryType
+
+import pytest
+
+from ariadne_django.schema import LazySchema, SchemaCache, cache, find_app_graphql_files
+from ariadne_django.views import GraphQLView
+
+
+query = QueryType()
+query.set_field("documents", lambda *_: [{"name": "Document", "status": "DRAFT"}])
+
+lazy_schema = LazySchema(query, app_labels=["tests"])
+
+
+def get_test_app_path(*path):
+    return os.path.join(apps.get_app_config("tests").path, *path)
+
+
+def test_graphql_files_are_found_in_installed_apps():
+    assert find_app_graphql_files() == [
+        get_test_app_path("graphql", "query.graphql"),
+        get_test_app_path("graphql", "types", "document.graphql"),
+    ]
+
+
+def test_graphql_files_are_not_found_in_apps_without_graphql_directory():
+    assert find_app_graphql_files(app_labels=["ariadne_django"]) == []
+
+
+def test_schema_is_built_once_on_first_use(mocker):
+    build_schema = mocker.spy(LazySchema, "build")
+    schema = LazySchema(query, app_labels=["tests"])
+    assert not schema.is_built
+
+    assert schema.get() is schema.get()
+    assert build_schema.call_count == 1
+    assert schema.get().get_type("Document").fields["status"]
+
+
+def test_type_defs_are_added_to_schema_from_files():
+    schema = LazySchema(query, type_defs="extend type Query { count: Int }", app_labels=["tests"])
+    assert "count" in schema.get().query_type.fields
+
+
+def test_view_executes_query_with_lazy_schema(request_factory):
+    schema = LazySchema(query, app_labels=["tests"])
+    view = GraphQLView.as_view(schema=schema)
+    assert not schema.is_built
+
+    request = request_factory.post(
+        "/graphql/", data={"query": "{ documents { name status } }"}, content_type="application/json"
+    )
+    response = view(request)
+    assert json.loads(response.content) == {"data": {"documents": [{"name": "Document", "status": "DRAFT"}]}}
+
+
+def test_parsed_schema_is_loaded_from_cache(tmp_path, mocker):
+    parse_sources = mocker.spy(cache, "parse_sources")
+    LazySchema(query, app_labels=["tests"], cache_dir=str(tmp_path)).get()
+    assert parse_sources.call_count == 1
+    assert len(os.listdir(tmp_path)) == 1
+
+    schema = LazySchema(query, app_labels=["tests"], cache_dir=str(tmp_path)).get()
+    assert parse_sources.call_count == 1
+    assert schema.get_type("Status").values["PUBLISHED"]
+    assert schema.query_type.fields["documents"].resolve is not None
+
+
+def test_cache_dir_is_read_from_settings(tmp_path, settings):
+    settings.ARIADNE_DJANGO_SCHEMA_CACHE_DIR = str(tmp_path)
+    LazySchema(query, app_labels=["tests"]).get()
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_schema_is_parsed_again_if_sources_change(tmp_path, mocker):
+    parse_sources = mocker.spy(cache, "parse_sources")
+    LazySchema(query, app_labels=["tests"], cache_dir=str(tmp_path)).get()
+    LazySchema(query, type_defs="extend type Query { count: Int }", app_labels=["tests"], cache_dir=str(tmp_path)).get()
+    assert parse_sources.call_count == 2
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_invalid_cache_file_is_ignored(tmp_path):
+    schema = LazySchema(query, app_labels=["tests"], cache_dir=str(tmp_path))
+    key = cache.get_document_key(schema.get_sources())
+    with open(SchemaCache(str(tmp_path)).get_path(key), "w", encoding="utf-8") as cache_file:
+        cache_file.write("{invalid")
+
+    assert schema.get().get_type("Document")
+
+
+def test_invalid_schema_is_not_cached(tmp_path):
+    schema = LazySchema(query, type_defs="extend type Query { invalid: Unknown }", cache_dir=str(tmp_path))
+    with pytest.raises(TypeError):
+        schema.get()
+    assert os.listdir(tmp_path) == []
+
+
+def test_schemas_from_settings_are_built_when_app_is_ready(settings):
+    settings.ARIADNE_DJANGO_SCHEMAS = ["tests.test_schema_loading.lazy_schema"]
+    apps.get_app_config("ariadne_django").ready()
+    assert lazy_schema.is_built
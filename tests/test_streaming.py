@@ -0,0 +1,60 @@
+import json
+
+import django
+from django.http import StreamingHttpResponse
+
+import pytest
+
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+def test_response_is_not_streamed_by_default(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema)
+    request = request_factory.post("/graphql/", data={"query": "{ status }"}, content_type="application/json")
+    response = view(request)
+    assert not isinstance(response, StreamingHttpResponse)
+
+
+def test_streamed_response_is_returned_when_streaming_is_enabled(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, streaming=True, streaming_chunk_size=8)
+    request = request_factory.post(
+        "/graphql/", data={"query": '{ status hello(name: "Bob") }'}, content_type="application/json"
+    )
+    response = view(request)
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    chunks = list(response.streaming_content)
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == {"data": {"status": True, "hello": "Hello, Bob!"}}
+
+
+def test_streamed_response_keeps_error_status_code(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, streaming=True)
+    request = request_factory.post("/graphql/", data={"query": "{ unknown }"}, content_type="application/json")
+    response = view(request)
+    assert response.status_code == 400
+    assert "errors" in json.loads(b"".join(response.streaming_content))
+
+
+@pytest.mark.skipif(django.VERSION < (4, 2), reason="requires Django 4.2+")
+@pytest.mark.asyncio
+async def test_async_view_streams_response_with_async_iterator(schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=schema, streaming=True, streaming_chunk_size=8)
+    request = request_factory.post(
+        "/graphql/", data={"query": '{ status hello(name: "Bob") }'}, content_type="application/json"
+    )
+    response = await view(request)
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.is_async
+    chunks = [chunk async for chunk in response.streaming_content]
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == {"data": {"status": True, "hello": "Hello, Bob!"}}
+
+
+def test_streamed_get_response_has_cache_control_without_etag(schema, request_factory):
+    view = GraphQLView.as_view(schema=schema, streaming=True, cache_control="public, max-age=60")
+    response = view(request_factory.get("/graphql/", {"query": "{ status }"}))
+    assert isinstance(response, StreamingHttpResponse)
+    assert response["Cache-Control"] == "public, max-age=60"
+    assert not response.has_header("ETag")
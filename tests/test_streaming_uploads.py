@@ -0,0 +1,173 @@
+import json
+
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from ariadne import MutationType, QueryType, make_executable_schema, upload_scalar
+
+import pytest
+
+from ariadne_django.uploads import StorageUploadHandler, StoredUploadedFile
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+@pytest.fixture
+def upload_schema():
+    type_defs = """
+        scalar Upload
+
+        type Query {
+            status: Boolean
+        }
+
+        type Mutation {
+            upload(file: Upload!): String
+            uploadMany(files: [Upload!]!): [String!]!
+        }
+    """
+    mutation = MutationType()
+
+    @mutation.field("upload")
+    def resolve_upload(*_, file):
+        return "{}:{}:{}".format(type(file).__name__, file.name, file.read().decode())
+
+    @mutation.field("uploadMany")
+    def resolve_upload_many(*_, files):
+        return [file.read().decode() for file in files]
+
+    return make_executable_schema(type_defs, QueryType(), mutation, upload_scalar)
+
+
+def post_multipart(view, request_factory, fields):
+    request = request_factory.post("/graphql/", data=fields)
+    response = view(request)
+    return response.status_code, response.content
+
+
+def upload_fields(**files):
+    return {
+        "operations": json.dumps(
+            {"query": "mutation($file: Upload!) { upload(file: $file) }", "variables": {"file": None}}
+        ),
+        "map": json.dumps({"0": ["variables.file"]}),
+        **files,
+    }
+
+
+def test_files_are_streamed_to_temporary_files(upload_schema, request_factory):
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True)
+    status, content = post_multipart(view, request_factory, upload_fields(**{"0": SimpleUploadedFile("a.txt", b"abc")}))
+    assert status == 200
+    assert json.loads(content) == {"data": {"upload": "TemporaryUploadedFile:a.txt:abc"}}
+
+
+def test_files_are_streamed_to_storage(upload_schema, request_factory, tmp_path):
+    storage = FileSystemStorage(location=str(tmp_path))
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True, upload_storage=storage, upload_to="up")
+    status, content = post_multipart(view, request_factory, upload_fields(**{"0": SimpleUploadedFile("a.txt", b"abc")}))
+    assert status == 200
+    assert json.loads(content) == {"data": {"upload": "StoredUploadedFile:a.txt:abc"}}
+    assert (tmp_path / "up" / "a.txt").read_bytes() == b"abc"
+
+
+def test_many_files_are_mapped_to_variables(upload_schema, request_factory):
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True)
+    fields = {
+        "operations": json.dumps(
+            {"query": "mutation($files: [Upload!]!) { uploadMany(files: $files) }", "variables": {"files": [None] * 2}}
+        ),
+        "map": json.dumps({"0": ["variables.files.0"], "1": ["variables.files.1"]}),
+        "0": SimpleUploadedFile("a.txt", b"a"),
+        "1": SimpleUploadedFile("b.txt", b"b"),
+    }
+    status, content = post_multipart(view, request_factory, fields)
+    assert status == 200
+    assert json.loads(content) == {"data": {"uploadMany": ["a", "b"]}}
+
+
+def test_file_exceeding_maximum_size_is_rejected(upload_schema, request_factory, tmp_path):
+    storage = FileSystemStorage(location=str(tmp_path))
+    view = GraphQLView.as_view(
+        schema=upload_schema, streaming_uploads=True, max_upload_size=2, upload_storage=storage, upload_to="up"
+    )
+    status, content = post_multipart(view, request_factory, upload_fields(**{"0": SimpleUploadedFile("a.txt", b"abc")}))
+    assert status == 400
+    assert content == b"File '0' exceeds the maximum size of 2 bytes"
+    assert not list((tmp_path / "up").iterdir())
+
+
+def test_files_exceeding_maximum_number_are_rejected(upload_schema, request_factory):
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True, max_upload_files=0)
+    status, content = post_multipart(view, request_factory, upload_fields(**{"0": SimpleUploadedFile("a.txt", b"a")}))
+    assert status == 400
+    assert content == b"Request exceeds the limit of 0 files"
+
+
+def test_unmapped_file_is_rejected(upload_schema, request_factory):
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True)
+    status, content = post_multipart(view, request_factory, upload_fields(**{"1": SimpleUploadedFile("a.txt", b"a")}))
+    assert status == 400
+    assert content == b"File '1' is not in the 'map' multipart field"
+
+
+def test_files_preceding_operations_are_rejected(upload_schema, request_factory):
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True)
+    fields = {"0": SimpleUploadedFile("a.txt", b"a"), **upload_fields()}
+    status, content = post_multipart(view, request_factory, fields)
+    assert status == 400
+    assert content.startswith(b"Request 'operations' and 'map' multipart fields must precede files")
+
+
+def test_missing_file_is_rejected(upload_schema, request_factory):
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True)
+    status, content = post_multipart(view, request_factory, upload_fields())
+    assert status == 400
+    assert content.startswith(b"File data was missing for entry key '0'")
+
+
+def test_invalid_operations_json_is_rejected(upload_schema, request_factory):
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True)
+    fields = {**upload_fields(**{"0": SimpleUploadedFile("a.txt", b"a")}), "operations": "not a valid json"}
+    status, content = post_multipart(view, request_factory, fields)
+    assert status == 400
+    assert content == b"Request 'operations' multipart field is not a valid JSON"
+
+
+def test_files_of_invalid_operations_are_not_stored(upload_schema, request_factory, mocker):
+    receive_file = mocker.spy(GraphQLView, "get_upload_handler")
+    view = GraphQLView.as_view(schema=upload_schema, streaming_uploads=True)
+    fields = {
+        **upload_fields(**{"0": SimpleUploadedFile("a.txt", b"a")}),
+        "operations": json.dumps({"query": "mutation($file: Upload!) { unknown(file: $file) }", "variables": {}}),
+    }
+    status, content = post_multipart(view, request_factory, fields)
+    assert status == 400
+    assert "errors" in json.loads(content)
+    receive_file.assert_not_called()
+
+
+def test_stored_file_is_opened_on_first_read(tmp_path):
+    storage = FileSystemStorage(location=str(tmp_path))
+    storage.save("a.txt", SimpleUploadedFile("a.txt", b"abc"))
+    uploaded_file = StoredUploadedFile(storage, "a.txt", "a.txt", "text/plain", 3, None)
+    assert uploaded_file.file is None
+    assert b"".join(uploaded_file.chunks()) == b"abc"
+    uploaded_file.delete()
+    assert not storage.exists("a.txt")
+
+
+def test_interrupted_upload_keeps_completed_files(tmp_path):
+    handler = StorageUploadHandler(storage=FileSystemStorage(location=str(tmp_path)))
+    handler.new_file("file", "a.txt", "text/plain", 1)
+    handler.receive_data_chunk(b"a", 0)
+    uploaded_file = handler.file_complete(1)
+    handler.upload_interrupted()
+    assert handler.storage.exists(uploaded_file.storage_name)
+
+
+@pytest.mark.asyncio
+async def test_async_view_streams_files(upload_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=upload_schema, streaming_uploads=True)
+    request = request_factory.post("/graphql/", data=upload_fields(**{"0": SimpleUploadedFile("a.txt", b"abc")}))
+    response = await view(request)
+    assert json.loads(response.content) == {"data": {"upload": "TemporaryUploadedFile:a.txt:abc"}}
@@ -0,0 +1,297 @@
+import asyncio
+import json
+import threading
+
+from ariadne import QueryType, SubscriptionType, make_executable_schema
+from ariadne.types import Extension
+
+import pytest
+
+from ariadne_django.execution import ResponseCache
+from ariadne_django.subscriptions import (
+    GRAPHQL_TRANSPORT_WS,
+    GRAPHQL_WS,
+    Broadcaster,
+    GraphQLWebSocketConsumer,
+    MemoryBroadcastBackend,
+)
+
+
+class WebSocket:
+    def __init__(self, application, subprotocols=(GRAPHQL_TRANSPORT_WS,), **scope):
+        self.scope = {
+            "type": "websocket",
+            "path": "/graphql/",
+            "query_string": b"",
+            "headers": [],
+            "subprotocols": list(subprotocols),
+            **scope,
+        }
+        self.application = application
+        self.input: "asyncio.Queue[dict]" = asyncio.Queue()
+        self.output: "asyncio.Queue[dict]" = asyncio.Queue()
+        self.task = None
+
+    async def __aenter__(self):
+        self.task = asyncio.ensure_future(self.application(self.scope, self.input.get, self.output.put))
+        await self.input.put({"type": "websocket.connect"})
+        return self
+
+    async def __aexit__(self, *_):
+        await self.input.put({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self.task, 1)
+
+    async def send(self, message):
+        await self.input.put({"type": "websocket.receive", "text": json.dumps(message)})
+
+    async def receive(self):
+        return await asyncio.wait_for(self.output.get(), 1)
+
+    async def receive_json(self):
+        message = await self.receive()
+        assert message["type"] == "websocket.send", message
+        return json.loads(message["text"])
+
+    async def initialize(self, payload=None):
+        assert (await self.receive())["type"] == "websocket.accept"
+        await self.send({"type": "connection_init", "payload": payload or {}})
+        assert await self.receive_json() == {"type": "connection_ack"}
+
+
+@pytest.fixture
+def consumer(schema):
+    return GraphQLWebSocketConsumer(
+        schema=schema, context_value=lambda request: {"test": request.connection_params.get("token")}
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscription_results_are_sent_with_graphql_transport_ws(consumer):
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { ping }"}})
+        assert await websocket.receive_json() == {"type": "next", "id": "1", "payload": {"data": {"ping": "pong"}}}
+        assert await websocket.receive_json() == {"type": "complete", "id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_queries_are_executed_with_context_of_the_view(consumer):
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize({"token": "abc"})
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "{ testContext }"}})
+        message = await websocket.receive_json()
+        assert message == {"type": "next", "id": "1", "payload": {"data": {"testContext": "abc"}}}
+        assert await websocket.receive_json() == {"type": "complete", "id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_invalid_operation_errors_are_sent(consumer):
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { unknown }"}})
+        message = await websocket.receive_json()
+        assert message["type"] == "error"
+        assert message["payload"][0]["message"] == "Cannot query field 'unknown' on type 'Subscription'."
+
+
+@pytest.mark.asyncio
+async def test_source_errors_are_sent(consumer):
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { sourceError }"}})
+        message = await websocket.receive_json()
+        assert message["type"] == "error"
+        assert message["payload"][0]["message"] == "Test exception"
+
+
+@pytest.mark.asyncio
+async def test_unexpected_errors_are_sent_and_end_operation(schema):
+    def root_value(*_):
+        raise ValueError("Unexpected error")
+
+    consumer = GraphQLWebSocketConsumer(schema=schema, root_value=root_value)
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { ping }"}})
+        message = await websocket.receive_json()
+        assert message["type"] == "error"
+        assert message["payload"][0]["message"] == "Unexpected error"
+
+        # Operation with the same id can be subscribed again.
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { ping }"}})
+        assert (await websocket.receive_json())["type"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_queries_are_executed_without_response_cache_of_the_view(schema):
+    consumer = GraphQLWebSocketConsumer(
+        schema=schema, context_value=lambda request: {"test": "abc"}, response_cache=ResponseCache()
+    )
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        for operation_id in ("1", "2"):
+            await websocket.send({"type": "subscribe", "id": operation_id, "payload": {"query": "{ testContext }"}})
+            message = await websocket.receive_json()
+            assert message == {"type": "next", "id": operation_id, "payload": {"data": {"testContext": "abc"}}}
+            assert await websocket.receive_json() == {"type": "complete", "id": operation_id}
+
+
+class ResultExtension(Extension):
+    def format(self, context):
+        return {"context": context["test"]}
+
+
+@pytest.mark.asyncio
+async def test_subscription_results_include_extensions(schema):
+    consumer = GraphQLWebSocketConsumer(
+        schema=schema, context_value=lambda request: {"test": "abc"}, extensions=[ResultExtension]
+    )
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { ping }"}})
+        message = await websocket.receive_json()
+        assert message["payload"] == {"data": {"ping": "pong"}, "extensions": {"context": "abc"}}
+
+
+@pytest.mark.asyncio
+async def test_subscribing_before_initialization_closes_connection(consumer):
+    async with WebSocket(consumer) as websocket:
+        assert (await websocket.receive())["type"] == "websocket.accept"
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { ping }"}})
+        assert await websocket.receive() == {"type": "websocket.close", "code": 4401, "reason": "Unauthorized"}
+
+
+@pytest.mark.asyncio
+async def test_repeated_initialization_closes_connection(consumer):
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "connection_init"})
+        message = await websocket.receive()
+        assert message == {"type": "websocket.close", "code": 4429, "reason": "Too many initialisation requests"}
+
+
+@pytest.mark.asyncio
+async def test_connection_is_closed_if_not_initialized_in_time(schema):
+    consumer = GraphQLWebSocketConsumer(schema=schema, connection_init_wait_timeout=0.01)
+    async with WebSocket(consumer) as websocket:
+        assert (await websocket.receive())["type"] == "websocket.accept"
+        message = await websocket.receive()
+        assert message == {"type": "websocket.close", "code": 4408, "reason": "Connection initialisation timeout"}
+
+
+@pytest.mark.asyncio
+async def test_connection_rejected_by_on_connect_is_closed(schema):
+    async def on_connect(request, payload):  # pylint: disable=unused-argument
+        return payload.get("token") == "secret"
+
+    consumer = GraphQLWebSocketConsumer(schema=schema, on_connect=on_connect)
+    async with WebSocket(consumer) as websocket:
+        assert (await websocket.receive())["type"] == "websocket.accept"
+        await websocket.send({"type": "connection_init", "payload": {"token": "invalid"}})
+        assert await websocket.receive() == {"type": "websocket.close", "code": 4403, "reason": "Forbidden"}
+
+
+@pytest.mark.asyncio
+async def test_ping_is_answered_with_pong(consumer):
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "ping"})
+        assert await websocket.receive_json() == {"type": "pong"}
+
+
+@pytest.mark.asyncio
+async def test_invalid_message_closes_connection(consumer):
+    async with WebSocket(consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "unknown"})
+        assert await websocket.receive() == {"type": "websocket.close", "code": 4400, "reason": "Invalid message type"}
+
+
+@pytest.mark.asyncio
+async def test_unsupported_subprotocol_is_rejected(consumer):
+    async with WebSocket(consumer, subprotocols=["unknown"]) as websocket:
+        assert await websocket.receive() == {"type": "websocket.close", "code": 4406}
+
+
+@pytest.mark.asyncio
+async def test_subscription_results_are_sent_with_graphql_ws(consumer):
+    async with WebSocket(consumer, subprotocols=[GRAPHQL_WS]) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "start", "id": "1", "payload": {"query": "subscription { ping }"}})
+        assert await websocket.receive_json() == {"type": "data", "id": "1", "payload": {"data": {"ping": "pong"}}}
+        assert await websocket.receive_json() == {"type": "complete", "id": "1"}
+
+        await websocket.send({"type": "start", "id": "2", "payload": {"query": "subscription { unknown }"}})
+        message = await websocket.receive_json()
+        assert message["type"] == "error"
+        assert message["payload"][0]["message"] == "Cannot query field 'unknown' on type 'Subscription'."
+
+        await websocket.send({"type": "start", "id": "3", "payload": {"query": "subscription { unknown other }"}})
+        message = await websocket.receive_json()
+        assert message["type"] == "error"
+        assert len(message["payload"]) == 3
+
+
+@pytest.fixture
+def broadcaster():
+    return Broadcaster()
+
+
+@pytest.fixture
+def broadcast_consumer(broadcaster):
+    subscription = SubscriptionType()
+    subscription.set_source("message", lambda *_: broadcaster.subscribe("messages"))
+    subscription.set_field("message", lambda message, *_: message)
+    schema = make_executable_schema(
+        "type Query { status: Boolean } type Subscription { message: String! }", QueryType(), subscription
+    )
+    return GraphQLWebSocketConsumer(schema=schema)
+
+
+async def wait_for_subscribers(broadcaster, channel, count):
+    while len(broadcaster.backend.subscribers.get(channel, ())) != count:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_published_messages_are_pushed_to_subscribers(broadcast_consumer, broadcaster):
+    async with WebSocket(broadcast_consumer) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "subscribe", "id": "1", "payload": {"query": "subscription { message }"}})
+        await wait_for_subscribers(broadcaster, "messages", 1)
+        await broadcaster.publish("messages", "hello")
+        assert await websocket.receive_json() == {"type": "next", "id": "1", "payload": {"data": {"message": "hello"}}}
+
+        await websocket.send({"type": "complete", "id": "1"})
+        await wait_for_subscribers(broadcaster, "messages", 0)
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_closed_on_disconnect(broadcast_consumer, broadcaster):
+    async with WebSocket(broadcast_consumer, subprotocols=[GRAPHQL_WS]) as websocket:
+        await websocket.initialize()
+        await websocket.send({"type": "start", "id": "1", "payload": {"query": "subscription { message }"}})
+        await wait_for_subscribers(broadcaster, "messages", 1)
+    await asyncio.wait_for(wait_for_subscribers(broadcaster, "messages", 0), 1)
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_delivers_messages_published_from_other_threads():
+    backend = MemoryBroadcastBackend()
+    subscription = backend.subscribe("channel")
+    thread = threading.Thread(target=lambda: asyncio.new_event_loop().run_until_complete(backend.publish("channel", 1)))
+    thread.start()
+    thread.join()
+    assert await asyncio.wait_for(subscription.__anext__(), 1) == 1
+    await subscription.aclose()
+    assert not backend.subscribers
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_delivers_messages_to_subscribers_of_channel():
+    backend = MemoryBroadcastBackend()
+    first, second, other = backend.subscribe("channel"), backend.subscribe("channel"), backend.subscribe("other")
+    await backend.publish("channel", "message")
+    assert await first.__anext__() == "message"
+    assert await second.__anext__() == "message"
+    assert other.queue.empty()
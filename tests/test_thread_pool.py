@@ -0,0 +1,150 @@
+import json
+import threading
+from functools import partial
+
+from ariadne import QueryType, make_executable_schema
+
+import pytest
+from asgiref.sync import sync_to_async
+from graphql.execution import MiddlewareManager
+
+from ariadne_django.execution import get_resolver_thread_pool, run_in_thread_pool
+from ariadne_django.tracing import QueryCountingExtension
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+from .models import Author
+
+
+type_defs = """
+    type Query {
+        authors: [String!]!
+        first: String!
+        second: String!
+        thread: String!
+        asyncThread: String!
+    }
+"""
+
+
+@pytest.fixture
+def threads_schema():
+    barrier = threading.Barrier(2, timeout=1)
+
+    def resolve_sibling(*_):
+        # Fails unless both sibling fields are resolved at the same time.
+        barrier.wait()
+        return "ok"
+
+    async def resolve_async_thread(*_):
+        return str(threading.get_ident())
+
+    query = QueryType()
+    query.set_field("authors", lambda *_: Author.objects.order_by("pk").values_list("name", flat=True))
+    query.set_field("first", resolve_sibling)
+    query.set_field("second", resolve_sibling)
+    query.set_field("thread", lambda *_: str(threading.get_ident()))
+    query.set_field("asyncThread", resolve_async_thread)
+    return make_executable_schema(type_defs, query)
+
+
+async def execute_query(view, request_factory, query):
+    response = await view(request_factory.post("/graphql/", data={"query": query}, content_type="application/json"))
+    return json.loads(response.content)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_sync_resolvers_using_orm_fail_in_event_loop(threads_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=threads_schema)
+    result = await execute_query(view, request_factory, "{ authors }")
+    assert "async context" in result["errors"][0]["message"]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_sync_resolvers_using_orm_are_run_in_thread_pool(threads_schema, request_factory):
+    await sync_to_async(Author.objects.create)(name="Author")
+    view = GraphQLAsyncView.as_view(schema=threads_schema, run_sync_resolvers_in_threads=True)
+    result = await execute_query(view, request_factory, "{ authors }")
+    assert result == {"data": {"authors": ["Author"]}}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_sibling_fields_are_resolved_concurrently(threads_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=threads_schema, run_sync_resolvers_in_threads=True)
+    result = await execute_query(view, request_factory, "{ first second }")
+    assert result == {"data": {"first": "ok", "second": "ok"}}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_async_resolvers_are_run_in_event_loop(threads_schema, request_factory):
+    view = GraphQLAsyncView.as_view(schema=threads_schema, run_sync_resolvers_in_threads=True)
+    result = await execute_query(view, request_factory, "{ thread asyncThread }")
+    assert result["data"]["asyncThread"] == str(threading.get_ident())
+    assert result["data"]["thread"] != str(threading.get_ident())
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_thread_pool_runs_middleware_with_resolvers(threads_schema, request_factory):
+    threads = []
+
+    def record_thread(next_, obj, info, **kwargs):
+        threads.append(str(threading.get_ident()))
+        return next_(obj, info, **kwargs)
+
+    view = GraphQLAsyncView.as_view(
+        schema=threads_schema, run_sync_resolvers_in_threads=True, middleware=MiddlewareManager(record_thread)
+    )
+    result = await execute_query(view, request_factory, "{ thread }")
+    assert threads == [result["data"]["thread"]]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_thread_pool_counts_queries_of_resolvers(threads_schema, request_factory):
+    await sync_to_async(Author.objects.create)(name="Author")
+    view = GraphQLAsyncView.as_view(
+        schema=threads_schema,
+        run_sync_resolvers_in_threads=True,
+        extensions=[partial(QueryCountingExtension, report=True)],
+    )
+    result = await execute_query(view, request_factory, "{ authors }")
+    assert result["extensions"]["sqlQueries"]["resolvers"][0]["path"] == "authors"
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_marked_resolvers_are_run_in_thread_pool(threads_schema, request_factory):
+    await sync_to_async(Author.objects.create)(name="Author")
+    authors_field = threads_schema.query_type.fields["authors"]
+    authors_field.resolve = run_in_thread_pool(authors_field.resolve)
+    view = GraphQLAsyncView.as_view(schema=threads_schema)
+    result = await execute_query(view, request_factory, "{ authors }")
+    assert result == {"data": {"authors": ["Author"]}}
+
+
+@pytest.mark.django_db
+def test_marked_resolvers_are_called_directly_without_event_loop(threads_schema, request_factory):
+    Author.objects.create(name="Author")
+    thread_field = threads_schema.query_type.fields["thread"]
+    thread_field.resolve = run_in_thread_pool(thread_field.resolve)
+    view = GraphQLView.as_view(schema=threads_schema)
+    response = view(request_factory.post("/graphql/", data={"query": "{ thread }"}, content_type="application/json"))
+    assert json.loads(response.content) == {"data": {"thread": str(threading.get_ident())}}
+
+
+def test_thread_pool_size_is_configured_in_settings(settings):
+    settings.ARIADNE_DJANGO_RESOLVER_THREADS = 3
+    assert get_resolver_thread_pool()._max_workers == 3  # pylint: disable=protected-access
+
+    settings.ARIADNE_DJANGO_RESOLVER_THREADS = 1
+    assert get_resolver_thread_pool()._max_workers == 1  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_marked_resolver_is_awaitable_in_event_loop():
+    resolver = run_in_thread_pool(lambda *_: str(threading.get_ident()))
+    assert await resolver(None, None) != str(threading.get_ident())
@@ -0,0 +1,148 @@
+import asyncio
+from functools import partial
+from types import SimpleNamespace
+
+from ariadne import QueryType, make_executable_schema
+
+import pytest
+
+from ariadne_django.tracing import MetricsRegistry, MetricsView, TracingExtension
+from ariadne_django.tracing.metrics import Histogram
+from ariadne_django.views import GraphQLAsyncView, GraphQLView
+
+
+@pytest.fixture
+def tracing_schema():
+    query = QueryType()
+    query.set_field("hello", lambda *_: "Hello!")
+
+    @query.field("slow")
+    async def resolve_slow(*_):
+        await asyncio.sleep(0)
+        return "Slow!"
+
+    @query.field("fail")
+    def resolve_fail(*_):
+        raise ValueError("Failed")
+
+    return make_executable_schema("type Query { hello: String slow: String fail: String name: String }", query)
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry(max_operations=2)
+
+
+def execute_query(view, request_factory, query, operation_name=None):
+    data = {"query": query}
+    if operation_name:
+        data["operationName"] = operation_name
+    return view(request_factory.post("/graphql/", data=data, content_type="application/json"))
+
+
+def test_histogram_counts_values_in_cumulative_buckets():
+    histogram = Histogram("duration_seconds", "Duration.", ("name",), buckets=(0.1, 1))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5, "a")
+
+    assert histogram.get_count("a") == 3
+    assert histogram.get_sum("a") == 5.55
+    assert histogram.render() == [
+        "# HELP duration_seconds Duration.",
+        "# TYPE duration_seconds histogram",
+        'duration_seconds_bucket{name="a",le="0.1"} 1',
+        'duration_seconds_bucket{name="a",le="1"} 2',
+        'duration_seconds_bucket{name="a",le="+Inf"} 3',
+        'duration_seconds_sum{name="a"} 5.55',
+        'duration_seconds_count{name="a"} 3',
+    ]
+
+
+def test_label_values_are_escaped():
+    histogram = Histogram("duration_seconds", "Duration.", ("name",), buckets=())
+    histogram.observe(1, 'a "quoted"\nname')
+    assert 'duration_seconds_count{name="a \\"quoted\\"\\nname"} 1' in histogram.render()
+
+
+def test_operation_phase_and_resolver_durations_are_recorded(tracing_schema, metrics, request_factory):
+    view = GraphQLView.as_view(schema=tracing_schema, extensions=[partial(TracingExtension, metrics=metrics)])
+    response = execute_query(view, request_factory, "query Greeting { hello name }")
+    assert response.status_code == 200
+
+    assert metrics.operation_duration.get_count("Greeting", "success") == 1
+    for phase in ("parsing", "validation", "execution"):
+        assert metrics.phase_duration.get_count("Greeting", phase) == 1
+    assert metrics.resolver_duration.get_count("Query.hello") == 1
+    # Default resolvers are not traced
+    assert metrics.resolver_duration.get_count("Query.name") == 0
+
+
+def test_errors_are_recorded_in_operation_status(tracing_schema, metrics, request_factory):
+    view = GraphQLView.as_view(schema=tracing_schema, extensions=[partial(TracingExtension, metrics=metrics)])
+    execute_query(view, request_factory, "{ fail }")
+    execute_query(view, request_factory, "{ unknown }")
+
+    assert metrics.operation_duration.get_count("anonymous", "error") == 1
+    assert metrics.resolver_duration.get_count("Query.fail") == 1
+    assert metrics.operation_duration.get_count("unknown", "error") == 1
+    assert metrics.phase_duration.get_count("unknown", "execution") == 0
+
+
+def test_resolvers_are_not_traced_in_requests_that_are_not_sampled(tracing_schema, metrics, request_factory):
+    view = GraphQLView.as_view(
+        schema=tracing_schema, extensions=[partial(TracingExtension, metrics=metrics, sample_rate=0)]
+    )
+    execute_query(view, request_factory, "{ hello }")
+
+    assert metrics.operation_duration.get_count("anonymous", "success") == 1
+    assert metrics.resolver_duration.get_count("Query.hello") == 0
+
+
+def test_distinct_operation_names_are_limited(tracing_schema, metrics, request_factory):
+    view = GraphQLView.as_view(schema=tracing_schema, extensions=[partial(TracingExtension, metrics=metrics)])
+    for name in ("A", "B", "C", "D"):
+        execute_query(view, request_factory, "query {} {{ hello }}".format(name))
+
+    assert metrics.operation_duration.get_count("A", "success") == 1
+    assert metrics.operation_duration.get_count("B", "success") == 1
+    assert metrics.operation_duration.get_count("other", "success") == 2
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_durations_are_recorded(tracing_schema, metrics, request_factory):
+    view = GraphQLAsyncView.as_view(schema=tracing_schema, extensions=[partial(TracingExtension, metrics=metrics)])
+    response = await execute_query(view, request_factory, "{ hello slow }")
+    assert response.status_code == 200
+
+    assert metrics.operation_duration.get_count("anonymous", "success") == 1
+    assert metrics.resolver_duration.get_count("Query.hello") == 1
+    assert metrics.resolver_duration.get_count("Query.slow") == 1
+
+
+def test_metrics_view_renders_prometheus_text_format(tracing_schema, metrics, request_factory):
+    view = GraphQLView.as_view(schema=tracing_schema, extensions=[partial(TracingExtension, metrics=metrics)])
+    execute_query(view, request_factory, "query Greeting { hello }")
+
+    request = request_factory.get("/metrics/")
+    request.user = SimpleNamespace(is_staff=True)
+    response = MetricsView.as_view(metrics=metrics)(request)
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/plain; version=0.0.4; charset=utf-8"
+    content = response.content.decode()
+    assert "# TYPE graphql_operation_duration_seconds histogram" in content
+    assert 'graphql_operation_duration_seconds_count{operation="Greeting",status="success"} 1' in content
+    assert 'graphql_phase_duration_seconds_count{operation="Greeting",phase="execution"} 1' in content
+    assert 'graphql_resolver_duration_seconds_count{field="Query.hello"} 1' in content
+
+
+def test_metrics_view_is_forbidden_for_non_staff_users(metrics, request_factory):
+    request = request_factory.get("/metrics/")
+    request.user = SimpleNamespace(is_staff=False)
+    assert MetricsView.as_view(metrics=metrics)(request).status_code == 403
+    assert MetricsView.as_view(metrics=metrics)(request_factory.get("/metrics/")).status_code == 403
+
+
+def test_metrics_view_access_is_opt_in_without_staff_only(metrics, request_factory):
+    response = MetricsView.as_view(metrics=metrics, staff_only=False)(request_factory.get("/metrics/"))
+    assert response.status_code == 200